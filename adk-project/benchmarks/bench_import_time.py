@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+Import Time Budget
+
+Measures the cold start of the debate_agents package and of the lightweight
+CLI paths in fresh interpreters, and fails when any of them exceeds its budget
+over bare interpreter startup. Lightweight paths must also not load the
+Watson Orchestrate SDK or NumPy.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_PATH = Path(__file__).resolve().parent.parent
+DEBATE_AGENTS_PATH = PROJECT_PATH / "debate_agents"
+
+HEAVY_MODULES = ("ibm_watsonx_orchestrate", "numpy", "yaml")
+
+# name -> (argv after the interpreter, working directory, whether heavy modules are checked)
+CASES = {
+    "import debate_agents": (["-c", "import debate_agents"], PROJECT_PATH, True),
+    "import debate_agents.config_service": (["-c", "import debate_agents.config_service"], PROJECT_PATH, True),
+    "get_registry()": (
+        ["-c", "from debate_agents.flow_registry import get_registry; get_registry()"], PROJECT_PATH, True
+    ),
+    "debate_system_manager.py list-formats": (["debate_system_manager.py", "list-formats"], DEBATE_AGENTS_PATH, False),
+}
+
+
+def time_command(argv, cwd, repeat):
+    """Best wall-clock seconds of running a command in a fresh interpreter."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + argv, cwd=cwd, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def loaded_heavy_modules(argv, cwd):
+    """Heavy modules present in sys.modules after running a -c snippet."""
+    code = argv[1] + f"; import sys; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=cwd, check=True,
+                            capture_output=True, text=True)
+    return [m for m in result.stdout.strip().split(",") if m]
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Check the cold-start import time budget")
+    parser.add_argument("--budget-ms", type=float, default=50.0,
+                        help="Allowed milliseconds over bare interpreter startup for each case")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case; the fastest one counts")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    interpreter = time_command(["-c", "pass"], PROJECT_PATH, args.repeat)
+    results = {}
+    failures = []
+    for name, (argv, cwd, check_modules) in CASES.items():
+        seconds = time_command(argv, cwd, args.repeat)
+        heavy = loaded_heavy_modules(argv, cwd) if check_modules else []
+        over_ms = (seconds - interpreter) * 1000
+        results[name] = {"total_ms": seconds * 1000, "over_interpreter_ms": over_ms, "heavy_modules": heavy}
+        if over_ms > args.budget_ms:
+            failures.append(f"{name}: {over_ms:.1f} ms over interpreter startup (budget {args.budget_ms:.0f} ms)")
+        if heavy:
+            failures.append(f"{name}: loads {', '.join(heavy)}")
+
+    if args.json:
+        print(json.dumps({"interpreter_ms": interpreter * 1000, "results": results}, indent=2))
+    else:
+        print(f"{'interpreter startup':<44}{interpreter * 1000:>9.1f} ms")
+        for name, result in results.items():
+            print(f"{name:<44}{result['total_ms']:>9.1f} ms{result['over_interpreter_ms']:>+9.1f} ms")
+
+    if failures:
+        print("\nImport time budget exceeded:", file=sys.stderr)
+        for failure in failures:
+            print(f"  {failure}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""
+Session Manager Benchmark
+
+Measures the memory used per tracked debate session and the rate of phase
+transitions, for single advances and for bulk advances of a whole phase.
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_PATH))
+
+from debate_agents.session_manager import SessionManager
+
+
+def create_sessions(manager, count, flow_name):
+    """Create count sessions with realistic participants."""
+    participants = ["ProgressivePerspectiveAgent", "ConservativePerspectiveAgent"]
+    for i in range(count):
+        manager.create(f"debate-{i}", flow_name, "Digital Inclusion", "ModeratorAgent", participants)
+
+
+def run(count, flow_name):
+    """Run the benchmark and return its measurements."""
+    # Constructing the manager compiles the flow registry outside the measurement
+    manager = SessionManager()
+
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    create_sessions(manager, count, flow_name)
+    create_seconds = time.perf_counter() - start
+    allocated = sum(
+        stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(baseline, "filename")
+    )
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for i in range(count):
+        manager.advance(f"debate-{i}")
+    single_seconds = time.perf_counter() - start
+
+    phase = manager.get("debate-0").phase["name"]
+    start = time.perf_counter()
+    advanced = manager.advance_all(phase)
+    bulk_seconds = time.perf_counter() - start
+
+    return {
+        "sessions": count,
+        "flow": flow_name,
+        "bytes_per_session": allocated / count,
+        "creates_per_second": count / create_seconds,
+        "single_transitions_per_second": count / single_seconds,
+        "bulk_transitions_per_second": advanced / bulk_seconds if bulk_seconds else None
+    }
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark the debate session manager")
+    parser.add_argument("--sessions", type=int, default=10000, help="Number of concurrent sessions")
+    parser.add_argument("--flow", default="structured", help="Debate format used by every session")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.sessions, args.flow)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"Sessions:                 {results['sessions']} ({results['flow']})")
+    print(f"Memory per session:       {results['bytes_per_session']:.0f} bytes")
+    print(f"Creates/sec:              {results['creates_per_second']:,.0f}")
+    print(f"Single transitions/sec:   {results['single_transitions_per_second']:,.0f}")
+    print(f"Bulk transitions/sec:     {results['bulk_transitions_per_second']:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
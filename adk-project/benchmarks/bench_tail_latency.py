@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""
+Tail Latency Benchmark
+
+Sends rounds of concurrent requests through the LLM client to a fake backend
+where a share of the requests stall, with and without hedging, and reports the
+latency percentiles seen by callers.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+PROJECT_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_PATH))
+
+from debate_agents.llm_client import FakeBackend, LLMClient
+
+
+def stalling_latency(latency, stall, every):
+    """Latency function where every nth request takes stall seconds."""
+    calls = [0]
+
+    def latency_of(prompt):
+        calls[0] += 1
+        return stall if calls[0] % every == 0 else latency
+    return latency_of
+
+
+def run(requests, concurrency, latency, stall, every, hedge_percentile):
+    """Run the benchmark and return its measurements."""
+    backend = FakeBackend("fake", stalling_latency(latency, stall, every))
+    client = LLMClient({"fake": backend}, "fake", coalesce=False, hedge_percentile=hedge_percentile)
+    latencies = []
+
+    async def one(i):
+        start = time.perf_counter()
+        await client.generate(f"Task: request {i}")
+        latencies.append(time.perf_counter() - start)
+
+    async def rounds():
+        for first in range(0, requests, concurrency):
+            await asyncio.gather(*(one(i) for i in range(first, min(first + concurrency, requests))))
+
+    try:
+        asyncio.run(rounds())
+        stats = client.stats()
+    finally:
+        client.close()
+
+    latencies.sort()
+    pick = lambda pct: latencies[min(len(latencies) - 1, int(pct / 100 * len(latencies)))]
+    return {
+        "hedge_percentile": hedge_percentile,
+        "p50_ms": pick(50) * 1000,
+        "p95_ms": pick(95) * 1000,
+        "p99_ms": pick(99) * 1000,
+        "max_ms": latencies[-1] * 1000,
+        "backend_requests": backend.requests,
+        "hedged": stats["hedged"],
+        "hedge_wins": stats["hedge_wins"]
+    }
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark hedged requests against a stalling backend")
+    parser.add_argument("--requests", type=int, default=400, help="Number of requests")
+    parser.add_argument("--concurrency", type=int, default=20, help="Requests sent together in each round")
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds a normal request takes")
+    parser.add_argument("--stall", type=float, default=1.0, help="Seconds a stalled request takes")
+    parser.add_argument("--every", type=int, default=20, help="Every nth request stalls")
+    parser.add_argument("--hedge-percentile", type=float, default=90, help="Percentile after which to hedge")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = [
+        run(args.requests, args.concurrency, args.latency, args.stall, args.every, hedge)
+        for hedge in (None, args.hedge_percentile)
+    ]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'hedging':<12}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}{'requests':>10}{'hedged':>8}")
+    for result in results:
+        label = f"p{result['hedge_percentile']:g}" if result["hedge_percentile"] is not None else "off"
+        print(f"{label:<12}{result['p50_ms']:>9.1f}{result['p95_ms']:>9.1f}{result['p99_ms']:>9.1f}"
+              f"{result['max_ms']:>9.1f}{result['backend_requests']:>10}{result['hedged']:>8}")
+
+
+if __name__ == "__main__":
+    main()
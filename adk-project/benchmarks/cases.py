@@ -0,0 +1,178 @@
+"""
+Benchmark Cases
+
+Hot paths called on every debate or conversation turn. Each case prepares its
+state once and returns a zero-argument callable that runs one operation.
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_PATH = Path(__file__).resolve().parent.parent
+VIEWPOINT_EXPLORER_PATH = PROJECT_PATH.parent / "orchestrate" / "agents" / "viewpoint_explorer_agent"
+sys.path.insert(0, str(PROJECT_PATH))
+sys.path.insert(0, str(VIEWPOINT_EXPLORER_PATH))
+
+BENCHMARKS = {}
+SCALING_BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Register a case in the micro-benchmark suite."""
+    def decorator(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+
+def scaling_benchmark(name):
+    """Register a case run at increasing corpus and session counts.
+
+    The setup function takes the size and returns the callable to time.
+    """
+    def decorator(setup):
+        SCALING_BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+
+@benchmark("get_debate_flow")
+def bench_get_debate_flow():
+    from debate_agents.debate_flow_patterns import get_debate_flow
+    return lambda: get_debate_flow("structured")
+
+
+@benchmark("DebateFlow.next_phase")
+def bench_next_phase():
+    from debate_agents.debate_flow_patterns import get_debate_flow
+    flow = get_debate_flow("roundtable")
+    flow.setup("Digital Inclusion", "ModeratorAgent", ["ProgressivePerspectiveAgent"])
+
+    def run():
+        flow.current_phase = 0
+        return flow.next_phase()
+    return run
+
+
+@benchmark("DebateFlow.current_phase_info")
+def bench_current_phase_info():
+    from debate_agents.debate_flow_patterns import get_debate_flow
+    flow = get_debate_flow("roundtable")
+    flow.setup("Digital Inclusion", "ModeratorAgent", ["ProgressivePerspectiveAgent"])
+    return flow.current_phase_info
+
+
+@benchmark("PromptEngine.build")
+def bench_prompt_build():
+    from debate_agents.debate_history import DebateHistory
+    from debate_agents.prompt_engine import PromptEngine
+    engine = PromptEngine()
+    history = DebateHistory()
+    for i in range(8):
+        history.record_turn("ConservativePerspectiveAgent", f"Point {i}. Markets close the gap faster than programs.")
+    return lambda: engine.build(
+        "ProgressivePerspectiveAgent", "Rebut the previous argument.", "Digital Inclusion", "rebuttal", history
+    )
+
+
+@benchmark("LLMClient.generate_sync[fake]")
+def bench_llm_generate_sync():
+    from debate_agents.llm_client import FakeBackend, LLMClient
+    client = LLMClient({"fake": FakeBackend()}, "fake")
+    return lambda: client.generate_sync("Task: Rebut the previous argument.")
+
+
+@benchmark("DebateKnowledgeBase.get_perspective")
+def bench_get_perspective():
+    from debate_agents.debate_knowledge import DebateKnowledgeBase
+    kb = DebateKnowledgeBase()
+    return lambda: kb.get_perspective("Artificial Intelligence Regulation", "Innovation-First Approach")
+
+
+@benchmark("ViewpointExplorerAgent.handoff_to_agent")
+def bench_handoff_to_agent():
+    from viewpoint_explorer_agent import ViewpointExplorerAgent
+    agent = ViewpointExplorerAgent({})
+    return lambda: agent.handoff_to_agent("I'd like to watch a debate between different perspectives")
+
+
+@benchmark("IntentRouter.route_batch[100]")
+def bench_route_batch():
+    from viewpoint_explorer_agent import ViewpointExplorerAgent
+    agent = ViewpointExplorerAgent({})
+    choices = ["option 2", "let them argue it out", "I'd like a podcst", "whiteboard session", "hello"] * 20
+    return lambda: agent.route_choices(choices)
+
+
+@benchmark("ViewpointExplorerAgent.introduce_topic")
+def bench_introduce_topic():
+    from viewpoint_explorer_agent import ViewpointExplorerAgent
+    agent = ViewpointExplorerAgent({})
+    return lambda: agent.introduce_topic("Digital Inclusion")
+
+
+@benchmark("ViewpointExplorerAgent._generate_followup_questions")
+def bench_followup_questions():
+    from viewpoint_explorer_agent import ViewpointExplorerAgent
+    agent = ViewpointExplorerAgent({})
+    return lambda: agent._generate_followup_questions("survival situation")
+
+
+def make_topics(count, perspectives=12):
+    """Generate synthetic topics in the SAMPLE_TOPICS shape."""
+    return [
+        {
+            "topic": f"Topic {i}",
+            "description": f"Debate number {i} on resource allocation and public policy",
+            "perspectives": [
+                {
+                    "position": f"Position {j}",
+                    "key_points": [f"Point {k} about policy {i} from position {j}" for k in range(3)]
+                }
+                for j in range(perspectives)
+            ]
+        }
+        for i in range(count)
+    ]
+
+
+@scaling_benchmark("DebateKnowledgeBase.get_perspective")
+def scale_get_perspective(size):
+    from debate_agents.debate_knowledge import DebateKnowledgeBase
+    kb = DebateKnowledgeBase(make_topics(size))
+    name = f"Topic {size // 2}"
+    return lambda: kb.get_perspective(name, "Position 7")
+
+
+@scaling_benchmark("DebateKnowledgeBase.search")
+def scale_search(size):
+    from debate_agents.debate_knowledge import DebateKnowledgeBase
+    kb = DebateKnowledgeBase(make_topics(size))
+    return lambda: kb.search(f"policy {size // 2} position 7", limit=5)
+
+
+@scaling_benchmark("SessionManager.advance")
+def scale_session_advance(size):
+    from debate_agents.session_manager import SessionManager
+    manager = SessionManager()
+    participants = ["A", "B"]
+    for i in range(size):
+        manager.create(f"debate-{i}", "structured", "Digital Inclusion", "ModeratorAgent", participants)
+    session_id = f"debate-{size // 2}"
+
+    def run():
+        # Restart the debate once it completes, so every call is a transition
+        if manager.advance(session_id)["status"] == "complete":
+            manager.remove(session_id)
+            manager.create(session_id, "structured", "Digital Inclusion", "ModeratorAgent", participants)
+    return run
+
+
+@scaling_benchmark("SessionManager.get")
+def scale_session_get(size):
+    from debate_agents.session_manager import SessionManager
+    manager = SessionManager()
+    for i in range(size):
+        manager.create(f"debate-{i}", "structured", "Digital Inclusion", "ModeratorAgent", ["A", "B"])
+    session_id = f"debate-{size // 2}"
+    return lambda: manager.get(session_id)
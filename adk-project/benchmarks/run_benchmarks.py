@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+"""
+Micro-Benchmark Runner
+
+Runs the hot-path benchmark cases, reporting operations per second and memory
+allocated per call, and compares the results with a saved baseline.
+
+Examples:
+    python run_benchmarks.py --save-baseline baseline.json
+    python run_benchmarks.py --baseline baseline.json --max-slowdown 0.25
+    python run_benchmarks.py --scaling --sizes 1 10 100 1000 10000
+"""
+
+import argparse
+import fnmatch
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+
+from cases import BENCHMARKS, SCALING_BENCHMARKS
+
+
+def measure(func, repeat=5, min_time=0.2):
+    """Measure a zero-argument callable.
+
+    Args:
+        func (callable): The operation to measure.
+        repeat (int): Number of timing runs; the fastest one is reported.
+        min_time (float): Minimum seconds per timing run.
+
+    Returns:
+        dict: Operations per second, and the bytes allocated and memory blocks
+        retained per call.
+    """
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    number = max(number, int(number * min_time / elapsed)) if elapsed else number
+    best = min(timer.repeat(repeat=repeat, number=number))
+
+    # Memory is measured separately so tracing does not slow down the timings.
+    # The traced peak of a single call is the memory it allocates at most;
+    # allocated blocks still alive after many calls show what calls retain.
+    ops_per_sec = number / best
+    calls = min(1000, max(10, int(ops_per_sec)))
+    tracemalloc.start()
+    func()
+    peaks = []
+    for _ in range(10):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        func()
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    tracemalloc.stop()
+
+    blocks_before = sys.getallocatedblocks()
+    for _ in range(calls):
+        func()
+    blocks_after = sys.getallocatedblocks()
+
+    return {
+        "ops_per_sec": ops_per_sec,
+        "peak_bytes_per_call": sorted(peaks)[len(peaks) // 2],
+        "retained_blocks_per_call": (blocks_after - blocks_before) / calls
+    }
+
+
+def prepare(name, setup, *args):
+    """Run a case's setup, reporting the case as skipped if it fails.
+
+    A case whose dependencies are missing here (the ADK SDK, a model file)
+    must not stop the rest of the suite from running.
+
+    Returns:
+        callable: The operation to measure, or None if the case is skipped.
+    """
+    try:
+        return setup(*args)
+    except Exception as e:
+        print(f"{name:<56}{'skipped':>14}  {type(e).__name__}: {e}")
+        return None
+
+
+def run_suite(pattern):
+    """Run the registered micro-benchmarks whose names match a glob pattern."""
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if not fnmatch.fnmatch(name, pattern):
+            continue
+        func = prepare(name, setup)
+        if func is not None:
+            results[name] = measure(func)
+            print_result(name, results[name])
+    return results
+
+
+def run_scaling(pattern, sizes):
+    """Run the scaling benchmarks at each size."""
+    results = {}
+    for name, setup in SCALING_BENCHMARKS.items():
+        if not fnmatch.fnmatch(name, pattern):
+            continue
+        for size in sizes:
+            key = f"{name}[{size}]"
+            func = prepare(key, setup, size)
+            if func is not None:
+                results[key] = measure(func, repeat=3, min_time=0.1)
+                print_result(key, results[key])
+    return results
+
+
+def print_result(name, result):
+    print(f"{name:<56}{result['ops_per_sec']:>14,.0f} ops/s"
+          f"{result['peak_bytes_per_call']:>10,.0f} B peak"
+          f"{result['retained_blocks_per_call']:>8.2f} blk/call")
+
+
+def compare(results, baseline, max_slowdown):
+    """Compare results with a baseline.
+
+    Returns:
+        list: Names of the benchmarks slower than the baseline by more than
+        max_slowdown (a fraction, e.g. 0.2 for 20%).
+    """
+    regressions = []
+    print(f"\n{'benchmark':<56}{'baseline':>14}{'current':>14}{'change':>9}")
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["ops_per_sec"]
+        change = result["ops_per_sec"] / before - 1
+        flag = ""
+        if change < -max_slowdown:
+            regressions.append(name)
+            flag = "  SLOWER"
+        print(f"{name:<56}{before:>14,.0f}{result['ops_per_sec']:>14,.0f}{change:>+9.1%}{flag}")
+    return regressions
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Run the hot-path micro-benchmarks")
+    parser.add_argument("--filter", default="*", help="Glob pattern selecting benchmarks by name")
+    parser.add_argument("--scaling", action="store_true", help="Run the scaling benchmarks instead")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000, 10000],
+                        help="Topic and session counts for the scaling benchmarks")
+    parser.add_argument("--save-baseline", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="Compare the results with this JSON file")
+    parser.add_argument("--max-slowdown", type=float, default=0.2,
+                        help="Fail when a benchmark is slower than the baseline by more than this fraction")
+    args = parser.parse_args()
+
+    if args.scaling:
+        results = run_scaling(args.filter, args.sizes)
+    else:
+        results = run_suite(args.filter)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": results
+            }, f, indent=2)
+        print(f"\nBaseline written to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.max_slowdown)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) slower than the baseline by more than {args.max_slowdown:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
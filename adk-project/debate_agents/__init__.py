@@ -3,10 +3,33 @@ Debate Agents Package
 
 This package contains components for building and deploying debate agents
 in the IBM Watson Orchestrate environment.
+
+The agent, flow and knowledge base classes depend on the Watson Orchestrate
+SDK, so they are imported on first access. Importing the package, or a
+lightweight module such as config_service, does not load the SDK.
 """
 
-from .debate_agent import DebateAgent
-from .debate_flow import DebateFlow
-from .debate_knowledge import DebateKnowledgeBase
+import importlib
+
+# Public attribute -> submodule that defines it
+_LAZY_ATTRIBUTES = {
+    'DebateAgent': '.debate_agent',
+    'DebateFlow': '.debate_flow',
+    'DebateKnowledgeBase': '.debate_knowledge',
+}
 
 __all__ = ['DebateAgent', 'DebateFlow', 'DebateKnowledgeBase']
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache the attribute so later lookups skip this function
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
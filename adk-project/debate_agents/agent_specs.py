@@ -0,0 +1,377 @@
+"""
+Agent Specs Module
+
+Compiles every agent YAML in the repository into one validated, versioned
+bundle. The bundle is plain JSON, read in one go without the YAML parser. Its
+strings are interned on load, so prompts repeated across specs are held once,
+and each spec carries a precomputed prompt token count. The bundle records a
+hash of every source file and is rebuilt when any of them changes; a
+background thread checks the sources of the process-wide bundle, so lookups
+never touch the file system.
+
+Usage:
+    python -m debate_agents.agent_specs build
+    python -m debate_agents.agent_specs list
+    python -m debate_agents.agent_specs check
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
+
+from .config_service import freeze
+from .debate_history import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_VERSION = 1
+
+PROJECT_PATH = Path(__file__).resolve().parent.parent
+REPO_ROOT = PROJECT_PATH.parent
+DEFAULT_BUNDLE_PATH = PROJECT_PATH / ".agent_spec_bundle.json"
+
+# Glob patterns, relative to the repository root, of the agent definitions
+SOURCE_PATTERNS = (
+    "adk-project/agents/*.yaml",
+    "adk-project/debate_agents/*.yaml",
+    "orchestrate/agents/**/*.yaml",
+)
+
+# Spec fields whose text is sent to the model as instructions
+PROMPT_FIELDS = ("system", "instructions")
+
+# Seconds between background checks of the sources of the process-wide bundle
+BUNDLE_CHECK_INTERVAL = 1.0
+
+AgentSpec = namedtuple("AgentSpec", ["name", "source", "hash", "prompt_tokens", "spec"])
+
+
+class AgentSpecError(ValueError):
+    """An agent definition is invalid or the bundle cannot be loaded."""
+
+
+def discover_sources(root=REPO_ROOT):
+    """Find the agent definition files.
+
+    Returns:
+        list: Paths relative to root, with forward slashes, in sorted order.
+    """
+    root = Path(root)
+    found = set()
+    for pattern in SOURCE_PATTERNS:
+        found.update(path.relative_to(root).as_posix() for path in root.glob(pattern))
+    return sorted(found)
+
+
+def _source_signature(path, data=None):
+    stat = os.stat(path)
+    if data is None:
+        with open(path, 'rb') as f:
+            data = f.read()
+    return {"sha256": hashlib.sha256(data).hexdigest(), "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def validate_spec(spec, source):
+    """Check the fields every agent definition needs.
+
+    Raises:
+        AgentSpecError: If a field is missing or has the wrong type.
+    """
+    if not isinstance(spec, dict):
+        raise AgentSpecError(f"{source}: expected a mapping at the top level")
+    for key in ("name", "description"):
+        if not isinstance(spec.get(key), str):
+            raise AgentSpecError(f"{source}: '{key}' must be a string")
+    for key in PROMPT_FIELDS:
+        if key in spec and not isinstance(spec[key], str):
+            raise AgentSpecError(f"{source}: '{key}' must be a string")
+    if "tools" in spec and not isinstance(spec["tools"], list):
+        raise AgentSpecError(f"{source}: 'tools' must be a list")
+    if "persona" in spec and not isinstance(spec["persona"], dict):
+        raise AgentSpecError(f"{source}: 'persona' must be a mapping")
+
+
+def compile_bundle(root=REPO_ROOT):
+    """Parse and validate every agent definition into bundle data.
+
+    Args:
+        root (Path): The repository root.
+
+    Returns:
+        dict: The JSON-serializable bundle.
+    """
+    import yaml
+
+    root = Path(root)
+    sources, specs = {}, []
+    for source in discover_sources(root):
+        path = root / source
+        with open(path, 'rb') as f:
+            data = f.read()
+        sources[source] = _source_signature(path, data)
+        try:
+            spec = yaml.safe_load(data)
+        except yaml.YAMLError as e:
+            raise AgentSpecError(f"{source}: {e}") from e
+        validate_spec(spec, source)
+
+        canonical = json.dumps(spec, sort_keys=True, separators=(",", ":"), default=str)
+        specs.append({
+            "source": source,
+            "hash": hashlib.sha256(canonical.encode("utf-8")).hexdigest(),
+            "prompt_tokens": sum(estimate_tokens(spec.get(key) or "") for key in PROMPT_FIELDS),
+            "spec": json.loads(canonical)
+        })
+    return {"bundle_version": BUNDLE_VERSION, "sources": sources, "specs": specs}
+
+
+def write_bundle(data, path=DEFAULT_BUNDLE_PATH):
+    """Write bundle data atomically.
+
+    Each writer uses its own temporary file, so workers that rebuild the
+    bundle at the same time never write into each other's file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def stale_sources(data, root=REPO_ROOT):
+    """Find the sources that were added, removed or changed since a bundle was built.
+
+    A source whose modification time and size still match is trusted without
+    reading it; otherwise its content hash decides.
+
+    Returns:
+        list: Relative paths of the changed sources.
+    """
+    root = Path(root)
+    recorded = data.get("sources", {})
+    current = discover_sources(root)
+    stale = sorted(set(recorded).symmetric_difference(current))
+    for source in current:
+        signature = recorded.get(source)
+        if signature is None:
+            continue
+        stat = os.stat(root / source)
+        if (stat.st_mtime_ns, stat.st_size) == (signature["mtime_ns"], signature["size"]):
+            continue
+        if _source_signature(root / source)["sha256"] != signature["sha256"]:
+            stale.append(source)
+    return stale
+
+
+def _intern(value):
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return {sys.intern(key): _intern(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_intern(item) for item in value]
+    return value
+
+
+class AgentSpecBundle:
+    """Read-only lookup of compiled agent specs."""
+
+    def __init__(self, data):
+        """Initialize the bundle.
+
+        Args:
+            data (dict): Bundle data from compile_bundle or a bundle file.
+        """
+        self.sources = data["sources"]
+        # Identifies the source files the bundle was compiled from
+        self.source_hash = hashlib.sha256(json.dumps(
+            sorted((source, signature["sha256"]) for source, signature in self.sources.items())
+        ).encode("utf-8")).hexdigest()
+        self.specs = tuple(
+            AgentSpec(
+                sys.intern(entry["spec"]["name"]), entry["source"], entry["hash"],
+                entry["prompt_tokens"], freeze(_intern(entry["spec"]))
+            )
+            for entry in data["specs"]
+        )
+        self._by_source = {spec.source: spec for spec in self.specs}
+        # Names are looked up among this project's definitions; other
+        # projects in the repository are reached through by_source
+        project = PROJECT_PATH.name + "/"
+        definitions = {}
+        for spec in self.specs:
+            if spec.source.startswith(project):
+                definitions.setdefault(spec.name, []).append(spec)
+        self._by_name = {}
+        # name -> sources of an agent defined differently in several files
+        self._conflicts = {}
+        for name, specs in definitions.items():
+            if len(set(spec.hash for spec in specs)) > 1:
+                self._conflicts[name] = [spec.source for spec in specs]
+            else:
+                self._by_name[name] = specs[0]
+
+    def get(self, name):
+        """Get the spec of one of this project's agents by name, or None.
+
+        Copies of the same definition in several files are one agent.
+
+        Raises:
+            AgentSpecError: If files of this project define the name differently.
+        """
+        spec = self._by_name.get(name)
+        if spec is None and name in self._conflicts:
+            raise AgentSpecError(
+                f"Agent '{name}' is defined differently in {', '.join(self._conflicts[name])}; "
+                "look it up by source"
+            )
+        return spec
+
+    def by_source(self, path, root=REPO_ROOT):
+        """Get the spec compiled from a file, given its absolute or root-relative path."""
+        path = Path(path)
+        if path.is_absolute():
+            path = path.resolve().relative_to(Path(root).resolve())
+        return self._by_source.get(path.as_posix())
+
+    def names(self):
+        """Get the distinct agent names of every project."""
+        return list(dict.fromkeys(spec.name for spec in self.specs))
+
+    def __len__(self):
+        return len(self.specs)
+
+
+def load_bundle(path=DEFAULT_BUNDLE_PATH, root=REPO_ROOT, check_sources=True, rebuild=True):
+    """Load the agent spec bundle, rebuilding it if it is missing or stale.
+
+    Args:
+        path (Path): The bundle file.
+        root (Path): The repository root the sources are relative to.
+        check_sources (bool): Compare the recorded source hashes with the files.
+            Workers that deploy a known bundle can skip this.
+        rebuild (bool): Compile and write a new bundle when needed, instead of
+            raising AgentSpecError. If the bundle file cannot be written, as in
+            a read-only deployment, the compiled bundle is used from memory.
+
+    Returns:
+        AgentSpecBundle: The loaded bundle.
+    """
+    data = None
+    try:
+        with open(path, 'r') as f:
+            data = json.loads(f.read())
+        if data.get("bundle_version") != BUNDLE_VERSION:
+            data = None
+    except (OSError, ValueError):
+        data = None
+
+    if data is not None and check_sources and stale_sources(data, root):
+        data = None
+
+    if data is None:
+        if not rebuild:
+            raise AgentSpecError(f"Agent spec bundle {path} is missing or out of date")
+        data = compile_bundle(root)
+        try:
+            write_bundle(data, path)
+        except OSError as e:
+            logger.warning("Using the agent spec bundle from memory, cannot write %s: %s", path, e)
+    return AgentSpecBundle(data)
+
+
+_bundle = None
+_bundle_lock = threading.Lock()
+
+
+def check_bundle():
+    """Reload the process-wide bundle if one of its sources has changed.
+
+    Returns:
+        bool: True if the bundle was reloaded.
+    """
+    global _bundle
+    bundle = _bundle
+    if bundle is None or not stale_sources({"sources": bundle.sources}):
+        return False
+    _bundle = load_bundle()
+    return True
+
+
+def _watch_bundle(interval):
+    while True:
+        time.sleep(interval)
+        try:
+            check_bundle()
+        except (AgentSpecError, OSError) as e:
+            logger.warning("Keeping the previous agent spec bundle: %s", e)
+
+
+def get_bundle(check_interval=BUNDLE_CHECK_INTERVAL):
+    """Get the process-wide bundle, loading it on first use.
+
+    A background thread reloads the bundle when one of its sources changes,
+    checking every check_interval seconds, so getting the bundle never
+    touches the file system. Callers caching anything derived from it
+    compare its source_hash.
+
+    Args:
+        check_interval (float, optional): Seconds between checks of the
+            sources. None leaves reloading to explicit check_bundle calls.
+    """
+    global _bundle
+    if _bundle is None:
+        with _bundle_lock:
+            if _bundle is None:
+                _bundle = load_bundle()
+                if check_interval is not None:
+                    threading.Thread(
+                        target=_watch_bundle, args=(check_interval,), name="agent-spec-watcher", daemon=True
+                    ).start()
+    return _bundle
+
+
+def main():
+    """Build, list or check the agent spec bundle."""
+    parser = argparse.ArgumentParser(description="Compile the agent definitions into one bundle")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser("build", help="Compile the bundle")
+    subparsers.add_parser("list", help="List the specs in the bundle")
+    subparsers.add_parser("check", help="Exit non-zero if the bundle is out of date")
+    parser.add_argument("--bundle", default=str(DEFAULT_BUNDLE_PATH), help="Path of the bundle file")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        data = compile_bundle()
+        write_bundle(data, args.bundle)
+        print(f"Compiled {len(data['specs'])} agent specs into {args.bundle}")
+    elif args.command == "list":
+        bundle = load_bundle(args.bundle)
+        for spec in bundle.specs:
+            print(f"{spec.name:<32}{spec.prompt_tokens:>7} tokens  {spec.source}")
+    elif args.command == "check":
+        try:
+            with open(args.bundle, 'r') as f:
+                stale = stale_sources(json.load(f))
+        except (OSError, ValueError):
+            stale = ["(bundle missing or unreadable)"]
+        for source in stale:
+            print(f"Out of date: {source}")
+        sys.exit(1 if stale else 0)
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
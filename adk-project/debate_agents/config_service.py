@@ -0,0 +1,380 @@
+"""
+Config Service Module
+
+Parses and validates the debate system's JSON configuration files once per
+process into immutable typed objects. A file is parsed again only when its
+modification time or size changes, so long-running workers pick up edits
+without restarting and without reading JSON on every request.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import namedtuple
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SYSTEM_CONFIG_FILE = "debate_system_config.json"
+AGENT_CONFIG_FILE = "debate_agent_config.json"
+ADVANCED_CONFIG_FILE = "advanced_config.json"
+LLM_CONFIG_FILE = "llm_config.json"
+
+BACKEND_KINDS = ("http", "fake")
+
+AgentEntry = namedtuple("AgentEntry", ["name", "description", "style", "agent_file"])
+FormatEntry = namedtuple("FormatEntry", ["name", "description", "phases"])
+SystemConfig = namedtuple("SystemConfig", [
+    "system_name", "description", "version", "moderator", "perspectives",
+    "debate_formats", "topic_categories"
+])
+AgentConfig = namedtuple("AgentConfig", [
+    "name", "description", "system", "tools", "capabilities", "persona", "debate_format"
+])
+AdvancedConfig = namedtuple("AdvancedConfig", [
+    "name", "description", "capabilities", "persona", "debate_formats", "topic_areas", "skills"
+])
+BackendEntry = namedtuple("BackendEntry", [
+    "name", "kind", "base_url", "path", "api_key_env", "limit", "limit_per_host",
+    "keepalive_timeout", "timeout", "latency", "rate", "burst", "latency_target", "fallback", "fallback_model"
+])
+LLMConfig = namedtuple("LLMConfig", [
+    "default_backend", "max_tokens", "coalesce", "max_retries", "hedge", "hedge_percentile", "hedge_min_samples",
+    "hedge_min_delay", "hedge_budget", "breaker_failure_rate", "breaker_window", "breaker_open_seconds", "slow_call", "backends"
+])
+
+
+class ConfigError(ValueError):
+    """A configuration file is missing, malformed or fails validation."""
+
+
+def freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def _field(data, key, kind, where, default=None, required=True):
+    """Get a field of a JSON object, checking its type."""
+    if key not in data:
+        if required:
+            raise ConfigError(f"{where}: missing required field '{key}'")
+        return default
+    value = data[key]
+    if not isinstance(value, kind):
+        names = " or ".join(k.__name__ for k in (kind if isinstance(kind, tuple) else (kind,)))
+        raise ConfigError(f"{where}.{key}: expected {names}, got {type(value).__name__}")
+    return value
+
+
+def _strings(data, key, where, required=True):
+    values = _field(data, key, list, where, default=[], required=required)
+    for i, value in enumerate(values):
+        if not isinstance(value, str):
+            raise ConfigError(f"{where}.{key}[{i}]: expected str, got {type(value).__name__}")
+    return tuple(values)
+
+
+def _agent_entry(data, where):
+    if not isinstance(data, dict):
+        raise ConfigError(f"{where}: expected an object")
+    return AgentEntry(
+        _field(data, "name", str, where),
+        _field(data, "description", str, where),
+        _field(data, "style", str, where, default="default", required=False),
+        _field(data, "agent_file", str, where)
+    )
+
+
+def parse_system_config(data):
+    """Validate a parsed debate_system_config.json.
+
+    Args:
+        data (dict): The parsed JSON.
+
+    Returns:
+        SystemConfig: The validated configuration. Formats list their phases
+        from the optional "rounds" field.
+
+    Raises:
+        ConfigError: If a field is missing or has the wrong type.
+    """
+    where = SYSTEM_CONFIG_FILE
+    agents = _field(data, "agents", dict, where)
+    perspectives = _field(agents, "perspectives", list, f"{where}.agents")
+
+    formats = {}
+    for name, info in _field(data, "debate_formats", dict, where).items():
+        format_where = f"{where}.debate_formats.{name}"
+        if not isinstance(info, dict):
+            raise ConfigError(f"{format_where}: expected an object")
+        formats[name] = FormatEntry(
+            name,
+            _field(info, "description", str, format_where),
+            _strings(info, "rounds", format_where, required=False)
+        )
+
+    topics = _field(data, "topics", dict, where, default={}, required=False)
+    return SystemConfig(
+        _field(data, "system_name", str, where),
+        _field(data, "description", str, where),
+        _field(data, "version", str, where),
+        _agent_entry(_field(agents, "moderator", dict, f"{where}.agents"), f"{where}.agents.moderator"),
+        tuple(_agent_entry(p, f"{where}.agents.perspectives[{i}]") for i, p in enumerate(perspectives)),
+        MappingProxyType(formats),
+        _strings(topics, "categories", f"{where}.topics", required=False)
+    )
+
+
+def parse_agent_config(data):
+    """Validate a parsed debate_agent_config.json.
+
+    Args:
+        data (dict): The parsed JSON.
+
+    Returns:
+        AgentConfig: The validated configuration.
+
+    Raises:
+        ConfigError: If a field is missing or has the wrong type.
+    """
+    where = AGENT_CONFIG_FILE
+    return AgentConfig(
+        _field(data, "name", str, where),
+        _field(data, "description", str, where),
+        _field(data, "system", str, where, default="", required=False),
+        _strings(data, "tools", where, required=False),
+        _strings(data, "capabilities", where),
+        freeze(_field(data, "persona", dict, where)),
+        freeze(_field(data, "debate_format", dict, where))
+    )
+
+
+def parse_advanced_config(data):
+    """Validate a parsed advanced_config.json.
+
+    Args:
+        data (dict): The parsed JSON.
+
+    Returns:
+        AdvancedConfig: The validated configuration. Formats list their phases
+        in the "phases" field.
+
+    Raises:
+        ConfigError: If a field is missing or has the wrong type.
+    """
+    where = ADVANCED_CONFIG_FILE
+    formats = []
+    for i, info in enumerate(_field(data, "debate_formats", list, where, default=[], required=False)):
+        format_where = f"{where}.debate_formats[{i}]"
+        if not isinstance(info, dict):
+            raise ConfigError(f"{format_where}: expected an object")
+        formats.append(FormatEntry(
+            _field(info, "name", str, format_where),
+            _field(info, "description", str, format_where, required=False),
+            _strings(info, "phases", format_where, required=False)
+        ))
+
+    return AdvancedConfig(
+        _field(data, "name", str, where),
+        _field(data, "description", str, where),
+        _strings(data, "capabilities", where, required=False),
+        freeze(_field(data, "persona", dict, where, default={}, required=False)),
+        tuple(formats),
+        _strings(data, "topic_areas", where, required=False),
+        _strings(data, "skills", where, required=False)
+    )
+
+
+def parse_llm_config(data):
+    """Validate a parsed llm_config.json.
+
+    Args:
+        data (dict): The parsed JSON.
+
+    Returns:
+        LLMConfig: The validated configuration, with the backends keyed by name.
+        Backends without a "rate" are not rate limited.
+
+    Raises:
+        ConfigError: If a field is missing, has the wrong type, or the default
+            or a fallback backend is not defined.
+    """
+    where = LLM_CONFIG_FILE
+    backends = {}
+    for name, info in _field(data, "backends", dict, where).items():
+        backend_where = f"{where}.backends.{name}"
+        if not isinstance(info, dict):
+            raise ConfigError(f"{backend_where}: expected an object")
+        kind = _field(info, "kind", str, backend_where)
+        if kind not in BACKEND_KINDS:
+            raise ConfigError(f"{backend_where}.kind: expected one of {', '.join(BACKEND_KINDS)}, got '{kind}'")
+        limit = _field(info, "limit", int, backend_where, default=100, required=False)
+        backends[name] = BackendEntry(
+            name,
+            kind,
+            _field(info, "base_url", str, backend_where, required=kind == "http"),
+            _field(info, "path", str, backend_where, default="/v1/completions", required=False),
+            _field(info, "api_key_env", str, backend_where, required=False),
+            limit,
+            _field(info, "limit_per_host", int, backend_where, default=limit, required=False),
+            _field(info, "keepalive_timeout", (int, float), backend_where, default=60, required=False),
+            _field(info, "timeout", (int, float), backend_where, default=60, required=False),
+            _field(info, "latency", (int, float), backend_where, default=0, required=False),
+            _field(info, "rate", (int, float), backend_where, required=False),
+            _field(info, "burst", (int, float), backend_where, required=False),
+            _field(info, "latency_target", (int, float), backend_where, required=False),
+            _field(info, "fallback", str, backend_where, required=False),
+            _field(info, "fallback_model", str, backend_where, required=False)
+        )
+
+    for entry in backends.values():
+        if entry.fallback is not None and entry.fallback not in backends:
+            raise ConfigError(f"{where}.backends.{entry.name}.fallback: no backend named '{entry.fallback}'")
+
+    default_backend = _field(data, "default_backend", str, where)
+    if default_backend not in backends:
+        raise ConfigError(f"{where}.default_backend: no backend named '{default_backend}'")
+    return LLMConfig(
+        default_backend,
+        _field(data, "max_tokens", int, where, default=512, required=False),
+        _field(data, "coalesce", bool, where, default=True, required=False),
+        _field(data, "max_retries", int, where, default=2, required=False),
+        _field(data, "hedge", bool, where, default=True, required=False),
+        _field(data, "hedge_percentile", (int, float), where, default=95, required=False),
+        _field(data, "hedge_min_samples", int, where, default=20, required=False),
+        _field(data, "hedge_min_delay", (int, float), where, default=0.05, required=False),
+        _field(data, "hedge_budget", (int, float), where, default=0.1, required=False),
+        _field(data, "breaker_failure_rate", (int, float), where, default=0.5, required=False),
+        _field(data, "breaker_window", int, where, default=20, required=False),
+        _field(data, "breaker_open_seconds", (int, float), where, default=10, required=False),
+        _field(data, "slow_call", (int, float), where, required=False),
+        MappingProxyType(backends)
+    )
+
+
+PARSERS = {
+    SYSTEM_CONFIG_FILE: parse_system_config,
+    AGENT_CONFIG_FILE: parse_agent_config,
+    ADVANCED_CONFIG_FILE: parse_advanced_config,
+    LLM_CONFIG_FILE: parse_llm_config,
+}
+
+
+class ConfigService:
+    """Process-wide cache of validated configuration objects."""
+
+    def __init__(self, config_dir=CONFIG_DIR, check_interval=1.0, clock=time.monotonic):
+        """Initialize the service. Files are parsed on first use.
+
+        Args:
+            config_dir (str): Directory holding the configuration files.
+            check_interval (float): Minimum seconds between checks of a file's
+                modification time. Zero checks on every access.
+            clock (callable): Monotonic time source for the check interval.
+        """
+        self.config_dir = config_dir
+        self.check_interval = check_interval
+        self.clock = clock
+        self._lock = threading.Lock()
+        # filename -> (stat signature, config object, time of last check)
+        self._entries = {}
+
+    def _signature(self, path):
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            raise ConfigError(f"Cannot read {path}: {e}") from e
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self, filename, path):
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ConfigError(f"Cannot parse {path}: {e}") from e
+        if not isinstance(data, dict):
+            raise ConfigError(f"{filename}: expected a JSON object")
+        return PARSERS[filename](data)
+
+    def get(self, filename):
+        """Get the validated configuration of a file, reloading it if it changed.
+
+        A file that changes into an invalid configuration is reported and the
+        last valid configuration is kept.
+
+        Args:
+            filename (str): One of the files in PARSERS.
+
+        Returns:
+            namedtuple: The immutable configuration object.
+
+        Raises:
+            ConfigError: If the file has never been loaded successfully and
+                cannot be now.
+        """
+        now = self.clock()
+        entry = self._entries.get(filename)
+        if entry is not None and now - entry[2] < self.check_interval:
+            return entry[1]
+
+        with self._lock:
+            entry = self._entries.get(filename)
+            path = os.path.join(self.config_dir, filename)
+            signature = None
+            try:
+                signature = self._signature(path)
+                if entry is None or signature != entry[0]:
+                    config = self._load(filename, path)
+                    if entry is not None:
+                        logger.info("Reloaded %s", path)
+                    entry = (signature, config, now)
+                else:
+                    entry = (entry[0], entry[1], now)
+            except ConfigError as e:
+                if entry is None:
+                    raise
+                logger.warning("Keeping the previous %s: %s", filename, e)
+                # Remember the broken version, so it is reported only once
+                entry = (signature or entry[0], entry[1], now)
+            # Readers see either the old entry or the new one, never a mix
+            self._entries[filename] = entry
+            return entry[1]
+
+    def system_config(self):
+        """Get the validated debate_system_config.json."""
+        return self.get(SYSTEM_CONFIG_FILE)
+
+    def agent_config(self):
+        """Get the validated debate_agent_config.json."""
+        return self.get(AGENT_CONFIG_FILE)
+
+    def advanced_config(self):
+        """Get the validated advanced_config.json."""
+        return self.get(ADVANCED_CONFIG_FILE)
+
+    def llm_config(self):
+        """Get the validated llm_config.json."""
+        return self.get(LLM_CONFIG_FILE)
+
+    def debate_formats(self):
+        """Get the formats from the system and advanced configurations, in that order."""
+        return tuple(self.system_config().debate_formats.values()) + self.advanced_config().debate_formats
+
+
+_service = None
+
+
+def get_config_service():
+    """Get the process-wide config service, creating it on first use."""
+    global _service
+    if _service is None:
+        _service = ConfigService()
+    return _service
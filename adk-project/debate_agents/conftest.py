@@ -0,0 +1,32 @@
+"""Shared fixtures of the debate_agents tests."""
+
+import pytest
+
+
+class ManualClock:
+    """Monotonic clock that only moves when a test advances it."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return ManualClock()
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """Make the process-wide LLM client answer in-process with FakeBackend."""
+    from debate_agents import llm_client
+
+    client = llm_client.LLMClient({"fake": llm_client.FakeBackend()}, "fake")
+    monkeypatch.setattr(llm_client, "_client", client)
+    yield client
+    client.close()
@@ -0,0 +1,65 @@
+"""
+Conversation Scripts
+
+Scripted user conversations with the ViewpointExplorer agent, shared by the
+functional test script and the load tester.
+"""
+
+BASIC_MESSAGES = [
+    "Hello, I'd like to explore my views on climate change.",
+    "I think we need to take immediate action to reduce carbon emissions.",
+    "Scientific reports show rising global temperatures and extreme weather events.",
+    "Those who oppose climate action often cite economic concerns, but I believe the long-term costs of inaction are greater."
+]
+
+DEEPER_INITIAL_MESSAGES = [
+    "I want to discuss education reform.",
+    "I believe we need to focus more on critical thinking skills and less on standardized testing.",
+    "My evidence is that students in countries with less testing often show better problem-solving abilities.",
+    "Those who oppose this view often worry about accountability and measuring progress."
+]
+
+DEEPER_CHOICE = "I'd like to develop my perspective further with more detailed questions."
+
+DEEPER_RESPONSES = [
+    "I value creativity, critical thinking, and individual development over standardization.",
+    "As we learn more about different learning styles and personalized education, I think my view will evolve toward even more customized approaches.",
+    "I would reduce the frequency of standardized tests and give teachers more autonomy."
+]
+
+DEBATE_INITIAL_MESSAGES = [
+    "I want to discuss universal basic income.",
+    "I think it could help reduce poverty and provide economic security.",
+    "Pilot programs have shown positive outcomes in terms of health and education.",
+    "Critics worry about funding and potential reduction in work incentives."
+]
+
+DEBATE_CHOICE = "I'd like to see different perspectives debate this topic."
+
+WHITEBOARD_INITIAL_MESSAGES = [
+    "I want to discuss artificial intelligence ethics.",
+    "I believe we need strong regulations to ensure AI is developed responsibly.",
+    "We've already seen issues with bias in algorithms and privacy concerns.",
+    "Some argue that too much regulation could stifle innovation."
+]
+
+WHITEBOARD_CHOICE = "I'd like to engage in a whiteboard session to map out my viewpoint."
+
+
+def _steps(messages, handoff=None, after_handoff=()):
+    steps = [("first" if i == 0 else "turn", message) for i, message in enumerate(messages)]
+    if handoff:
+        steps.append(("handoff", handoff))
+    steps.extend(("turn", message) for message in after_handoff)
+    return steps
+
+
+# Each script is a list of (kind, message) steps. The kind is "first" for the
+# opening message, "handoff" for the message choosing an exploration path and
+# "turn" for every other message.
+CONVERSATION_SCRIPTS = {
+    "basic": _steps(BASIC_MESSAGES),
+    "deeper": _steps(DEEPER_INITIAL_MESSAGES, DEEPER_CHOICE, DEEPER_RESPONSES),
+    "debate": _steps(DEBATE_INITIAL_MESSAGES, DEBATE_CHOICE),
+    "whiteboard": _steps(WHITEBOARD_INITIAL_MESSAGES, WHITEBOARD_CHOICE),
+}
@@ -8,22 +8,30 @@ on various topics, presenting multiple viewpoints and supporting evidence.
 from ibm_watsonx_orchestrate.agent_builder import Agent
 from ibm_watsonx_orchestrate.agent_builder.tools import Tool
 from ibm_watsonx_orchestrate.agent_builder.models import Message, Response, FlowParameters
-import json
-import os
 
-# Load the configuration
-with open(os.path.join(os.path.dirname(__file__), 'debate_agent_config.json')) as f:
-    config = json.load(f)
+from .config_service import get_config_service
+from .generation import TurnRequest, agenerate_turn, astream_turn, generate_turn, stream_turn
+from .streaming import aiter_chunks, iter_chunks
 
 class DebateAgent(Agent):
     """Agent for facilitating structured debates on various topics."""
     
-    def __init__(self, name=config['name'], description=config['description']):
-        super().__init__(name=name, description=description)
-        self.capabilities = config['capabilities']
-        self.persona = config['persona']
-        self.debate_format = config['debate_format']
+    def __init__(self, name=None, description=None):
+        config = get_config_service().agent_config()
+        super().__init__(name=name or config.name, description=description or config.description)
+        self.capabilities = config.capabilities
+        self.persona = config.persona
+        self.debate_format = config.debate_format
         
+    def complete(self, task: str, topic: str = None, phase: str = None, history=None, fallback: str = None) -> str:
+        """Generate text for a task through the shared LLM client, or return the fallback if it fails."""
+        return generate_turn(self.name, TurnRequest(task, topic, phase, history, fallback))
+    
+    async def acomplete(self, task: str, topic: str = None, phase: str = None, history=None,
+                        fallback: str = None) -> str:
+        """Generate text for a task without blocking the event loop."""
+        return await agenerate_turn(self.name, TurnRequest(task, topic, phase, history, fallback))
+    
     def introduce_topic(self, topic: str) -> Response:
         """Introduce a new debate topic and provide context."""
         return Response(
@@ -32,34 +40,89 @@ class DebateAgent(Agent):
             "We'll explore multiple perspectives on this issue, supported by evidence and reasoning."
         )
     
-    def generate_opening_statement(self, position: str, topic: str) -> Response:
+    async def aintroduce_topic(self, topic: str) -> Response:
+        """Introduce a new debate topic; no model call is made."""
+        return self.introduce_topic(topic)
+    
+    def _generate_opening_statement_request(self, position: str, topic: str,
+                                            phase: str = "opening_statement") -> TurnRequest:
+        return TurnRequest(
+            f"Present a well-structured opening statement for the {position} position that presents the key points.",
+            topic, phase,
+            fallback=f"Opening statement for {position} position on {topic}."
+        )
+    
+    def generate_opening_statement(self, position: str, topic: str, phase: str = "opening_statement") -> Response:
         """Generate an opening statement for a given position on the topic."""
-        # This would call to a model to generate the content
-        return Response(
-            message=f"Opening statement for {position} position on {topic}: "
-            "This would be a well-structured opening argument that presents the key points."
+        return Response(message=self.complete(*self._generate_opening_statement_request(position, topic, phase)))
+    
+    async def agenerate_opening_statement(self, position: str, topic: str,
+                                          phase: str = "opening_statement") -> Response:
+        """Asynchronously generate an opening statement for a given position on the topic."""
+        return Response(message=await self.acomplete(*self._generate_opening_statement_request(position, topic, phase)))
+    
+    def _generate_rebuttal_request(self, original_argument: str, position: str,
+                                   phase: str = "rebuttals") -> TurnRequest:
+        return TurnRequest(
+            f"Rebut the following argument from the {position} position, addressing its points "
+            f"with counterpoints: {original_argument}",
+            phase=phase,
+            fallback=f"Rebuttal from {position} position."
         )
     
-    def generate_rebuttal(self, original_argument: str, position: str) -> Response:
+    def generate_rebuttal(self, original_argument: str, position: str, phase: str = "rebuttals") -> Response:
         """Generate a rebuttal to an argument from a specific position."""
-        # This would call to a model to generate the content
-        return Response(
-            message=f"Rebuttal from {position} position: "
-            "This would address the points raised in the original argument, providing counterpoints."
+        return Response(message=self.complete(*self._generate_rebuttal_request(original_argument, position, phase)))
+    
+    async def agenerate_rebuttal(self, original_argument: str, position: str, phase: str = "rebuttals") -> Response:
+        """Asynchronously generate a rebuttal to an argument from a specific position."""
+        request = self._generate_rebuttal_request(original_argument, position, phase)
+        return Response(message=await self.acomplete(*request))
+    
+    def _analyze_argument_request(self, argument: str) -> TurnRequest:
+        return TurnRequest(
+            "Analyze the logical structure, fallacies and evidence quality of the following argument, "
+            f"objectively assessing its strengths and weaknesses: {argument}"
         )
     
     def analyze_argument(self, argument: str) -> Response:
         """Analyze an argument for logical structure, fallacies, and evidence quality."""
-        # This would call to a model to generate the analysis
-        return Response(
-            message="Argument analysis: "
-            "This would provide an objective assessment of the argument's strengths and weaknesses."
+        return Response(message=self.complete(*self._analyze_argument_request(argument)))
+    
+    async def aanalyze_argument(self, argument: str) -> Response:
+        """Asynchronously analyze an argument for logical structure, fallacies, and evidence quality."""
+        return Response(message=await self.acomplete(*self._analyze_argument_request(argument)))
+    
+    def _summarize_debate_request(self, debate_history: list) -> TurnRequest:
+        return TurnRequest(
+            "Summarize the debate, highlighting the main arguments, counterarguments, "
+            "and points of agreement and disagreement.",
+            history=debate_history
         )
     
     def summarize_debate(self, debate_history: list) -> Response:
         """Summarize the key points and conclusions from the debate."""
-        # This would call to a model to generate the summary
-        return Response(
-            message="Debate summary: "
-            "This would highlight the main arguments, counterarguments, and points of agreement/disagreement."
-        )
+        return Response(message=self.complete(*self._summarize_debate_request(debate_history)))
+    
+    async def asummarize_debate(self, debate_history: list) -> Response:
+        """Asynchronously summarize the key points and conclusions from the debate."""
+        return Response(message=await self.acomplete(*self._summarize_debate_request(debate_history)))
+    
+    def stream_message(self, method_name: str, *args):
+        """Stream the message of a Response-returning method in text chunks, as the model produces them."""
+        builder = getattr(self, f"_{method_name}_request", None)
+        if builder is None:
+            # No model call, e.g. introduce_topic
+            yield from iter_chunks(getattr(self, method_name)(*args).message)
+            return
+        yield from stream_turn(self.name, builder(*args))
+    
+    async def astream_message(self, method_name: str, *args):
+        """Asynchronously stream the message of a Response-returning method."""
+        builder = getattr(self, f"_{method_name}_request", None)
+        if builder is None:
+            async for chunk in aiter_chunks(getattr(self, method_name)(*args).message):
+                yield chunk
+            return
+        async for chunk in astream_turn(self.name, builder(*args)):
+            yield chunk
@@ -4,6 +4,10 @@ Debate Agent Module
 Core functionality for debate agents in the multi-agent debate system.
 """
 
+from .debate_history import DebateHistory
+from .generation import TurnRequest, agenerate_turn, agent_model, astream_turn, generate_turn, stream_turn
+from .prompt_engine import get_prompt_engine
+
 class DebateAgent:
     """Base class for all debate agents."""
     
@@ -19,7 +23,7 @@ class DebateAgent:
         self.description = description
         self.perspective = perspective
         self.knowledge_base = []
-        self.debate_history = []
+        self.debate_history = DebateHistory()
     
     def prepare_for_topic(self, topic):
         """Prepare the agent for a specific debate topic.
@@ -38,56 +42,180 @@ class DebateAgent:
             "perspective": self.perspective
         }
     
-    def generate_opening_statement(self, topic):
+    @property
+    def model(self):
+        """The model named in the agent's YAML definition, or None for the backend default."""
+        return agent_model(self.name)
+    
+    def _perspective_phrase(self):
+        return f"a {self.perspective}" if self.perspective else "a general"
+    
+    def build_prompt(self, task, topic, phase=None, history=None):
+        """Assemble the prompt of one of the agent's turns.
+        
+        Args:
+            task (str): What the agent is asked to do this turn.
+            topic (str): The topic of the debate.
+            phase (str, optional): The name of the current debate phase.
+            history (DebateHistory or list, optional): The debate so far.
+                Defaults to the agent's own history.
+            
+        Returns:
+            Prompt: The agent's shared static prefix and the per-turn text.
+        """
+        if history is None:
+            history = self.debate_history
+        return get_prompt_engine().build(self.name, task, topic, phase, history)
+    
+    def _turn(self, task, topic, phase, history, fallback):
+        return TurnRequest(task, topic, phase, self.debate_history if history is None else history, fallback)
+    
+    def complete(self, task, topic, phase=None, history=None, fallback=None):
+        """Generate the text of one of the agent's turns through the shared LLM client.
+        
+        Takes the same arguments as build_prompt, and:
+            fallback (str, optional): Template text returned when every backend
+                fails or has an open circuit, so the debate can go on.
+        
+        Returns:
+            str: The generated text.
+        
+        Raises:
+            BackendError: If generation fails and there is no fallback.
+        """
+        return generate_turn(self.name, self._turn(task, topic, phase, history, fallback))
+    
+    async def acomplete(self, task, topic, phase=None, history=None, fallback=None):
+        """Generate the text of a turn without blocking the event loop; see complete."""
+        return await agenerate_turn(self.name, self._turn(task, topic, phase, history, fallback))
+    
+    def _generate_opening_statement_request(self, topic, phase="opening_statements"):
+        return TurnRequest(
+            f"Present your opening statement on the topic from {self._perspective_phrase()} perspective.",
+            topic, phase, None,
+            f"{self.name} opens on {topic} from {self._perspective_phrase()} perspective."
+        )
+    
+    def generate_opening_statement(self, topic, phase="opening_statements"):
         """Generate an opening statement for a debate.
         
         Args:
             topic (str): The topic of the debate.
+            phase (str, optional): The debate phase the statement is made in.
             
         Returns:
             str: The opening statement.
         """
-        # This would be implemented by the Watson Orchestrate platform
-        return f"[{self.name} would generate an opening statement on {topic} from {'a ' + self.perspective if self.perspective else 'a general'} perspective]"
+        return self.complete(*self._generate_opening_statement_request(topic, phase))
+    
+    async def agenerate_opening_statement(self, topic, phase="opening_statements"):
+        """Asynchronously generate an opening statement; see generate_opening_statement."""
+        return await self.acomplete(*self._generate_opening_statement_request(topic, phase))
     
-    def generate_response(self, previous_statement, topic):
+    def _generate_response_request(self, previous_statement, topic, phase=None):
+        return TurnRequest(
+            f"Respond to the previous statement from {self._perspective_phrase()} perspective: {previous_statement}",
+            topic, phase, None,
+            f"{self.name} responds to the previous statement on {topic} from {self._perspective_phrase()} perspective."
+        )
+    
+    def generate_response(self, previous_statement, topic, phase=None):
         """Generate a response to a previous statement.
         
         Args:
             previous_statement (str): The statement to respond to.
             topic (str): The topic of the debate.
+            phase (str, optional): The debate phase the response is made in.
             
         Returns:
             str: The response.
         """
-        # This would be implemented by the Watson Orchestrate platform
-        return f"[{self.name} would generate a response to the previous statement on {topic} from {'a ' + self.perspective if self.perspective else 'a general'} perspective]"
+        return self.complete(*self._generate_response_request(previous_statement, topic, phase))
+    
+    async def agenerate_response(self, previous_statement, topic, phase=None):
+        """Asynchronously generate a response to a previous statement; see generate_response."""
+        return await self.acomplete(*self._generate_response_request(previous_statement, topic, phase))
     
-    def generate_rebuttal(self, argument, topic):
+    def _generate_rebuttal_request(self, argument, topic, phase="rebuttal"):
+        return TurnRequest(
+            f"Rebut the following argument from {self._perspective_phrase()} perspective: {argument}",
+            topic, phase, None,
+            f"{self.name} disputes the argument on {topic} from {self._perspective_phrase()} perspective."
+        )
+    
+    def generate_rebuttal(self, argument, topic, phase="rebuttal"):
         """Generate a rebuttal to an argument.
         
         Args:
             argument (str): The argument to rebut.
             topic (str): The topic of the debate.
+            phase (str, optional): The debate phase the rebuttal is made in.
             
         Returns:
             str: The rebuttal.
         """
-        # This would be implemented by the Watson Orchestrate platform
-        return f"[{self.name} would generate a rebuttal to the argument on {topic} from {'a ' + self.perspective if self.perspective else 'a general'} perspective]"
+        return self.complete(*self._generate_rebuttal_request(argument, topic, phase))
     
-    def generate_closing_statement(self, topic, debate_history):
+    async def agenerate_rebuttal(self, argument, topic, phase="rebuttal"):
+        """Asynchronously generate a rebuttal to an argument; see generate_rebuttal."""
+        return await self.acomplete(*self._generate_rebuttal_request(argument, topic, phase))
+    
+    def _generate_closing_statement_request(self, topic, debate_history, phase="closing_statements"):
+        return TurnRequest(
+            f"Present your closing statement from {self._perspective_phrase()} perspective, "
+            "considering the full debate history.",
+            topic, phase, debate_history,
+            f"{self.name} closes on {topic}, maintaining {self._perspective_phrase()} perspective."
+        )
+    
+    def generate_closing_statement(self, topic, debate_history, phase="closing_statements"):
         """Generate a closing statement for a debate.
         
         Args:
             topic (str): The topic of the debate.
-            debate_history (list): The history of the debate.
+            debate_history (DebateHistory or list): The history of the debate.
+            phase (str, optional): The debate phase the statement is made in.
             
         Returns:
             str: The closing statement.
         """
-        # This would be implemented by the Watson Orchestrate platform
-        return f"[{self.name} would generate a closing statement on {topic} from {'a ' + self.perspective if self.perspective else 'a general'} perspective, considering the full debate history]"
+        return self.complete(*self._generate_closing_statement_request(topic, debate_history, phase))
+    
+    async def agenerate_closing_statement(self, topic, debate_history, phase="closing_statements"):
+        """Asynchronously generate a closing statement; see generate_closing_statement."""
+        return await self.acomplete(*self._generate_closing_statement_request(topic, debate_history, phase))
+
+    def _stream_request(self, method_name, args):
+        # Each generation method X builds its request in _X_request
+        return self._turn(*getattr(self, f"_{method_name}_request")(*args))
+    
+    def stream(self, method_name, *args):
+        """Stream the output of one of the agent's generation methods.
+        
+        The text is read from the LLM client piece by piece, as the backend
+        produces it.
+        
+        Args:
+            method_name (str): The generation method, e.g. "generate_rebuttal".
+            *args: Arguments passed to the method.
+            
+        Yields:
+            str: Chunks of the generated text, in order.
+        """
+        yield from stream_turn(self.name, self._stream_request(method_name, args))
+    
+    async def astream(self, method_name, *args):
+        """Asynchronously stream the output of a generation method.
+        
+        Args:
+            method_name (str): The generation method, e.g. "generate_rebuttal".
+            *args: Arguments passed to the method.
+            
+        Yields:
+            str: Chunks of the generated text, in order.
+        """
+        async for chunk in astream_turn(self.name, self._stream_request(method_name, args)):
+            yield chunk
 
 
 class ModeratorAgent(DebateAgent):
@@ -101,9 +229,35 @@ class ModeratorAgent(DebateAgent):
             description (str): The description of the agent.
         """
         super().__init__(name, description)
+        self.topic = None
         self.debate_format = None
         self.participants = []
         self.speaking_order = []
+        self.event_log = None
+        self.session_id = None
+    
+    def attach_event_log(self, event_log, session_id):
+        """Record the speaking order and forwarded turns in an event log.
+        
+        Args:
+            event_log (SessionEventLog): The worker's session event log.
+            session_id (str): The id of the debate session being moderated.
+        """
+        self.event_log = event_log
+        self.session_id = session_id
+    
+    def restore(self, state):
+        """Restore the moderator from a session state recovered from an event log.
+        
+        Args:
+            state (dict): The recovered session state.
+        """
+        self.topic = state["topic"]
+        self.debate_format = state["flow"]
+        self.participants = state["participants"]
+        self.speaking_order = state["speaking_order"]
+        for turn in state["turns"]:
+            self.debate_history.append(turn)
     
     def setup_debate(self, topic, format_name, participants):
         """Set up a debate with specified parameters.
@@ -122,6 +276,8 @@ class ModeratorAgent(DebateAgent):
         
         # Set up speaking order based on the format
         self.speaking_order = participants.copy()
+        if self.event_log is not None:
+            self.event_log.append(self.session_id, "speaking_order", speaking_order=self.speaking_order)
         
         return {
             "moderator": self.name,
@@ -131,13 +287,28 @@ class ModeratorAgent(DebateAgent):
             "status": "ready"
         }
     
-    def introduce_debate(self):
+    def _introduce_debate_request(self, phase="moderator_introduction"):
+        return TurnRequest(
+            f"Introduce the debate in {self.debate_format} format with participants: {', '.join(self.participants)}.",
+            self.topic, phase, None,
+            f"Welcome to this {self.debate_format} debate on {self.topic}. "
+            f"Our participants are {', '.join(self.participants)}."
+        )
+    
+    def introduce_debate(self, phase="moderator_introduction"):
         """Generate an introduction for the debate.
         
+        Args:
+            phase (str, optional): The debate phase the introduction is made in.
+            
         Returns:
             str: The debate introduction.
         """
-        return f"[{self.name} would introduce the debate on {self.topic} in {self.debate_format} format with participants: {', '.join(self.participants)}]"
+        return self.complete(*self._introduce_debate_request(phase))
+    
+    async def aintroduce_debate(self, phase="moderator_introduction"):
+        """Asynchronously generate an introduction for the debate; see introduce_debate."""
+        return await self.acomplete(*self._introduce_debate_request(phase))
     
     def manage_turn(self, current_speaker, previous_speaker=None):
         """Manage the speaking turns in the debate.
@@ -151,13 +322,92 @@ class ModeratorAgent(DebateAgent):
         """
         return f"[{self.name} would manage the turn, giving the floor to {current_speaker} after {previous_speaker if previous_speaker else 'the introduction'}]"
     
-    def summarize_debate(self):
+    def _relay_audience_questions_request(self, phase="audience_questions"):
+        return TurnRequest(
+            f"Put questions from the audience on the topic to the participants: {', '.join(self.participants)}.",
+            self.topic, phase, None,
+            f"We now take questions from the audience on {self.topic} for {', '.join(self.participants)}."
+        )
+    
+    def relay_audience_questions(self, phase="audience_questions"):
+        """Generate the moderator's relay of audience questions to the participants.
+        
+        Args:
+            phase (str, optional): The debate phase the questions are put in.
+            
+        Returns:
+            str: The questions put to the participants.
+        """
+        return self.complete(*self._relay_audience_questions_request(phase))
+    
+    async def arelay_audience_questions(self, phase="audience_questions"):
+        """Asynchronously relay audience questions; see relay_audience_questions."""
+        return await self.acomplete(*self._relay_audience_questions_request(phase))
+    
+    def _summarize_debate_request(self, phase="moderator_summary"):
+        return TurnRequest(
+            "Summarize the debate, highlighting key points from each perspective.",
+            self.topic, phase, None,
+            f"That concludes our debate on {self.topic}. Thank you to {', '.join(self.participants)}."
+        )
+    
+    def summarize_debate(self, phase="moderator_summary"):
         """Generate a summary of the debate.
         
+        Args:
+            phase (str, optional): The debate phase the summary is made in.
+            
         Returns:
             str: The debate summary.
         """
-        return f"[{self.name} would summarize the debate on {self.topic}, highlighting key points from each perspective]"
+        return self.complete(*self._summarize_debate_request(phase))
+    
+    async def asummarize_debate(self, phase="moderator_summary"):
+        """Asynchronously generate a summary of the debate; see summarize_debate."""
+        return await self.acomplete(*self._summarize_debate_request(phase))
+
+    def _record_turn(self, speaker, statement):
+        """Add a completed turn to the history and the event log."""
+        self.debate_history.record_turn(speaker, statement)
+        if self.event_log is not None:
+            self.event_log.append(self.session_id, "turn", speaker=speaker, statement=statement)
+    
+    def forward_stream(self, agent, method_name, *args):
+        """Forward a participant's streamed output unchanged.
+        
+        The complete statement is added to the debate history once the
+        stream has finished.
+        
+        Args:
+            agent (DebateAgent): The participant holding the floor.
+            method_name (str): The participant's generation method.
+            *args: Arguments passed to the method.
+            
+        Yields:
+            str: Chunks of the participant's statement.
+        """
+        chunks = []
+        for chunk in agent.stream(method_name, *args):
+            chunks.append(chunk)
+            yield chunk
+        self._record_turn(agent.name, "".join(chunks))
+    
+    async def aforward_stream(self, agent, method_name, *args):
+        """Asynchronously forward a participant's streamed output unchanged.
+        
+        Args:
+            agent (DebateAgent): The participant holding the floor.
+            method_name (str): The participant's generation method.
+            *args: Arguments passed to the method.
+            
+        Yields:
+            str: Chunks of the participant's statement.
+        """
+        chunks = []
+        async for chunk in agent.astream(method_name, *args):
+            chunks.append(chunk)
+            yield chunk
+        self._record_turn(agent.name, "".join(chunks))
 
 
 class PerspectiveAgent(DebateAgent):
@@ -175,20 +425,31 @@ class PerspectiveAgent(DebateAgent):
         self.key_values = []
         self.core_principles = []
     
-    def generate_perspective_based_argument(self, topic, point_to_address=None):
+    def _generate_perspective_based_argument_request(self, topic, point_to_address=None, phase=None):
+        task = f"Make an argument from the {self.perspective} perspective"
+        if point_to_address:
+            task += f", specifically addressing: {point_to_address}"
+        return TurnRequest(
+            task + ".", topic, phase, None,
+            f"{self.name} argues the {self.perspective} perspective on {topic}."
+        )
+    
+    def generate_perspective_based_argument(self, topic, point_to_address=None, phase=None):
         """Generate an argument based on the agent's perspective.
         
         Args:
             topic (str): The topic to argue about.
             point_to_address (str, optional): A specific point to address.
+            phase (str, optional): The debate phase the argument is made in.
             
         Returns:
             str: The perspective-based argument.
         """
-        if point_to_address:
-            return f"[{self.name} would generate a {self.perspective} perspective argument on {topic}, specifically addressing: {point_to_address}]"
-        else:
-            return f"[{self.name} would generate a {self.perspective} perspective argument on {topic}]"
+        return self.complete(*self._generate_perspective_based_argument_request(topic, point_to_address, phase))
+    
+    async def agenerate_perspective_based_argument(self, topic, point_to_address=None, phase=None):
+        """Asynchronously generate a perspective-based argument; see generate_perspective_based_argument."""
+        return await self.acomplete(*self._generate_perspective_based_argument_request(topic, point_to_address, phase))
     
     def evaluate_argument(self, argument, topic):
         """Evaluate an argument from this agent's perspective.
@@ -0,0 +1,371 @@
+"""
+Debate Engine Module
+
+Asynchronous engine that drives a debate flow phase by phase, running the
+independent perspective turns of each phase concurrently.
+"""
+
+import asyncio
+import functools
+import inspect
+import time
+
+from .debate_history import DebateHistory
+
+# Maps each flow phase to the kind of turn the participants take in it.
+# Turns within a phase only depend on earlier phases, so they can run
+# concurrently. Phases not listed here are led by the moderator.
+PHASE_TURN_KINDS = {
+    "opening_statements": "opening",
+    "initial_perspectives": "opening",
+    "position_statements": "opening",
+    "cross_examination": "argument",
+    "open_discussion": "argument",
+    "point_phase": "argument",
+    "clarification": "argument",
+    "role_swap": "argument",
+    "rebuttal": "rebuttal",
+    "counterpoint_phase": "rebuttal",
+    "closing_statements": "closing",
+    "closing_thoughts": "closing",
+    "opening_statement": "opening",
+    "proposition_opening": "opening",
+    "opposition_opening": "opening",
+    "expert_presentations": "opening",
+    "arguments": "argument",
+    "proposition_arguments": "argument",
+    "opposition_arguments": "argument",
+    "expert_responses": "argument",
+    "rebuttals": "rebuttal",
+    "closing_statement": "closing",
+    "proposition_closing": "closing",
+    "opposition_closing": "closing",
+}
+
+# Phases of two-sided formats in which only one side speaks, and that side.
+# The flow says which participants are on each side.
+SIDE_PHASES = {
+    "proposition_opening": "proposition",
+    "proposition_arguments": "proposition",
+    "proposition_closing": "proposition",
+    "opposition_opening": "opposition",
+    "opposition_arguments": "opposition",
+    "opposition_closing": "opposition",
+    "point_phase": "proposition",
+    "counterpoint_phase": "opposition",
+    "role_swap": "opposition",
+}
+
+# Moderator methods used for the phases that have no perspective turns.
+MODERATOR_PHASES = {
+    "introduction": "introduce_debate",
+    "topic_framing": "introduce_debate",
+    "moderator_introduction": "introduce_debate",
+    "audience_questions": "relay_audience_questions",
+    "synthesis": "summarize_debate",
+    "summary": "summarize_debate",
+    "moderator_summary": "summarize_debate",
+    "audience_vote": "summarize_debate",
+}
+
+
+def _release_slot(semaphore, future):
+    """Free a concurrency slot once the thread running a turn is done."""
+    semaphore.release()
+    if not future.cancelled():
+        # Retrieved, so a turn that failed after its timeout is not reported again
+        future.exception()
+
+
+class DebateEngine:
+    """Runs debate phases with concurrent, time-limited perspective turns."""
+
+    def __init__(self, max_concurrency=8, turn_timeout=30.0, executor=None):
+        """Initialize a debate engine.
+
+        Args:
+            max_concurrency (int): Maximum number of turns generated at the same
+                time across every debate driven by this engine.
+            turn_timeout (float, optional): Seconds to wait for a single turn
+                before giving up on it. None disables the timeout.
+            executor (concurrent.futures.Executor, optional): Executor used for
+                synchronous agent methods. Defaults to the loop's executor.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.turn_timeout = turn_timeout
+        self.executor = executor
+        self._semaphore = None
+
+    def _get_semaphore(self):
+        # Created lazily so the semaphore binds to the running event loop.
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def run_turn(self, agent, method_name, *args):
+        """Run a single agent turn under the concurrency cap and timeout.
+
+        A synchronous method runs on the executor and holds its slot until
+        its thread returns, even after the turn has timed out.
+
+        Args:
+            agent (DebateAgent): The agent taking the turn.
+            method_name (str): The agent method that generates the statement.
+            *args: Arguments passed to the method.
+
+        Returns:
+            dict: The turn result, including its status and elapsed time.
+        """
+        # Prefer the async variant, which waits on the LLM client without a thread
+        method = getattr(agent, "a" + method_name, None)
+        if not inspect.iscoroutinefunction(method):
+            method = getattr(agent, method_name)
+        semaphore = self._get_semaphore()
+        await semaphore.acquire()
+        start = time.perf_counter()
+        release = True
+        try:
+            if inspect.iscoroutinefunction(method):
+                call = method(*args)
+            else:
+                loop = asyncio.get_running_loop()
+                future = loop.run_in_executor(self.executor, functools.partial(method, *args))
+                # A thread cannot be stopped on timeout, so it keeps its slot
+                # until it finishes and the cap holds for the threads running
+                future.add_done_callback(functools.partial(_release_slot, semaphore))
+                release = False
+                call = asyncio.shield(future)
+            statement = await asyncio.wait_for(call, self.turn_timeout)
+            status = "success"
+        except asyncio.TimeoutError:
+            statement = None
+            status = "timeout"
+        except Exception as e:
+            statement = str(e)
+            status = "error"
+        finally:
+            if release:
+                semaphore.release()
+
+        return {
+            "agent": agent.name,
+            "method": method_name,
+            "status": status,
+            "statement": statement,
+            "elapsed": time.perf_counter() - start
+        }
+
+    def _turn_args(self, kind, agent, topic, transcript, history, phase):
+        """Build the method name and arguments for a perspective turn.
+
+        The current phase is passed on, so the prompt carries the instructions
+        of the phase actually being run, e.g. "initial_perspectives" rather
+        than the default of the method.
+        """
+        if kind == "opening":
+            return "generate_opening_statement", (topic, phase)
+
+        # Respond to the latest statement made by another participant
+        previous = next(
+            (t["statement"] for t in reversed(transcript)
+             if t["agent"] != agent.name and t["status"] == "success"),
+            None
+        )
+        if kind == "argument":
+            return "generate_perspective_based_argument", (topic, previous, phase)
+        if kind == "rebuttal":
+            return "generate_rebuttal", (previous or topic, topic, phase)
+        return "generate_closing_statement", (topic, history if history is not None else list(transcript), phase)
+
+    @staticmethod
+    def _record_turn(flow, history, turn):
+        """Record a successful turn in the history and in the flow's event log."""
+        if turn["status"] != "success":
+            return
+        if history is not None:
+            history.record_turn(turn["agent"], turn["statement"])
+        flow.record_turn(turn["agent"], turn["statement"])
+
+    def _plan_turns(self, phase, flow, agents, moderator, transcript, history):
+        """List the (agent, method name, args) turns making up a phase.
+
+        In a phase where only one side speaks, only the agents the flow puts
+        on that side take a turn.
+        """
+        kind = PHASE_TURN_KINDS.get(phase)
+        if kind is None:
+            if moderator is None:
+                return []
+            return [(moderator, MODERATOR_PHASES.get(phase, "summarize_debate"), (phase,))]
+
+        side = SIDE_PHASES.get(phase)
+        if side is not None:
+            members = set(flow.sides.get(side, ()))
+            agents = [agent for agent in agents if agent.name in members]
+
+        turns = []
+        for agent in agents:
+            method_name, args = self._turn_args(kind, agent, flow.topic, transcript, history, phase)
+            turns.append((agent, method_name, args))
+        return turns
+
+    async def run_phase(self, flow, agents, moderator=None, transcript=None, history=None):
+        """Run the current phase of a flow.
+
+        All perspective turns of the phase are started together, so the phase
+        takes as long as its slowest turn rather than the sum of its turns.
+        Successful turns are recorded in the event log attached to the flow,
+        so a restarted worker can rebuild the debate.
+
+        Args:
+            flow (DebateFlow): A flow that has been set up with a topic.
+            agents (list): The PerspectiveAgent participants.
+            moderator (ModeratorAgent, optional): The debate moderator.
+            transcript (list, optional): Results of earlier turns. New turns are
+                appended to it.
+            history (DebateHistory, optional): Token-budgeted history that
+                successful turns are recorded in and closing turns receive.
+
+        Returns:
+            dict: The phase name, its turn results and elapsed time.
+        """
+        info = flow.current_phase_info()
+        if "phase" not in info:
+            return info
+
+        phase = info["phase"]
+        transcript = transcript if transcript is not None else []
+        start = time.perf_counter()
+
+        planned = self._plan_turns(phase, flow, agents, moderator, transcript, history)
+        turns = list(await asyncio.gather(
+            *(self.run_turn(agent, method_name, *args) for agent, method_name, args in planned)
+        ))
+
+        for turn in turns:
+            turn["phase"] = phase
+            self._record_turn(flow, history, turn)
+        transcript.extend(turns)
+
+        return {
+            "phase": phase,
+            "turns": turns,
+            "elapsed": time.perf_counter() - start
+        }
+
+    async def _stream_turn(self, agent, method_name, args, phase, queue):
+        """Push the chunks of one streamed turn onto a queue, then its result."""
+        chunks = []
+
+        async def pump():
+            async for chunk in agent.astream(method_name, *args):
+                chunks.append(chunk)
+                await queue.put({"phase": phase, "agent": agent.name, "chunk": chunk})
+
+        async with self._get_semaphore():
+            start = time.perf_counter()
+            try:
+                await asyncio.wait_for(pump(), self.turn_timeout)
+                status = "success"
+            except asyncio.TimeoutError:
+                status = "timeout"
+            except Exception as e:
+                chunks = [str(e)]
+                status = "error"
+
+        await queue.put({
+            "agent": agent.name,
+            "method": method_name,
+            "status": status,
+            "statement": "".join(chunks) if status != "timeout" else None,
+            "elapsed": time.perf_counter() - start,
+            "phase": phase,
+            "done": True
+        })
+
+    async def stream_phase(self, flow, agents, moderator=None, transcript=None, history=None):
+        """Run the current phase of a flow, streaming chunks as they arrive.
+
+        Turns run concurrently, and are recorded, as in run_phase. Chunks from
+        different agents are interleaved in arrival order and passed through
+        unchanged.
+
+        Args:
+            flow (DebateFlow): A flow that has been set up with a topic.
+            agents (list): The PerspectiveAgent participants.
+            moderator (ModeratorAgent, optional): The debate moderator.
+            transcript (list, optional): Results of earlier turns. Completed
+                turns are appended to it.
+            history (DebateHistory, optional): Token-budgeted history that
+                successful turns are recorded in and closing turns receive.
+
+        Yields:
+            dict: Chunk events with "phase", "agent" and "chunk" keys, and one
+            final event per turn with "done" set and the turn result.
+        """
+        info = flow.current_phase_info()
+        if "phase" not in info:
+            return
+
+        phase = info["phase"]
+        transcript = transcript if transcript is not None else []
+        planned = self._plan_turns(phase, flow, agents, moderator, transcript, history)
+
+        queue = asyncio.Queue()
+        tasks = [
+            asyncio.ensure_future(self._stream_turn(agent, method_name, args, phase, queue))
+            for agent, method_name, args in planned
+        ]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                event = await queue.get()
+                if event.get("done"):
+                    remaining -= 1
+                    turn = {k: v for k, v in event.items() if k != "done"}
+                    transcript.append(turn)
+                    self._record_turn(flow, history, turn)
+                yield event
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def run_debate(self, flow, agents, moderator=None):
+        """Run every remaining phase of a flow.
+
+        The flow is finished when it completes or fails, so its session is
+        dropped from the event log. A cancelled debate is left in the log, to
+        be resumed by the next worker.
+
+        Args:
+            flow (DebateFlow): A flow that has been set up with a topic.
+            agents (list): The PerspectiveAgent participants.
+            moderator (ModeratorAgent, optional): The debate moderator.
+
+        Returns:
+            dict: The results of each phase and the full transcript.
+        """
+        transcript = []
+        history = DebateHistory()
+        phases = []
+        try:
+            while True:
+                result = await self.run_phase(flow, agents, moderator, transcript, history)
+                if "phase" not in result:
+                    break
+                phases.append(result)
+                if flow.next_phase()["status"] != "success":
+                    break
+        except Exception:
+            flow.finish()
+            raise
+        flow.finish()
+
+        return {
+            "topic": flow.topic,
+            "flow": flow.name,
+            "phases": phases,
+            "transcript": transcript
+        }
@@ -4,31 +4,97 @@ Debate Flow Module
 Defines flow patterns for different types of debates in the multi-agent debate system.
 """
 
+from .flow_registry import (
+    POINT_COUNTERPOINT_PHASES,
+    ROUNDTABLE_PHASES,
+    STRUCTURED_PHASES,
+    get_registry,
+)
+
+# Sides of a two-sided format, in the order participants are dealt to them
+SIDES = ("proposition", "opposition")
+
+
+def assign_sides(participants):
+    """Deal participants alternately to the proposition and the opposition.
+    
+    Args:
+        participants (list): The participants, in speaking order.
+        
+    Returns:
+        dict: Lists of participants keyed by side.
+    """
+    return {side: list(participants[i::len(SIDES)]) for i, side in enumerate(SIDES)}
+
+
 class DebateFlow:
     """Base class for all debate flows."""
     
-    def __init__(self, name, description):
+    def __init__(self, name, description, phases=()):
         """Initialize a debate flow.
         
         Args:
             name (str): The name of the flow.
             description (str): The description of the flow.
+            phases (tuple, optional): The shared, immutable phase table of the flow.
         """
         self.name = name
         self.description = description
-        self.phases = []
+        self.phases = phases
         self.current_phase = None
         self.participants = []
+        self.sides = {}
         self.moderator = None
         self.topic = None
+        self.event_log = None
+        self.session_id = None
+        self.finished = False
+    
+    def attach_event_log(self, event_log, session_id):
+        """Record this flow's setup, phase transitions, turns and end in an event log.
+        
+        Args:
+            event_log (SessionEventLog): The worker's session event log.
+            session_id (str): The id of the debate session this flow runs.
+        """
+        self.event_log = event_log
+        self.session_id = session_id
+    
+    def restore(self, state):
+        """Restore the flow from a session state recovered from an event log.
+        
+        Args:
+            state (dict): The recovered session state.
+        """
+        self.topic = state["topic"]
+        self.moderator = state["moderator"]
+        self.participants = state["participants"]
+        self.sides = state.get("sides") or assign_sides(self.participants)
+        self.current_phase = state["current_phase"]
+    
+    @classmethod
+    def from_definition(cls, definition):
+        """Create a flow that runs a compiled flow definition.
         
-    def setup(self, topic, moderator, participants):
+        Args:
+            definition (FlowDefinition): A definition from the flow registry.
+            
+        Returns:
+            DebateFlow: A flow referencing the definition's phase table.
+        """
+        return cls(definition.name, definition.description, definition.phases)
+        
+    def setup(self, topic, moderator, participants, sides=None):
         """Set up the debate flow.
         
         Args:
             topic (str): The topic of the debate.
             moderator (str): The moderator of the debate.
             participants (list): The participants in the debate.
+            sides (dict, optional): Participants keyed by side ("proposition"
+                and "opposition"), for the phases of formats where only one
+                side speaks. Defaults to dealing the participants alternately
+                to the sides, starting with the proposition.
             
         Returns:
             dict: Information about the flow setup.
@@ -36,13 +102,22 @@ class DebateFlow:
         self.topic = topic
         self.moderator = moderator
         self.participants = participants
+        self.sides = {side: list(members) for side, members in sides.items()} if sides else assign_sides(participants)
         self.current_phase = 0 if self.phases else None
+        self.finished = False
+        
+        if self.event_log is not None:
+            self.event_log.append(
+                self.session_id, "setup", flow=self.name, topic=topic, moderator=moderator,
+                participants=participants, sides=self.sides, current_phase=self.current_phase
+            )
         
         return {
             "flow": self.name,
             "topic": topic,
             "moderator": moderator,
             "participants": participants,
+            "sides": self.sides,
             "phases": [p["name"] for p in self.phases],
             "status": "ready"
         }
@@ -57,15 +132,40 @@ class DebateFlow:
             return {"status": "error", "message": "No phases defined"}
         
         if self.current_phase >= len(self.phases) - 1:
+            self.finish()
             return {"status": "complete", "message": "Debate is complete"}
         
         self.current_phase += 1
+        if self.event_log is not None:
+            self.event_log.append(self.session_id, "phase", current_phase=self.current_phase)
         return {
             "status": "success",
             "phase": self.phases[self.current_phase]["name"],
             "instructions": self.phases[self.current_phase]["instructions"]
         }
     
+    def record_turn(self, speaker, statement):
+        """Record a turn made in the current phase in the event log, if one is attached.
+        
+        Args:
+            speaker (str): The agent that made the turn.
+            statement (str): What the agent said.
+        """
+        if self.event_log is not None and not self.finished:
+            self.event_log.append(self.session_id, "turn", speaker=speaker, statement=statement)
+    
+    def finish(self):
+        """End the debate, so the event log drops its session state.
+        
+        Called when the flow completes; call it too when a debate is torn
+        down early. Only the first call is recorded.
+        """
+        if self.finished:
+            return
+        self.finished = True
+        if self.event_log is not None:
+            self.event_log.append(self.session_id, "end")
+    
     def current_phase_info(self):
         """Get information about the current phase.
         
@@ -85,122 +185,58 @@ class DebateFlow:
 class StructuredDebateFlow(DebateFlow):
     """A structured debate flow with formal phases."""
     
-    def __init__(self):
+    def __init__(self, name="structured",
+                 description="A formal debate with clear rules, timed responses, and organized structure.",
+                 phases=STRUCTURED_PHASES):
         """Initialize a structured debate flow."""
-        super().__init__(
-            "structured",
-            "A formal debate with clear rules, timed responses, and organized structure."
-        )
-        
-        self.phases = [
-            {
-                "name": "opening_statements",
-                "instructions": "Each participant presents their initial position on the topic."
-            },
-            {
-                "name": "cross_examination",
-                "instructions": "Participants question each other's positions and arguments."
-            },
-            {
-                "name": "rebuttal",
-                "instructions": "Participants respond to criticisms and strengthen their arguments."
-            },
-            {
-                "name": "closing_statements",
-                "instructions": "Each participant summarizes their position and key arguments."
-            }
-        ]
+        super().__init__(name, description, phases)
 
 
 class RoundtableDebateFlow(DebateFlow):
     """A roundtable discussion flow with less formal structure."""
     
-    def __init__(self):
+    def __init__(self, name="roundtable",
+                 description="An open discussion format where agents freely contribute perspectives on the topic.",
+                 phases=ROUNDTABLE_PHASES):
         """Initialize a roundtable debate flow."""
-        super().__init__(
-            "roundtable",
-            "An open discussion format where agents freely contribute perspectives on the topic."
-        )
-        
-        self.phases = [
-            {
-                "name": "introduction",
-                "instructions": "Moderator introduces the topic and participants."
-            },
-            {
-                "name": "initial_perspectives",
-                "instructions": "Each participant briefly shares their initial perspective."
-            },
-            {
-                "name": "open_discussion",
-                "instructions": "Free-flowing discussion moderated to ensure all perspectives are heard."
-            },
-            {
-                "name": "synthesis",
-                "instructions": "Moderator guides the group toward identifying common ground and key differences."
-            },
-            {
-                "name": "closing_thoughts",
-                "instructions": "Each participant shares final thoughts on the topic."
-            }
-        ]
+        super().__init__(name, description, phases)
 
 
 class PointCounterpointDebateFlow(DebateFlow):
     """A point-counterpoint debate flow focusing on specific arguments."""
     
-    def __init__(self):
+    def __init__(self, name="point_counterpoint",
+                 description="A back-and-forth format focusing on specific arguments and counter-arguments.",
+                 phases=POINT_COUNTERPOINT_PHASES):
         """Initialize a point-counterpoint debate flow."""
-        super().__init__(
-            "point_counterpoint",
-            "A back-and-forth format focusing on specific arguments and counter-arguments."
-        )
-        
-        self.phases = [
-            {
-                "name": "topic_framing",
-                "instructions": "Moderator frames the topic and explains the format."
-            },
-            {
-                "name": "position_statements",
-                "instructions": "Each side presents their initial position in brief statements."
-            },
-            {
-                "name": "point_phase",
-                "instructions": "First side presents a key point or argument."
-            },
-            {
-                "name": "counterpoint_phase",
-                "instructions": "Second side responds directly to the point with a counterpoint."
-            },
-            {
-                "name": "clarification",
-                "instructions": "Brief exchange to clarify positions and address misunderstandings."
-            },
-            {
-                "name": "role_swap",
-                "instructions": "Sides swap roles, with the second side now presenting a point."
-            },
-            {
-                "name": "summary",
-                "instructions": "Moderator summarizes the key points and counterpoints discussed."
-            }
-        ]
+        super().__init__(name, description, phases)
+
+
+# Flow classes of the built-in formats, by normalized name. Their constructor
+# arguments default to the built-in phases, so from_definition can hand them the
+# phases a configuration file gives the format. Other formats run as a plain
+# DebateFlow.
+FLOW_CLASSES = {
+    "structured": StructuredDebateFlow,
+    "roundtable": RoundtableDebateFlow,
+    "point_counterpoint": PointCounterpointDebateFlow,
+}
 
 
 def get_debate_flow(flow_name):
     """Get a debate flow by name.
     
+    Formats come from the flow registry, which compiles the built-in flows and
+    the configured formats once per process. The built-in formats keep their
+    flow class, with the phases the configuration gives them.
+    
     Args:
-        flow_name (str): The name of the flow.
+        flow_name (str): The name of the flow, e.g. "structured" or "Oxford Style".
         
     Returns:
-        DebateFlow: The requested debate flow.
+        DebateFlow: The requested debate flow, or None if the format is unknown.
     """
-    flows = {
-        "structured": StructuredDebateFlow(),
-        "roundtable": RoundtableDebateFlow(),
-        "point_counterpoint": PointCounterpointDebateFlow()
-    }
-    
-    return flows.get(flow_name.lower())
+    definition = get_registry().get(flow_name)
+    if definition is None:
+        return None
+    return FLOW_CLASSES.get(definition.name, DebateFlow).from_definition(definition)
@@ -0,0 +1,190 @@
+"""
+Debate History Module
+
+Token-budgeted debate history that keeps the latest turns verbatim and folds
+older turns into a running summary, so the context sent with each turn stays
+the same size however long the debate runs.
+"""
+
+import re
+from collections import deque
+
+SUMMARY_HEADER = "Summary of earlier discussion:\n"
+TURNS_HEADER = "Recent turns:\n"
+ELLIPSIS = "..."
+
+# Longest first sentence kept for a folded turn, in characters
+SUMMARY_LINE_CHARS = 240
+
+SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+
+
+def estimate_tokens(text):
+    """Estimate the number of model tokens in a text.
+
+    Uses the common approximation of four characters per token, which is
+    close enough for budgeting without loading a tokenizer.
+
+    Args:
+        text (str): The text to measure.
+
+    Returns:
+        int: The estimated token count.
+    """
+    return (len(text) + 3) // 4
+
+
+def truncate_text(text, max_chars):
+    """Shorten a text to at most max_chars characters, cutting at a word boundary.
+
+    Args:
+        text (str): The text to shorten.
+        max_chars (int): The maximum length of the result.
+
+    Returns:
+        str: The text itself if it fits, else its start followed by "...".
+    """
+    if len(text) <= max_chars:
+        return text
+    if max_chars <= len(ELLIPSIS):
+        return text[:max(0, max_chars)]
+    limit = max_chars - len(ELLIPSIS)
+    cut = text.rfind(" ", 0, limit + 1)
+    if cut <= 0:
+        cut = limit
+    return text[:cut].rstrip() + ELLIPSIS
+
+
+def _line_tokens(line):
+    # Each rendered line is followed by a newline
+    return estimate_tokens(line) + 1
+
+
+def extractive_summarizer(summary_lines, turn):
+    """Fold a turn into the summary by keeping its first sentence.
+
+    Statements without a sentence break, or with a very long first sentence,
+    are cut to SUMMARY_LINE_CHARS characters.
+
+    Args:
+        summary_lines (list): The current summary, one line per folded turn.
+        turn (dict): The turn being folded, with "speaker" and "statement".
+
+    Returns:
+        list: The updated summary lines.
+    """
+    statement = turn["statement"].strip()
+    first_sentence = SENTENCE_END.split(statement, 1)[0]
+    return summary_lines + [f"{turn['speaker']}: {truncate_text(first_sentence, SUMMARY_LINE_CHARS)}"]
+
+
+class DebateHistory:
+    """Rolling debate history bounded by a token budget.
+
+    The rendered history, headers included, never exceeds the budget: a turn
+    too long to fit beside a full summary is cut when it is added, and a
+    summary line that alone exceeds the summary's share is cut when folded.
+    """
+
+    def __init__(self, token_budget=2000, verbatim_turns=6, summary_share=0.25, summarizer=None):
+        """Initialize an empty history.
+
+        Args:
+            token_budget (int): Maximum estimated tokens of the rendered history.
+            verbatim_turns (int): Maximum number of recent turns kept word for word.
+            summary_share (float): Share of the budget reserved for the summary.
+            summarizer (callable, optional): Function taking the summary lines
+                and a turn and returning new summary lines. Called once per
+                folded turn. Defaults to extractive_summarizer.
+        """
+        self.token_budget = token_budget
+        self.verbatim_turns = verbatim_turns
+        self.summary_budget = int(token_budget * summary_share)
+        # Headers and the blank line between the sections
+        self._overhead = estimate_tokens(SUMMARY_HEADER) + estimate_tokens(TURNS_HEADER) + 1
+        # Longest turn kept, so a full summary and the turn still fit
+        self.turn_budget = max(1, token_budget - self._overhead - self.summary_budget)
+        self.summarizer = summarizer or extractive_summarizer
+        self.turns = deque()
+        self.summary_lines = []
+        self.turn_count = 0
+        self._turn_tokens = 0
+        self._summary_tokens = 0
+
+    def __len__(self):
+        return len(self.turns)
+
+    def __iter__(self):
+        return iter(self.turns)
+
+    def append(self, turn):
+        """Add a turn to the history.
+
+        Args:
+            turn (dict or str): A dict with "speaker" and "statement" keys, or a
+                bare statement.
+        """
+        if isinstance(turn, str):
+            turn = {"speaker": "unknown", "statement": turn}
+        tokens = _line_tokens(self._line(turn))
+        if tokens > self.turn_budget:
+            # estimate_tokens allows four characters per token
+            max_chars = 4 * (self.turn_budget - 1) - len(self._line(turn)) + len(turn["statement"])
+            turn = dict(turn, statement=truncate_text(turn["statement"], max_chars))
+            tokens = _line_tokens(self._line(turn))
+        self.turns.append(turn)
+        self.turn_count += 1
+        self._turn_tokens += tokens
+
+        while len(self.turns) > 1 and (
+            len(self.turns) > self.verbatim_turns
+            or self.token_count() > self.token_budget
+        ):
+            self._fold(self.turns.popleft())
+
+    def record_turn(self, speaker, statement):
+        """Add a turn made by a speaker."""
+        self.append({"speaker": speaker, "statement": statement})
+
+    @staticmethod
+    def _line(turn):
+        return f"{turn['speaker']}: {turn['statement']}"
+
+    def _fold(self, turn):
+        """Move a turn into the summary, trimming the summary to its budget."""
+        self._turn_tokens -= _line_tokens(self._line(turn))
+        self.summary_lines = self.summarizer(self.summary_lines, turn)
+        tokens = [_line_tokens(line) for line in self.summary_lines]
+        while len(tokens) > 1 and sum(tokens) > self.summary_budget:
+            self.summary_lines.pop(0)
+            tokens.pop(0)
+        if tokens and tokens[0] > self.summary_budget:
+            self.summary_lines[0] = truncate_text(self.summary_lines[0], 4 * (self.summary_budget - 1))
+            tokens[0] = _line_tokens(self.summary_lines[0])
+        self._summary_tokens = sum(tokens)
+
+    @property
+    def summary(self):
+        """The running summary of the turns no longer kept verbatim."""
+        return "\n".join(self.summary_lines)
+
+    def token_count(self):
+        """Estimated tokens of the rendered history.
+
+        An upper bound: every line is rounded up, and both headers are
+        counted even when a section is empty.
+        """
+        return self._overhead + self._summary_tokens + self._turn_tokens
+
+    def render(self):
+        """Render the history as prompt context.
+
+        Returns:
+            str: The summary of earlier turns followed by the recent turns.
+        """
+        parts = []
+        if self.summary_lines:
+            parts.append(SUMMARY_HEADER + self.summary)
+        if self.turns:
+            parts.append(TURNS_HEADER + "\n".join(self._line(turn) for turn in self.turns))
+        return "\n\n".join(parts)
@@ -9,6 +9,9 @@ from ibm_watsonx_orchestrate.agent_builder import KnowledgeBase
 import json
 import os
 
+from .knowledge_index import KnowledgeIndex
+from .knowledge_store import MappedKnowledgeBase
+
 # Sample debate topics and reference information
 SAMPLE_TOPICS = [
     {
@@ -54,32 +57,245 @@ SAMPLE_TOPICS = [
                 ]
             }
         ]
+    },
+    {
+        "topic": "Digital Inclusion",
+        "description": "Debate on how to ensure everyone can access and use digital technologies",
+        "perspectives": [
+            {
+                "position": "Public Infrastructure Investment",
+                "key_points": [
+                    "Public funding should extend broadband to rural and low-income communities",
+                    "Internet connectivity is essential infrastructure like roads and electricity",
+                    "Digital literacy programs help people use the devices they have"
+                ]
+            },
+            {
+                "position": "Private Sector Expansion",
+                "key_points": [
+                    "Competition among providers lowers prices for internet service",
+                    "Targeted subsidies are more efficient than government-built networks",
+                    "Industry partnerships can supply affordable devices at scale"
+                ]
+            }
+        ]
+    },
+    {
+        "topic": "Survival Situation",
+        "description": "Debate on how limited resources should be allocated among groups in a crisis",
+        "perspectives": [
+            {
+                "position": "Equal Distribution",
+                "key_points": [
+                    "Every person has an equal claim to scarce resources",
+                    "Equal rationing preserves trust and cooperation within the group",
+                    "Fair procedures matter as much as outcomes in a crisis"
+                ]
+            },
+            {
+                "position": "Needs-Based Allocation",
+                "key_points": [
+                    "The most vulnerable should receive resources first",
+                    "Allocation should maximize the number of lives saved",
+                    "Those with critical skills may need priority to help the whole group survive"
+                ]
+            }
+        ]
     }
 ]
 
 class DebateKnowledgeBase:
     """Knowledge base for debate-relevant information."""
     
-    def __init__(self):
-        self.topics = SAMPLE_TOPICS
+    def __init__(self, topics=None, store=None):
+        """Initialize the knowledge base.
+        
+        Args:
+            topics (list, optional): Topic records to load. Defaults to
+                SAMPLE_TOPICS, or to none when a store is given.
+            store (str, optional): Path of a knowledge store file written by
+                knowledge_store.build_store. Its topics are looked up in the
+                memory-mapped file on demand; topics added with add_topic
+                take precedence over them.
+        """
+        # Exact lookups are keyed by lowercased names; fuzzy lookups go
+        # through the BM25 index over titles, descriptions and key points.
+        self._topics = {}
+        self._perspectives = {}
+        self.index = KnowledgeIndex()
+        self._vectors = None
+        self._store = None
+        # Keys of store topics removed or replaced in memory
+        self._hidden = set()
+        self._store_indexed = False
+        if store is not None:
+            self._store = MappedKnowledgeBase(store)
+            if topics is None:
+                topics = ()
+        for topic in (SAMPLE_TOPICS if topics is None else topics):
+            self.add_topic(topic)
         # In a real implementation, this would connect to a proper knowledge base
+    
+    def close(self):
+        """Unmap the knowledge store, if there is one."""
+        if self._store is not None:
+            self._store.close()
+    
+    def _stored_topic(self, key):
+        """Look a topic up in the store, unless it was removed or replaced."""
+        if self._store is None or key in self._hidden:
+            return None
+        return self._store.get_topic_information(key)
+    
+    def _stored_names(self):
+        """Names of the store topics that are not removed or replaced."""
+        if self._store is None:
+            return []
+        return [name for name in self._store.get_available_topics()
+                if name.lower() not in self._hidden and name.lower() not in self._topics]
+    
+    @property
+    def topics(self):
+        """All topic records: those of the store, then those added, in order."""
+        stored = [self._store.get_topic_information(name) for name in self._stored_names()]
+        return stored + list(self._topics.values())
+    
+    def add_topic(self, topic):
+        """Add a topic, replacing any existing topic with the same name."""
+        key = topic["topic"].lower()
+        self.remove_topic(key)
+        self._vectors = None
+        
+        self._topics[key] = topic
+        for perspective in topic.get("perspectives", []):
+            self._perspectives[(key, perspective["position"].lower())] = perspective
+        self._index_topic(topic)
+    
+    def remove_topic(self, topic_name):
+        """Remove a topic and its perspectives.
+        
+        Returns:
+            bool: True if the topic existed.
+        """
+        key = topic_name.lower()
+        topic = self._topics.pop(key, None)
+        if topic is None:
+            topic = self._stored_topic(key)
+            if topic is None:
+                return False
+            self._hidden.add(key)
+        
+        self._vectors = None
+        self.index.remove_document((key, None))
+        for perspective in topic.get("perspectives", []):
+            position = perspective["position"].lower()
+            self._perspectives.pop((key, position), None)
+            self.index.remove_document((key, position))
+        return True
         
     def get_topic_information(self, topic_name):
         """Retrieve information about a specific debate topic."""
-        for topic in self.topics:
-            if topic["topic"].lower() == topic_name.lower():
-                return topic
-        return None
+        key = topic_name.lower()
+        topic = self._topics.get(key)
+        if topic is None:
+            topic = self._stored_topic(key)
+        return topic
     
     def get_available_topics(self):
         """Get a list of available debate topics."""
-        return [topic["topic"] for topic in self.topics]
+        return self._stored_names() + [topic["topic"] for topic in self._topics.values()]
     
     def get_perspective(self, topic_name, position):
         """Get information about a specific perspective on a topic."""
-        topic = self.get_topic_information(topic_name)
-        if topic:
-            for perspective in topic["perspectives"]:
-                if perspective["position"].lower() == position.lower():
-                    return perspective
-        return None
+        key = topic_name.lower()
+        if key in self._topics:
+            return self._perspectives.get((key, position.lower()))
+        if self._store is None or key in self._hidden:
+            return None
+        return self._store.get_perspective(key, position)
+    
+    def _index_store(self):
+        """Add the store's topics to the search index on the first search."""
+        if self._store_indexed:
+            return
+        self._store_indexed = True
+        for name in self._stored_names():
+            self._index_topic(self._store.get_topic_information(name))
+    
+    def _index_topic(self, topic):
+        key = topic["topic"].lower()
+        self.index.add_document((key, None), f"{topic['topic']} {topic.get('description', '')}")
+        for perspective in topic.get("perspectives", []):
+            self.index.add_document(
+                (key, perspective["position"].lower()),
+                " ".join([perspective["position"]] + perspective.get("key_points", []))
+            )
+    
+    def search(self, query, limit=10):
+        """Search topics and perspectives, ranked by BM25 relevance.
+        
+        Args:
+            query (str): Free-form search text.
+            limit (int): Maximum number of results.
+            
+        Returns:
+            list: Matches with the topic name, the position (None for a match
+            on the topic itself) and the relevance score.
+        """
+        self._index_store()
+        results = []
+        for (key, position), score in self.index.search(query, limit):
+            results.append({
+                "topic": self.get_topic_information(key)["topic"],
+                "position": self.get_perspective(key, position)["position"] if position else None,
+                "score": score
+            })
+        return results
+    
+    def _vector_index(self):
+        """Build the dense index over key points on first use."""
+        if self._vectors is None:
+            from .knowledge_vectors import VectorIndex
+            
+            keys, texts = [], []
+            for topic in self.topics:
+                key = topic["topic"].lower()
+                for perspective in topic.get("perspectives", []):
+                    position = perspective["position"].lower()
+                    for point in perspective.get("key_points", []):
+                        keys.append((key, position, point))
+                        texts.append(f"{topic['topic']} {perspective['position']} {point}")
+            self._vectors = VectorIndex()
+            self._vectors.add(keys, texts)
+        return self._vectors
+    
+    def semantic_search_batch(self, queries, k=5):
+        """Find the key points closest in meaning to each of several queries.
+        
+        Uses a local hashed embedding, so paraphrases match without any
+        network search service. Requires numpy.
+        
+        Args:
+            queries (list): The query texts.
+            k (int): Number of key points per query.
+            
+        Returns:
+            list: For each query, matches with the topic name, position,
+            key point and similarity score.
+        """
+        results = []
+        for matches in self._vector_index().search_batch(queries, k):
+            results.append([
+                {
+                    "topic": self.get_topic_information(key)["topic"],
+                    "position": self.get_perspective(key, position)["position"],
+                    "key_point": point,
+                    "score": score
+                }
+                for (key, position, point), score in matches
+            ])
+        return results
+    
+    def semantic_search(self, query, k=5):
+        """Find the key points closest in meaning to a query."""
+        return self.semantic_search_batch([query], k)[0]
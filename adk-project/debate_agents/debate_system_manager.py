@@ -6,12 +6,19 @@ This script helps manage and coordinate interactions between multiple debate age
 """
 
 import os
-import json
 import sys
 from pathlib import Path
 import subprocess
 import argparse
 
+if __package__:
+    from .config_service import ConfigError, get_config_service
+else:
+    # Run as a script: import through the package, so this process has the
+    # same config service singleton as the package modules it uses
+    sys.path.append(str(Path(__file__).parent.absolute().parent))
+    from debate_agents.config_service import ConfigError, get_config_service
+
 # Define the base path
 BASE_PATH = Path(os.path.dirname(os.path.abspath(__file__)))
 PROJECT_PATH = BASE_PATH.parent
@@ -20,37 +27,40 @@ class DebateSystemManager:
     """Manager for the multi-agent debate system."""
     
     def __init__(self):
-        self.config_path = BASE_PATH / "debate_system_config.json"
+        self.config_service = get_config_service()
         self.load_config()
         
+    @property
+    def config(self):
+        """The current debate system configuration, reloaded when the file changes."""
+        return self.config_service.system_config()
+    
     def load_config(self):
-        """Load the debate system configuration."""
+        """Load and validate the debate system configuration."""
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = json.load(f)
-            print(f"Loaded configuration for {self.config['system_name']}")
-        except Exception as e:
+            print(f"Loaded configuration for {self.config.system_name}")
+        except ConfigError as e:
             print(f"Error loading configuration: {e}")
             sys.exit(1)
     
     def list_agents(self):
         """List all available debate agents."""
         print("\nAvailable Agents:")
-        print(f"Moderator: {self.config['agents']['moderator']['name']}")
+        print(f"Moderator: {self.config.moderator.name}")
         print("\nPerspective Agents:")
-        for agent in self.config['agents']['perspectives']:
-            print(f"- {agent['name']}: {agent['description']}")
+        for agent in self.config.perspectives:
+            print(f"- {agent.name}: {agent.description}")
     
     def list_debate_formats(self):
         """List all available debate formats."""
         print("\nAvailable Debate Formats:")
-        for name, format_info in self.config['debate_formats'].items():
-            print(f"- {name}: {format_info['description']}")
+        for name, format_info in self.config.debate_formats.items():
+            print(f"- {name}: {format_info.description}")
     
     def list_topic_categories(self):
         """List all available topic categories."""
         print("\nAvailable Topic Categories:")
-        for category in self.config['topics']['categories']:
+        for category in self.config.topic_categories:
             print(f"- {category}")
     
     def start_chat_with_agent(self, agent_name):
@@ -63,23 +73,24 @@ class DebateSystemManager:
     
     def setup_debate(self, topic, format_name, perspectives):
         """Set up a debate on a specific topic with selected perspectives."""
-        if format_name not in self.config['debate_formats']:
+        config = self.config
+        if format_name not in config.debate_formats:
             print(f"Error: Format '{format_name}' not found.")
             return
         
         # Validate perspectives
-        valid_perspectives = [p['name'] for p in self.config['agents']['perspectives']]
+        valid_perspectives = [p.name for p in config.perspectives]
         for p in perspectives:
             if p not in valid_perspectives:
                 print(f"Warning: Perspective '{p}' not found in configuration.")
         
         print(f"\nSetting up {format_name} debate on topic: {topic}")
-        print(f"Using moderator: {self.config['agents']['moderator']['name']}")
+        print(f"Using moderator: {config.moderator.name}")
         print(f"With perspectives: {', '.join(perspectives)}")
         
         # Placeholder for actual debate setup logic
         print("\nDebate setup complete. Access at http://localhost:3002/chat-lite")
-        print(f"Select '{self.config['agents']['moderator']['name']}' from the agent dropdown.")
+        print(f"Select '{config.moderator.name}' from the agent dropdown.")
         print("Send the following message to start:")
         print(f"'Set up a {format_name} debate on {topic} with {', '.join(perspectives)}'")
 
@@ -122,8 +133,8 @@ def main():
         manager.setup_debate(args.topic, args.format, args.perspectives)
     else:
         # If no command is provided, show system info and available commands
-        print(f"\n{manager.config['system_name']} v{manager.config['version']}")
-        print(f"{manager.config['description']}")
+        print(f"\n{manager.config.system_name} v{manager.config.version}")
+        print(f"{manager.config.description}")
         print("\nAvailable commands:")
         print("  list-agents     List all available debate agents")
         print("  list-formats    List all available debate formats")
@@ -5,7 +5,6 @@ This script creates and deploys the Debate Agent to the IBM Watson Orchestrate e
 """
 
 import os
-import json
 import sys
 from ibm_watsonx_orchestrate.agent_builder import deploy_agent
 from ibm_watsonx_orchestrate.agent_builder.models import AgentDefinition
@@ -18,17 +17,17 @@ def deploy_debate_agent():
     """Deploy the debate agent to the Watson Orchestrate environment."""
     
     # Import our agent components
-    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-    from debate_agent import DebateAgent
-    from debate_flow import DebateFlow
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from debate_agents.config_service import get_config_service
+    from debate_agents.debate_agent import DebateAgent
+    from debate_agents.debate_flow import DebateFlow
     
     # Create the agent definition
-    with open('debate_agent_config.json') as f:
-        config = json.load(f)
+    config = get_config_service().agent_config()
     
     agent = DebateAgent(
-        name=config['name'],
-        description=config['description']
+        name=config.name,
+        description=config.description
     )
     
     flow = DebateFlow()
@@ -2,69 +2,169 @@
 """
 Debate System Deployment Script
 This script deploys the debate system agents using the ADK.
+
+Each agent's spec is hashed after parsing, when the agent spec bundle is
+compiled, so formatting-only edits do not count as changes. Agents whose hash
+matches the deployment manifest are skipped, and the changed ones are deployed
+in parallel.
 """
 
 import os
+import sys
 import json
-import yaml
+import time
 import argparse
+import tempfile
+import subprocess
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Get the current directory
 current_dir = Path(__file__).parent.absolute()
 
+sys.path.append(str(current_dir.parent))
+from debate_agents.agent_specs import get_bundle
+from debate_agents.config_service import get_config_service
+
+# Hashes of the last successfully deployed version of each agent
+MANIFEST_PATH = current_dir / ".deploy_manifest.json"
+
 def load_config():
-    """Load the debate system configuration"""
-    config_path = current_dir / "debate_system_config.json"
-    with open(config_path, 'r') as f:
-        return json.load(f)
+    """Load the validated debate system configuration"""
+    return get_config_service().system_config()
 
-def deploy_agents():
-    """Deploy all agents defined in the configuration"""
-    config = load_config()
-    print(f"Deploying {config['system_name']}...")
-    
-    # Deploy moderator agent
-    moderator_config = config['agents']['moderator']
-    deploy_agent(moderator_config['agent_file'])
-    
-    # Deploy perspective agents
-    for perspective in config['agents']['perspectives']:
-        deploy_agent(perspective['agent_file'])
-    
-    print("All agents deployed successfully!")
-
-def deploy_agent(agent_file):
-    """Deploy a single agent using the ADK CLI"""
+def agent_files(config):
+    """The agent files of the moderator and every perspective agent"""
+    return [config.moderator.agent_file] + [p.agent_file for p in config.perspectives]
+
+def hash_agent(agent_file):
+    """Get an agent's name and the hash of its resolved spec from the spec bundle"""
+    spec = get_bundle().by_source(current_dir / agent_file)
+    if spec is None:
+        raise SystemExit(f"Agent file not found in the agent spec bundle: {agent_file}")
+    return spec.name, spec.hash
+
+def load_manifest(path=MANIFEST_PATH):
+    """Load the deployment manifest, or an empty one"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    """Write the deployment manifest atomically, through a temp file of its own"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def deploy_agent(agent_file, timeout=600):
+    """Deploy a single agent using the ADK CLI
+
+    Returns:
+        tuple: (success, seconds, output) of the deploy command
+    """
     agent_path = current_dir / agent_file
-    
-    # Load agent YAML to get the name for logging
-    with open(agent_path, 'r') as f:
-        agent_config = yaml.safe_load(f)
-    
-    print(f"Deploying agent: {agent_config['name']}")
-    
+
     # Use the ADK CLI to deploy the agent
     # Replace with actual ADK CLI command syntax
-    os.system(f"wxflows agent deploy --agent-path {agent_path}")
-    
-    print(f"Agent {agent_config['name']} deployed successfully")
+    command = ["wxflows", "agent", "deploy", "--agent-path", str(agent_path)]
+    start = time.perf_counter()
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+        success = result.returncode == 0
+        output = (result.stdout + result.stderr).strip()
+    except (OSError, subprocess.TimeoutExpired) as e:
+        success, output = False, str(e)
+    return success, time.perf_counter() - start, output
+
+def deploy_agents(workers=4, force=False, dry_run=False, manifest_path=MANIFEST_PATH):
+    """Deploy the agents that changed since their last successful deployment
+
+    Args:
+        workers (int): Maximum number of concurrent deployments
+        force (bool): Deploy every agent, changed or not
+        dry_run (bool): Report what would be deployed without deploying
+        manifest_path (Path): Where deployed hashes are recorded
+
+    Returns:
+        bool: True if every deployment succeeded
+    """
+    config = load_config()
+    print(f"Deploying {config.system_name}...")
+
+    manifest = load_manifest(manifest_path)
+    pending = {}
+    summary = []
+    for agent_file in agent_files(config):
+        name, digest = hash_agent(agent_file)
+        if not force and manifest.get(agent_file, {}).get("hash") == digest:
+            summary.append((name, "unchanged", 0.0))
+        else:
+            pending[agent_file] = (name, digest)
+
+    if dry_run:
+        summary += [(name, "would deploy", 0.0) for name, _ in pending.values()]
+        print_summary(summary)
+        return True
+
+    start = time.perf_counter()
+    failures = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(deploy_agent, agent_file): agent_file for agent_file in pending}
+        for future in as_completed(futures):
+            agent_file = futures[future]
+            name, digest = pending[agent_file]
+            success, seconds, output = future.result()
+            if success:
+                print(f"Agent {name} deployed successfully ({seconds:.1f}s)")
+                manifest[agent_file] = {"name": name, "hash": digest, "deployed_at": time.time()}
+                # Record progress as it happens, so an interrupted run is not redone
+                save_manifest(manifest, manifest_path)
+            else:
+                failures += 1
+                print(f"Agent {name} failed to deploy ({seconds:.1f}s): {output}")
+            summary.append((name, "deployed" if success else "failed", seconds))
+
+    print_summary(summary, time.perf_counter() - start)
+    if failures:
+        print(f"{failures} agent(s) failed to deploy")
+    else:
+        print("All agents deployed successfully!")
+    return not failures
+
+def print_summary(summary, elapsed=None):
+    """Print the per-agent deployment timing summary"""
+    print(f"\n{'agent':<32}{'status':<14}{'seconds':>8}")
+    for name, status, seconds in summary:
+        print(f"{name:<32}{status:<14}{seconds:>8.1f}")
+    if elapsed is not None:
+        print(f"{'total (wall clock)':<46}{elapsed:>8.1f}\n")
 
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description="Deploy debate system agents")
     parser.add_argument("--list", action="store_true", help="List available agents without deploying")
+    parser.add_argument("--workers", type=int, default=4, help="Maximum number of concurrent deployments")
+    parser.add_argument("--force", action="store_true", help="Deploy all agents, even unchanged ones")
+    parser.add_argument("--dry-run", action="store_true", help="Show which agents would be deployed")
+    parser.add_argument("--manifest", default=str(MANIFEST_PATH), help="Path of the deployment manifest")
     args = parser.parse_args()
-    
+
     if args.list:
         config = load_config()
-        print(f"Available agents in {config['system_name']}:")
-        print(f"Moderator: {config['agents']['moderator']['name']}")
+        print(f"Available agents in {config.system_name}:")
+        print(f"Moderator: {config.moderator.name}")
         print("Perspective agents:")
-        for i, perspective in enumerate(config['agents']['perspectives'], 1):
-            print(f"  {i}. {perspective['name']} - {perspective['description']}")
-    else:
-        deploy_agents()
+        for i, perspective in enumerate(config.perspectives, 1):
+            print(f"  {i}. {perspective.name} - {perspective.description}")
+    elif not deploy_agents(args.workers, args.force, args.dry_run, args.manifest):
+        raise SystemExit(1)
 
 if __name__ == "__main__":
     main()
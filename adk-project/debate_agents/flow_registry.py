@@ -0,0 +1,196 @@
+"""
+Flow Registry Module
+
+Compiles every debate format, built-in or defined in the JSON configuration,
+into an immutable flow definition once per process. Flows reference these
+shared phase tables instead of building their own lists.
+"""
+
+from collections import namedtuple
+from types import MappingProxyType
+
+from .config_service import get_config_service
+
+FlowDefinition = namedtuple("FlowDefinition", ["name", "description", "phases"])
+
+
+def freeze_phases(phases):
+    """Turn (name, instructions) pairs into an immutable phase table.
+
+    Each phase is a read-only mapping with "name" and "instructions" keys, so
+    it can be shared by every flow using the format.
+    """
+    return tuple(
+        MappingProxyType({"name": name, "instructions": instructions})
+        for name, instructions in phases
+    )
+
+
+STRUCTURED_PHASES = freeze_phases([
+    ("opening_statements", "Each participant presents their initial position on the topic."),
+    ("cross_examination", "Participants question each other's positions and arguments."),
+    ("rebuttal", "Participants respond to criticisms and strengthen their arguments."),
+    ("closing_statements", "Each participant summarizes their position and key arguments."),
+])
+
+ROUNDTABLE_PHASES = freeze_phases([
+    ("introduction", "Moderator introduces the topic and participants."),
+    ("initial_perspectives", "Each participant briefly shares their initial perspective."),
+    ("open_discussion", "Free-flowing discussion moderated to ensure all perspectives are heard."),
+    ("synthesis", "Moderator guides the group toward identifying common ground and key differences."),
+    ("closing_thoughts", "Each participant shares final thoughts on the topic."),
+])
+
+POINT_COUNTERPOINT_PHASES = freeze_phases([
+    ("topic_framing", "Moderator frames the topic and explains the format."),
+    ("position_statements", "Each side presents their initial position in brief statements."),
+    ("point_phase", "First side presents a key point or argument."),
+    ("counterpoint_phase", "Second side responds directly to the point with a counterpoint."),
+    ("clarification", "Brief exchange to clarify positions and address misunderstandings."),
+    ("role_swap", "Sides swap roles, with the second side now presenting a point."),
+    ("summary", "Moderator summarizes the key points and counterpoints discussed."),
+])
+
+BUILTIN_FLOWS = (
+    FlowDefinition(
+        "structured",
+        "A formal debate with clear rules, timed responses, and organized structure.",
+        STRUCTURED_PHASES
+    ),
+    FlowDefinition(
+        "roundtable",
+        "An open discussion format where agents freely contribute perspectives on the topic.",
+        ROUNDTABLE_PHASES
+    ),
+    FlowDefinition(
+        "point_counterpoint",
+        "A back-and-forth format focusing on specific arguments and counter-arguments.",
+        POINT_COUNTERPOINT_PHASES
+    ),
+)
+
+# Instructions for phase names used by the formats in the configuration files
+PHASE_INSTRUCTIONS = {
+    phase["name"]: phase["instructions"]
+    for flow in BUILTIN_FLOWS for phase in flow.phases
+}
+PHASE_INSTRUCTIONS.update({
+    "opening_statement": "Each participant presents their initial position on the topic.",
+    "arguments": "Each participant develops the main arguments for their position.",
+    "rebuttals": "Participants respond to the arguments presented by the other side.",
+    "closing_statement": "Each participant summarizes their position and key arguments.",
+    "proposition_opening": "The proposition presents its case for the motion.",
+    "opposition_opening": "The opposition presents its case against the motion.",
+    "proposition_arguments": "The proposition develops its arguments in detail.",
+    "opposition_arguments": "The opposition develops its arguments in detail.",
+    "audience_questions": "Moderator relays questions from the audience to the speakers.",
+    "proposition_closing": "The proposition summarizes its case.",
+    "opposition_closing": "The opposition summarizes its case.",
+    "audience_vote": "Moderator summarizes the debate and calls the audience vote.",
+    "moderator_introduction": "Moderator introduces the topic, format and speakers.",
+    "expert_presentations": "Each expert presents their perspective on the topic.",
+    "expert_responses": "Experts respond to the audience questions.",
+    "moderator_summary": "Moderator summarizes the key points raised.",
+})
+
+
+def normalize_flow_name(name):
+    """Normalize a format name, so "Oxford Style" is found as "oxford_style"."""
+    return "_".join(name.lower().replace("-", " ").split())
+
+
+def phase_instructions(name):
+    """Get the instructions of a phase, derived from its name if it has none."""
+    return PHASE_INSTRUCTIONS.get(name, name.replace("_", " ").capitalize() + ".")
+
+
+def compile_flows(formats):
+    """Compile the built-in flows and the configured formats.
+
+    A configured format without phases keeps the built-in phases of the same
+    name.
+
+    Args:
+        formats (iterable): FormatEntry objects from the config service, in
+            order of precedence (later formats replace earlier ones).
+
+    Returns:
+        dict: FlowDefinitions keyed by normalized name.
+    """
+    flows = {flow.name: flow for flow in BUILTIN_FLOWS}
+
+    for entry in formats:
+        key = normalize_flow_name(entry.name)
+        builtin = flows.get(key)
+
+        if entry.phases:
+            # Reuse the built-in table when the configured phases match it
+            if builtin is not None and tuple(p["name"] for p in builtin.phases) == entry.phases:
+                phases = builtin.phases
+            else:
+                phases = freeze_phases((phase, phase_instructions(phase)) for phase in entry.phases)
+        elif builtin is not None:
+            phases = builtin.phases
+        else:
+            continue
+
+        description = entry.description or (builtin.description if builtin else f"{entry.name} debate format.")
+        flows[key] = FlowDefinition(key, description, phases)
+
+    return flows
+
+
+class FlowRegistry:
+    """Read-only lookup of compiled flow definitions."""
+
+    def __init__(self, flows):
+        """Initialize the registry.
+
+        Args:
+            flows (dict): FlowDefinitions keyed by normalized name.
+        """
+        self._flows = MappingProxyType(dict(flows))
+
+    @classmethod
+    def from_config(cls, service=None):
+        """Compile a registry from the formats in the configuration files.
+
+        Args:
+            service (ConfigService, optional): Source of the configuration.
+                Defaults to the process-wide config service.
+        """
+        service = service or get_config_service()
+        return cls(compile_flows(service.debate_formats()))
+
+    def get(self, name):
+        """Get a flow definition by name, or None if there is no such format."""
+        return self._flows.get(normalize_flow_name(name))
+
+    def names(self):
+        """Get the normalized names of all formats."""
+        return list(self._flows)
+
+    def __contains__(self, name):
+        return normalize_flow_name(name) in self._flows
+
+    def __len__(self):
+        return len(self._flows)
+
+
+_registry = None
+_registry_sources = None
+
+
+def get_registry():
+    """Get the process-wide registry, compiling it on first use.
+
+    The registry is recompiled when the config service reloads either of the
+    files that define formats.
+    """
+    global _registry, _registry_sources
+    service = get_config_service()
+    system, advanced = service.system_config(), service.advanced_config()
+    if _registry is None or system is not _registry_sources[0] or advanced is not _registry_sources[1]:
+        _registry = FlowRegistry.from_config(service)
+        _registry_sources = (system, advanced)
+    return _registry
@@ -0,0 +1,136 @@
+"""
+Generation Module
+
+Generates the text of one agent turn: the prompt engine assembles the prompt,
+the model comes from the agent's YAML definition, and the shared LLM client
+makes the call. The Watson Orchestrate agent and the core debate agents both
+generate through these functions, blocking or async, so the model lookup and
+the template fallback used when every backend fails live in one place. Turns
+can also be streamed, piece by piece as the backend produces them.
+"""
+
+import logging
+from collections import namedtuple
+
+from .agent_specs import get_bundle
+from .llm_client import BackendError, get_llm_client
+from .prompt_engine import get_prompt_engine
+from .streaming import aiter_chunks, iter_chunks
+
+logger = logging.getLogger(__name__)
+
+
+class TurnRequest(namedtuple("TurnRequest", ["task", "topic", "phase", "history", "fallback"])):
+    """What an agent is asked to generate in one turn.
+
+    Fields:
+        task (str): What the agent is asked to do this turn.
+        topic (str): The topic of the debate.
+        phase (str): The name of the current debate phase.
+        history: The debate so far, in any form render_history takes.
+        fallback (str): Template text returned when every backend fails or
+            has an open circuit, so the debate can go on. None raises instead.
+    """
+
+    __slots__ = ()
+
+
+TurnRequest.__new__.__defaults__ = (None, None, None, None)
+
+
+def agent_model(name):
+    """Get the model named in an agent's YAML definition, or None for the backend default."""
+    spec = get_bundle().get(name)
+    return spec.spec.get("llm") if spec is not None else None
+
+
+def _prepare(name, request):
+    prompt = get_prompt_engine().build(name, request.task, request.topic, request.phase, request.history)
+    return prompt, agent_model(name)
+
+
+def _fall_back(name, request, error):
+    if request.fallback is None:
+        raise error
+    logger.warning("%s fell back to its template: %s", name, error)
+    return request.fallback
+
+
+def generate_turn(name, request):
+    """Generate the text of a turn, blocking the calling thread.
+
+    Args:
+        name (str): The agent's name, as in its YAML definition.
+        request (TurnRequest): What the agent is asked to generate.
+
+    Returns:
+        str: The generated text, or the request's fallback if generation failed.
+
+    Raises:
+        BackendError: If generation fails and the request has no fallback.
+    """
+    prompt, model = _prepare(name, request)
+    try:
+        return get_llm_client().generate_sync(prompt, model=model).text
+    except BackendError as e:
+        return _fall_back(name, request, e)
+
+
+async def agenerate_turn(name, request):
+    """Generate the text of a turn without blocking the event loop.
+
+    Takes the same arguments, and returns and raises the same, as generate_turn.
+    """
+    prompt, model = _prepare(name, request)
+    try:
+        completion = await get_llm_client().generate(prompt, model=model)
+    except BackendError as e:
+        return _fall_back(name, request, e)
+    return completion.text
+
+
+def stream_turn(name, request):
+    """Stream the text of a turn, blocking the calling thread between pieces.
+
+    If generation fails before the first piece, the request's fallback is
+    streamed instead. A failure after it cannot be taken back and is raised.
+
+    Args:
+        name (str): The agent's name, as in its YAML definition.
+        request (TurnRequest): What the agent is asked to generate.
+
+    Yields:
+        str: Consecutive pieces of the text.
+
+    Raises:
+        BackendError: If generation fails and the request has no fallback, or
+            fails after the first piece.
+    """
+    prompt, model = _prepare(name, request)
+    started = False
+    try:
+        for piece in get_llm_client().stream_sync(prompt, model=model):
+            started = True
+            yield piece
+    except BackendError as e:
+        if started:
+            raise
+        yield from iter_chunks(_fall_back(name, request, e))
+
+
+async def astream_turn(name, request):
+    """Stream the text of a turn without blocking the event loop.
+
+    Takes the same arguments, and yields and raises the same, as stream_turn.
+    """
+    prompt, model = _prepare(name, request)
+    started = False
+    try:
+        async for piece in get_llm_client().astream(prompt, model=model):
+            started = True
+            yield piece
+    except BackendError as e:
+        if started:
+            raise
+        async for chunk in aiter_chunks(_fall_back(name, request, e)):
+            yield chunk
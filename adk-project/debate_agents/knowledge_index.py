@@ -0,0 +1,174 @@
+"""
+Knowledge Index Module
+
+In-memory inverted index with BM25 ranking used by the debate knowledge base
+to search topics and perspectives.
+"""
+
+import heapq
+import math
+import re
+from collections import defaultdict
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+STOP_WORDS = frozenset([
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "for", "from",
+    "how", "in", "is", "it", "of", "on", "or", "should", "than", "that",
+    "the", "their", "this", "to", "with"
+])
+
+
+def tokenize(text):
+    """Split text into normalized index terms.
+
+    Terms are lowercased, stop words are dropped and plural endings are
+    folded so "regulations" and "regulation" match.
+
+    Args:
+        text (str): The text to tokenize.
+
+    Returns:
+        list: The index terms in order of appearance.
+    """
+    terms = []
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        if token in STOP_WORDS:
+            continue
+        if len(token) > 4 and token.endswith("ies"):
+            token = token[:-3] + "y"
+        elif len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        terms.append(token)
+    return terms
+
+
+def _trigrams(term):
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class KnowledgeIndex:
+    """Inverted index over documents, ranked with Okapi BM25."""
+
+    def __init__(self, k1=1.2, b=0.75, fuzzy_threshold=0.5):
+        """Initialize an empty index.
+
+        Args:
+            k1 (float): BM25 term frequency saturation.
+            b (float): BM25 document length normalization.
+            fuzzy_threshold (float): Minimum trigram similarity for a query
+                term missing from the vocabulary to match an indexed term.
+        """
+        self.k1 = k1
+        self.b = b
+        self.fuzzy_threshold = fuzzy_threshold
+        self._postings = defaultdict(dict)   # term -> {doc_id: term frequency}
+        self._doc_terms = {}                 # doc_id -> {term: term frequency}
+        self._doc_lengths = {}
+        self._total_length = 0
+        self._trigram_terms = defaultdict(set)
+
+    def __len__(self):
+        return len(self._doc_terms)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._doc_terms
+
+    def add_document(self, doc_id, text):
+        """Add a document to the index, replacing any document with the same id.
+
+        Args:
+            doc_id: A hashable document identifier.
+            text (str): The document text.
+        """
+        if doc_id in self._doc_terms:
+            self.remove_document(doc_id)
+
+        counts = defaultdict(int)
+        terms = tokenize(text)
+        for term in terms:
+            counts[term] += 1
+
+        for term, count in counts.items():
+            if term not in self._postings:
+                for gram in _trigrams(term):
+                    self._trigram_terms[gram].add(term)
+            self._postings[term][doc_id] = count
+
+        self._doc_terms[doc_id] = dict(counts)
+        self._doc_lengths[doc_id] = len(terms)
+        self._total_length += len(terms)
+
+    def remove_document(self, doc_id):
+        """Remove a document from the index.
+
+        Args:
+            doc_id: The identifier of the document to remove.
+
+        Returns:
+            bool: True if the document was indexed.
+        """
+        counts = self._doc_terms.pop(doc_id, None)
+        if counts is None:
+            return False
+
+        for term in counts:
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                for gram in _trigrams(term):
+                    self._trigram_terms[gram].discard(term)
+                    if not self._trigram_terms[gram]:
+                        del self._trigram_terms[gram]
+
+        self._total_length -= self._doc_lengths.pop(doc_id)
+        return True
+
+    def _expand_term(self, term):
+        """Map a query term to (indexed term, weight) pairs."""
+        if term in self._postings:
+            return [(term, 1.0)]
+
+        grams = _trigrams(term)
+        shared = defaultdict(int)
+        for gram in grams:
+            for candidate in self._trigram_terms.get(gram, ()):
+                shared[candidate] += 1
+
+        matches = []
+        for candidate, count in shared.items():
+            similarity = count / len(grams | _trigrams(candidate))
+            if similarity >= self.fuzzy_threshold:
+                matches.append((candidate, similarity))
+        return matches
+
+    def search(self, query, limit=10):
+        """Rank documents against a query.
+
+        Query terms missing from the vocabulary are matched against similar
+        indexed terms, with their score scaled by the similarity.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results.
+
+        Returns:
+            list: (doc_id, score) pairs, best match first.
+        """
+        doc_count = len(self._doc_terms)
+        if not doc_count:
+            return []
+
+        avg_length = self._total_length / doc_count
+        scores = defaultdict(float)
+        for query_term in set(tokenize(query)):
+            for term, weight in self._expand_term(query_term):
+                postings = self._postings[term]
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, tf in postings.items():
+                    norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[doc_id] / avg_length)
+                    scores[doc_id] += weight * idf * tf * (self.k1 + 1) / (tf + norm)
+
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
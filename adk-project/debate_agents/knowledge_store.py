@@ -0,0 +1,284 @@
+#!/usr/bin/env python
+"""
+Knowledge Store Module
+
+Compact on-disk format for debate topics that workers memory-map read-only,
+so a large corpus is shared between processes instead of being loaded into
+each one as Python objects.
+
+File layout (all integers little-endian):
+
+    header        magic, version and the offset/count of each section
+    strings       u64 offsets[n + 1] followed by the UTF-8 blob
+    topics        (key, name, description, first perspective, count) u32 records
+    perspectives  (key, position, first point, count) u32 records
+    points        u32 string ids of each key point
+    topic index   u32 topic ids sorted by the UTF-8 bytes of their keys
+
+Keys are lowercased names, so lookups are case-insensitive like
+DebateKnowledgeBase, which serves its lookups from a store when given one.
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+
+from .session_log import _fsync_directory
+
+MAGIC = b"DKB1"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sI" + "QQ" * 5)
+_OFFSET = struct.Struct("<Q")
+_TOPIC = struct.Struct("<IIIII")
+_PERSPECTIVE = struct.Struct("<IIII")
+_ID = struct.Struct("<I")
+
+
+def load_topic_files(paths):
+    """Load topic records from JSON or YAML files.
+
+    Each file holds either a list of topics or a mapping with a "topics" list,
+    using the same shape as SAMPLE_TOPICS.
+
+    Args:
+        paths (list): Paths of the topic files.
+
+    Returns:
+        list: The topic records from all files, in order.
+    """
+    topics = []
+    for path in paths:
+        path = Path(path)
+        with open(path, 'r') as f:
+            if path.suffix.lower() in (".yaml", ".yml"):
+                import yaml
+                data = yaml.safe_load(f)
+            else:
+                data = json.load(f)
+        topics.extend(data["topics"] if isinstance(data, dict) else data)
+    return topics
+
+
+def build_store(topics, path):
+    """Write topics to a knowledge store file.
+
+    The file is written to a uniquely named temporary file next to its
+    destination, fsynced and renamed into place, so workers never map a
+    partially written store and concurrent builds do not clobber each other.
+
+    Args:
+        topics (list): Topic records in the SAMPLE_TOPICS shape.
+        path (str): Destination path of the store.
+
+    Returns:
+        dict: Counts of the topics, perspectives and key points written.
+    """
+    strings = {}
+
+    def intern(text):
+        return strings.setdefault(text, len(strings))
+
+    topic_records, perspective_records, point_ids, keys = [], [], [], {}
+    for topic in topics:
+        key = topic["topic"].lower()
+        if key in keys:
+            raise ValueError(f"Duplicate topic: {topic['topic']}")
+        keys[key] = len(topic_records)
+
+        perspectives = topic.get("perspectives", [])
+        topic_records.append((
+            intern(key), intern(topic["topic"]), intern(topic.get("description", "")),
+            len(perspective_records), len(perspectives)
+        ))
+        for perspective in perspectives:
+            points = perspective.get("key_points", [])
+            perspective_records.append((
+                intern(perspective["position"].lower()), intern(perspective["position"]),
+                len(point_ids), len(points)
+            ))
+            point_ids.extend(intern(point) for point in points)
+
+    encoded = [text.encode("utf-8") for text in strings]
+    string_offsets = [0]
+    for data in encoded:
+        string_offsets.append(string_offsets[-1] + len(data))
+
+    topic_keys = list(keys)
+    topic_index = sorted(range(len(topic_records)), key=lambda i: topic_keys[i].encode("utf-8"))
+
+    sections = [
+        b"".join(_OFFSET.pack(offset) for offset in string_offsets) + b"".join(encoded),
+        b"".join(_TOPIC.pack(*record) for record in topic_records),
+        b"".join(_PERSPECTIVE.pack(*record) for record in perspective_records),
+        b"".join(_ID.pack(i) for i in point_ids),
+        b"".join(_ID.pack(i) for i in topic_index),
+    ]
+    counts = [len(strings), len(topic_records), len(perspective_records), len(point_ids), len(topic_index)]
+
+    layout = []
+    offset = _HEADER.size
+    for section, count in zip(sections, counts):
+        layout.extend((offset, count))
+        offset += len(section)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, *layout))
+            for section in sections:
+                f.write(section)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    _fsync_directory(directory)
+
+    return {"topics": counts[1], "perspectives": counts[2], "key_points": counts[3]}
+
+
+class MappedKnowledgeBase:
+    """Read-only, memory-mapped view of a knowledge store file.
+
+    Provides the lookup methods of DebateKnowledgeBase. Opening only maps the
+    file; pages are read on demand and shared by every process mapping it.
+    """
+
+    def __init__(self, path):
+        """Open a knowledge store.
+
+        Args:
+            path (str): Path of a file written by build_store.
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header = _HEADER.unpack_from(self._map, 0)
+        if header[0] != MAGIC or header[1] != VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {VERSION} knowledge store")
+
+        (self._strings_at, self._string_count,
+         self._topics_at, self._topic_count,
+         self._perspectives_at, self._perspective_count,
+         self._points_at, _,
+         self._index_at, _) = header[2:]
+        self._blob_at = self._strings_at + (self._string_count + 1) * _OFFSET.size
+
+    def close(self):
+        """Unmap the store."""
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._topic_count
+
+    def _string_bytes(self, string_id):
+        start, end = struct.unpack_from("<QQ", self._map, self._strings_at + string_id * _OFFSET.size)
+        return self._map[self._blob_at + start:self._blob_at + end]
+
+    def _string(self, string_id):
+        return self._string_bytes(string_id).decode("utf-8")
+
+    def _topic(self, topic_id):
+        return _TOPIC.unpack_from(self._map, self._topics_at + topic_id * _TOPIC.size)
+
+    def _perspective(self, perspective_id):
+        return _PERSPECTIVE.unpack_from(self._map, self._perspectives_at + perspective_id * _PERSPECTIVE.size)
+
+    def _find_topic(self, topic_name):
+        """Binary search the topic index for a topic id."""
+        target = topic_name.lower().encode("utf-8")
+        low, high = 0, self._topic_count
+        while low < high:
+            mid = (low + high) // 2
+            topic_id = _ID.unpack_from(self._map, self._index_at + mid * _ID.size)[0]
+            key = self._string_bytes(self._topic(topic_id)[0])
+            if key == target:
+                return topic_id
+            if key < target:
+                low = mid + 1
+            else:
+                high = mid
+        return None
+
+    def _perspective_dict(self, perspective_id):
+        _, position, first_point, point_count = self._perspective(perspective_id)
+        return {
+            "position": self._string(position),
+            "key_points": [
+                self._string(_ID.unpack_from(self._map, self._points_at + (first_point + i) * _ID.size)[0])
+                for i in range(point_count)
+            ]
+        }
+
+    def get_topic_information(self, topic_name):
+        """Retrieve information about a specific debate topic."""
+        topic_id = self._find_topic(topic_name)
+        if topic_id is None:
+            return None
+
+        _, name, description, first, count = self._topic(topic_id)
+        return {
+            "topic": self._string(name),
+            "description": self._string(description),
+            "perspectives": [self._perspective_dict(first + i) for i in range(count)]
+        }
+
+    def get_available_topics(self):
+        """Get a list of available debate topics."""
+        return [self._string(self._topic(i)[1]) for i in range(self._topic_count)]
+
+    def get_perspective(self, topic_name, position):
+        """Get information about a specific perspective on a topic."""
+        topic_id = self._find_topic(topic_name)
+        if topic_id is None:
+            return None
+
+        target = position.lower().encode("utf-8")
+        _, _, _, first, count = self._topic(topic_id)
+        for perspective_id in range(first, first + count):
+            if self._string_bytes(self._perspective(perspective_id)[0]) == target:
+                return self._perspective_dict(perspective_id)
+        return None
+
+
+def main():
+    """Build a knowledge store from topic files."""
+    parser = argparse.ArgumentParser(description="Manage debate knowledge store files.")
+    subparsers = parser.add_subparsers(dest="command", help="Command to execute")
+
+    build_parser = subparsers.add_parser("build", help="Build a store from JSON/YAML topic files")
+    build_parser.add_argument("output", help="Path of the store to write")
+    build_parser.add_argument("sources", nargs="*", help="Topic files (defaults to the sample topics)")
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        if args.sources:
+            topics = load_topic_files(args.sources)
+        else:
+            from .debate_knowledge import SAMPLE_TOPICS
+            topics = SAMPLE_TOPICS
+        counts = build_store(topics, args.output)
+        print(f"Wrote {counts['topics']} topics, {counts['perspectives']} perspectives "
+              f"and {counts['key_points']} key points to {args.output}")
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,846 @@
+"""
+LLM Client Module
+
+Shared client for the model backends behind the agents' generation methods.
+
+Every backend in llm_config.json is created once per process and keeps one
+pool of keep-alive connections, with limits on connections and on concurrent
+requests per host, so pool sizes are tuned in one place instead of in each
+agent. The pools live on an event loop owned by the client on a background
+thread; async callers on any loop and sync callers on any thread share them.
+
+Identical requests in flight at the same time are sent once, and backends
+with a configured rate are called through an adaptive rate limiter that backs
+off on 429 answers. A request still unanswered after the backend's recent
+p95 latency is hedged with a duplicate, and the first answer wins; a hedge
+budget keeps duplicates to a fixed share of calls. A circuit
+breaker per backend fails fast while the backend keeps failing, sending calls
+to its configured fallback backend and model instead; see request_control.
+
+Completions can also be streamed as the backend produces them: backends
+with a streaming endpoint are read piece by piece, and the stream is handed
+from the client's loop to the caller's as each piece arrives.
+
+The "fake" backend kind answers in-process with a deterministic reply derived
+from the prompt, for tests and benchmarks.
+"""
+
+import asyncio
+import atexit
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque, namedtuple
+
+from .config_service import get_config_service
+from .debate_history import estimate_tokens
+from .request_control import AdaptiveRateLimiter, CircuitBreaker, LatencyHistogram, SingleFlight
+from .streaming import iter_chunks
+
+Completion = namedtuple("Completion", [
+    "text", "model", "backend", "latency", "prompt_tokens", "completion_tokens"
+])
+
+# Hedges a client may send back to back before its hedge budget applies
+HEDGE_BURST = 10
+
+
+class BackendError(RuntimeError):
+    """A backend failed, timed out or refused a request."""
+
+    def __init__(self, backend, message, status=None, retry_after=None):
+        """Initialize the error.
+
+        Args:
+            backend (str): The name of the backend.
+            message (str): What went wrong.
+            status (int, optional): The HTTP status of the response, if any.
+            retry_after (float, optional): Seconds the backend asked us to wait.
+        """
+        super().__init__(f"{backend}: {message}")
+        self.backend = backend
+        self.status = status
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(BackendError):
+    """A backend's circuit is open and it has no fallback."""
+
+
+def prompt_text(prompt):
+    """Get the text of a prompt given as a string or an assembled Prompt."""
+    return prompt if isinstance(prompt, str) else prompt.text
+
+
+class Backend:
+    """Base class of model backends, limiting concurrent requests."""
+
+    def __init__(self, name, max_concurrency=100):
+        """Initialize the backend.
+
+        Args:
+            name (str): The name of the backend.
+            max_concurrency (int): Maximum number of requests in flight.
+        """
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self._semaphore = None
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.latencies = LatencyHistogram()
+
+    async def generate(self, prompt, model=None, max_tokens=512):
+        """Generate a completion of a prompt.
+
+        Args:
+            prompt (str): The full prompt text.
+            model (str, optional): The model to use; None for the backend default.
+            max_tokens (int): Maximum tokens to generate.
+
+        Returns:
+            Completion: The generated text and its timing.
+
+        Raises:
+            BackendError: If the backend fails.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            start = time.perf_counter()
+            try:
+                text = await self._generate(prompt, model, max_tokens)
+            except BackendError:
+                self.errors += 1
+                raise
+            finally:
+                self.in_flight -= 1
+            latency = time.perf_counter() - start
+            self.latencies.record(latency)
+        return Completion(text, model, self.name, latency, estimate_tokens(prompt), estimate_tokens(text))
+
+    async def _generate(self, prompt, model, max_tokens):
+        raise NotImplementedError
+
+    async def stream(self, prompt, model=None, max_tokens=512):
+        """Generate a completion of a prompt, yielding its text as it arrives.
+
+        Takes the same arguments as generate.
+
+        Yields:
+            str: Consecutive pieces of the generated text.
+
+        Raises:
+            BackendError: If the backend fails, possibly after some pieces.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            start = time.perf_counter()
+            try:
+                async for piece in self._stream(prompt, model, max_tokens):
+                    yield piece
+            except BackendError:
+                self.errors += 1
+                raise
+            finally:
+                self.in_flight -= 1
+            self.latencies.record(time.perf_counter() - start)
+
+    async def _stream(self, prompt, model, max_tokens):
+        # Backends without a streaming endpoint deliver the whole text at once
+        yield await self._generate(prompt, model, max_tokens)
+
+    async def close(self):
+        """Release the backend's connections."""
+
+    def stats(self):
+        """Get the backend's request counters and recent latency percentiles."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "latency": self.latencies.snapshot()
+        }
+
+
+def _retry_after(headers):
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+class HTTPBackend(Backend):
+    """Backend serving an OpenAI-compatible completions endpoint over aiohttp."""
+
+    def __init__(self, name, base_url, path="/v1/completions", api_key=None, limit=100,
+                 limit_per_host=100, keepalive_timeout=60, timeout=60):
+        """Initialize the backend. The connection pool is created on first use.
+
+        Args:
+            name (str): The name of the backend.
+            base_url (str): Scheme, host and port of the server.
+            path (str): Path of the completions endpoint.
+            api_key (str, optional): Bearer token sent with every request.
+            limit (int): Maximum number of open connections.
+            limit_per_host (int): Maximum connections, and requests in flight,
+                per host.
+            keepalive_timeout (float): Seconds an idle connection is kept open.
+            timeout (float): Seconds allowed for a whole request.
+        """
+        super().__init__(name, limit_per_host)
+        self.url = base_url.rstrip("/") + path
+        self.api_key = api_key
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self._session = None
+
+    def _get_session(self):
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit, limit_per_host=self.limit_per_host, keepalive_timeout=self.keepalive_timeout
+            )
+            headers = {"Content-Type": "application/json"}
+            if self.api_key:
+                headers["Authorization"] = f"Bearer {self.api_key}"
+            self._session = aiohttp.ClientSession(
+                connector=connector, headers=headers, timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    async def _generate(self, prompt, model, max_tokens):
+        import aiohttp
+
+        payload = {"prompt": prompt, "max_tokens": max_tokens}
+        if model:
+            payload["model"] = model
+        try:
+            async with self._get_session().post(self.url, json=payload) as response:
+                if response.status != 200:
+                    body = await response.text()
+                    raise BackendError(
+                        self.name, f"HTTP {response.status}: {body[:200]}",
+                        response.status, _retry_after(response.headers)
+                    )
+                data = await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            raise BackendError(self.name, str(e) or type(e).__name__) from e
+        try:
+            return data["choices"][0]["text"]
+        except (KeyError, IndexError, TypeError) as e:
+            raise BackendError(self.name, f"Unexpected response: {str(data)[:200]}") from e
+
+    async def _stream(self, prompt, model, max_tokens):
+        import aiohttp
+
+        payload = {"prompt": prompt, "max_tokens": max_tokens, "stream": True}
+        if model:
+            payload["model"] = model
+        try:
+            async with self._get_session().post(self.url, json=payload) as response:
+                if response.status != 200:
+                    body = await response.text()
+                    raise BackendError(
+                        self.name, f"HTTP {response.status}: {body[:200]}",
+                        response.status, _retry_after(response.headers)
+                    )
+                # Server-sent events, one "data:" line per piece
+                async for line in response.content:
+                    line = line.decode("utf-8").strip()
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        return
+                    try:
+                        piece = json.loads(data)["choices"][0]["text"]
+                    except (KeyError, IndexError, TypeError) as e:
+                        raise BackendError(self.name, f"Unexpected event: {data[:200]}") from e
+                    if piece:
+                        yield piece
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            raise BackendError(self.name, str(e) or type(e).__name__) from e
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+def fake_reply(prompt, model, max_tokens):
+    """Deterministic reply to a prompt: its task line and a digest of the prompt."""
+    task = prompt.rsplit("Task: ", 1)[-1].strip().splitlines()[0] if prompt.strip() else ""
+    digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8]
+    return f"[{model or 'fake'} {digest}] Response to: {task}"[:max_tokens * 4]
+
+
+class FakeBackend(Backend):
+    """In-process backend with deterministic replies, for tests and benchmarks."""
+
+    def __init__(self, name="fake", latency=0.0, max_concurrency=100, reply=fake_reply, quota=None,
+                 clock=time.monotonic):
+        """Initialize the backend.
+
+        Args:
+            name (str): The name of the backend.
+            latency (float or callable): Seconds each request takes, or a
+                function of the prompt returning them.
+            max_concurrency (int): Maximum number of requests in flight.
+            reply (callable): Function of the prompt, model and max_tokens
+                returning the reply text.
+            quota (int, optional): Requests accepted per second; further
+                requests are refused with a 429, as a rate-limited server would.
+            clock (callable): Monotonic time source for the quota.
+        """
+        super().__init__(name, max_concurrency)
+        self.latency = latency
+        self.reply = reply
+        self.quota = quota
+        self.clock = clock
+        self._accepted = deque()
+
+    def _check_quota(self):
+        now = self.clock()
+        while self._accepted and now - self._accepted[0] >= 1.0:
+            self._accepted.popleft()
+        if len(self._accepted) >= self.quota:
+            # With a quota of 0 nothing was ever accepted; retry in a second
+            retry_after = 1.0 - (now - self._accepted[0]) if self._accepted else 1.0
+            raise BackendError(self.name, "HTTP 429: rate limit exceeded", 429, retry_after)
+        self._accepted.append(now)
+
+    async def _generate(self, prompt, model, max_tokens):
+        if self.quota is not None:
+            self._check_quota()
+        latency = self.latency(prompt) if callable(self.latency) else self.latency
+        await asyncio.sleep(latency)
+        return self.reply(prompt, model, max_tokens)
+
+    async def _stream(self, prompt, model, max_tokens):
+        if self.quota is not None:
+            self._check_quota()
+        latency = self.latency(prompt) if callable(self.latency) else self.latency
+        pieces = list(iter_chunks(self.reply(prompt, model, max_tokens)))
+        # The latency is spread over the pieces, as a server generating them would
+        for piece in pieces:
+            await asyncio.sleep(latency / len(pieces))
+            yield piece
+
+
+def create_limiter(entry):
+    """Create the rate limiter of a BackendEntry, or None if it has no rate."""
+    if entry.rate is None:
+        return None
+    return AdaptiveRateLimiter(entry.rate, entry.burst, latency_target=entry.latency_target)
+
+
+def create_breaker(config):
+    """Create a circuit breaker with the settings of an LLMConfig."""
+    return CircuitBreaker(
+        config.breaker_failure_rate, config.breaker_window, max(1, config.breaker_window // 2),
+        config.breaker_open_seconds, config.slow_call
+    )
+
+
+def create_backend(entry):
+    """Create a backend from a BackendEntry of the LLM configuration."""
+    if entry.kind == "fake":
+        return FakeBackend(entry.name, entry.latency, entry.limit_per_host)
+    return HTTPBackend(
+        entry.name, entry.base_url, entry.path,
+        os.getenv(entry.api_key_env) if entry.api_key_env else None,
+        entry.limit, entry.limit_per_host, entry.keepalive_timeout, entry.timeout
+    )
+
+
+def _running_loop():
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class LLMClient:
+    """Process-wide entry point for model calls, routing them to the backends."""
+
+    def __init__(self, backends, default_backend, max_tokens=512, limiters=None, coalesce=True, max_retries=2,
+                 breakers=None, fallbacks=None, hedge_percentile=95, hedge_min_samples=20, hedge_min_delay=0.05,
+                 hedge_budget=0.1):
+        """Initialize the client. Its event loop thread starts on first use.
+
+        Args:
+            backends (dict): Backends keyed by name.
+            default_backend (str): The backend used when a call names none.
+            max_tokens (int): Default maximum tokens to generate.
+            limiters (dict, optional): AdaptiveRateLimiters keyed by backend
+                name. Backends without one are not rate limited.
+            coalesce (bool): Send identical concurrent requests once.
+            max_retries (int): Times a request refused with a 429 is retried
+                after waiting for the rate limiter.
+            breakers (dict, optional): CircuitBreakers keyed by backend name.
+                Backends without one are always called.
+            fallbacks (dict, optional): (backend name, model) pairs keyed by
+                backend name, used when the backend's circuit is open or its
+                call fails. A None model keeps the requested one.
+            hedge_percentile (float, optional): Latency percentile of a backend
+                after which a duplicate request is sent. None disables hedging.
+            hedge_min_samples (int): Latency samples a backend needs before its
+                requests are hedged.
+            hedge_min_delay (float): Minimum seconds before hedging.
+            hedge_budget (float): Largest share of calls that may be hedged,
+                after a burst of HEDGE_BURST hedges. When a backend slows down
+                for every call, this keeps hedging from doubling its load.
+        """
+        self.backends = dict(backends)
+        self.default_backend = default_backend
+        self.max_tokens = max_tokens
+        self.limiters = dict(limiters or {})
+        self.single_flight = SingleFlight() if coalesce else None
+        self.max_retries = max_retries
+        self.breakers = dict(breakers or {})
+        self.fallbacks = dict(fallbacks or {})
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_budget = hedge_budget
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.hedges_over_budget = 0
+        # Every call earns hedge_budget tokens and every hedge spends one
+        self._hedge_tokens = float(HEDGE_BURST)
+        self.fallback_calls = 0
+        # backend name -> (time the delay is recomputed, hedging delay or None)
+        self._hedge_delays = {}
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config=None):
+        """Create a client with the backends of an LLMConfig.
+
+        Args:
+            config (LLMConfig, optional): Defaults to llm_config.json from the
+                process-wide config service.
+        """
+        config = config or get_config_service().llm_config()
+        backends = {name: create_backend(entry) for name, entry in config.backends.items()}
+        limiters = {name: create_limiter(entry) for name, entry in config.backends.items() if entry.rate is not None}
+        breakers = {name: create_breaker(config) for name in config.backends}
+        fallbacks = {
+            name: (entry.fallback, entry.fallback_model)
+            for name, entry in config.backends.items() if entry.fallback is not None
+        }
+        return cls(
+            backends, config.default_backend, config.max_tokens, limiters, config.coalesce, config.max_retries,
+            breakers, fallbacks, config.hedge_percentile if config.hedge else None,
+            config.hedge_min_samples, config.hedge_min_delay, config.hedge_budget
+        )
+
+    def _ensure_loop(self):
+        if self._loop is None:
+            with self._lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    thread = threading.Thread(target=loop.run_forever, name="llm-client", daemon=True)
+                    thread.start()
+                    self._thread = thread
+                    self._loop = loop
+        return self._loop
+
+    def backend(self, name=None):
+        """Get a backend by name, or the default backend."""
+        name = name or self.default_backend
+        try:
+            return self.backends[name]
+        except KeyError:
+            raise ValueError(f"Unknown LLM backend: {name}") from None
+
+    async def _call(self, target, text, model, max_tokens):
+        limiter = self.limiters.get(target.name)
+        if limiter is None:
+            return await target.generate(text, model, max_tokens)
+        for attempt in range(self.max_retries + 1):
+            await limiter.acquire()
+            try:
+                completion = await target.generate(text, model, max_tokens)
+            except BackendError as e:
+                if e.status != 429:
+                    raise
+                limiter.on_throttle(e.retry_after)
+                if attempt == self.max_retries:
+                    raise
+            else:
+                limiter.on_success(completion.latency)
+                return completion
+
+    def _hedge_delay(self, target):
+        # Recomputed at most once a second, so percentiles stay off the hot path
+        now = time.monotonic()
+        cached = self._hedge_delays.get(target.name)
+        if cached is not None and now < cached[0]:
+            return cached[1]
+        delay = None
+        if target.latencies.count() >= self.hedge_min_samples:
+            delay = max(self.hedge_min_delay, target.latencies.percentile(self.hedge_percentile))
+        self._hedge_delays[target.name] = (now + 1.0, delay)
+        return delay
+
+    async def _hedged_call(self, target, text, model, max_tokens, hedge=True):
+        """Call a backend, sending a duplicate if the first call is slow.
+
+        The duplicate is sent once the call has taken longer than the
+        backend's hedging percentile, if the hedge budget allows; whichever
+        answers first wins and the other is cancelled. A cancelled first call
+        records the time it had taken, a lower bound on its latency, so the
+        percentile is not left with only the fast answers.
+        """
+        delay = self._hedge_delay(target) if hedge and self.hedge_percentile is not None else None
+        if delay is None:
+            return await self._call(target, text, model, max_tokens)
+        self._hedge_tokens = min(HEDGE_BURST, self._hedge_tokens + self.hedge_budget)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        winner = loop.create_future()
+        tasks = []
+
+        def settle(task):
+            if task.cancelled():
+                return
+            error = task.exception()
+            if winner.done():
+                return
+            if error is None:
+                if task is not tasks[0]:
+                    self.hedge_wins += 1
+                winner.set_result(task.result())
+            elif all(t.done() for t in tasks):
+                timer.cancel()
+                winner.set_exception(error)
+
+        def launch():
+            task = asyncio.ensure_future(self._call(target, text, model, max_tokens))
+            tasks.append(task)
+            task.add_done_callback(settle)
+
+        def hedge_request():
+            if self._hedge_tokens < 1.0:
+                self.hedges_over_budget += 1
+                return
+            self._hedge_tokens -= 1.0
+            self.hedged += 1
+            launch()
+
+        # A timer rather than asyncio.wait keeps the common, fast case cheap
+        launch()
+        timer = loop.call_later(delay, hedge_request)
+        try:
+            return await winner
+        finally:
+            timer.cancel()
+            if len(tasks) > 1 and not tasks[0].done():
+                target.latencies.record(loop.time() - start)
+            for task in tasks:
+                task.cancel()
+
+    async def _routed_call(self, target, text, model, max_tokens):
+        """Call a backend, falling back along its fallback chain while it is failing.
+
+        Each call's outcome is recorded in the backend's circuit breaker.
+        """
+        tried = set()
+        while True:
+            tried.add(target.name)
+            breaker = self.breakers.get(target.name)
+            if breaker is None:
+                try:
+                    return await self._hedged_call(target, text, model, max_tokens)
+                except BackendError as e:
+                    error = e
+            elif breaker.allow():
+                # A half-open circuit is probed with a single request
+                hedge = breaker.state == breaker.CLOSED
+                start = time.perf_counter()
+                try:
+                    completion = await self._hedged_call(target, text, model, max_tokens, hedge)
+                except asyncio.CancelledError:
+                    breaker.release()
+                    raise
+                except Exception as e:
+                    breaker.record(False)
+                    if not isinstance(e, BackendError):
+                        raise
+                    error = e
+                else:
+                    breaker.record(True, time.perf_counter() - start)
+                    return completion
+            else:
+                error = CircuitOpenError(target.name, "circuit open")
+
+            fallback = self.fallbacks.get(target.name)
+            if fallback is None or fallback[0] in tried:
+                raise error
+            self.fallback_calls += 1
+            target, model = self.backend(fallback[0]), fallback[1] or model
+
+    async def _limited_stream(self, target, text, model, max_tokens):
+        """Stream from a backend through its rate limiter, as _call does.
+
+        A 429 is only retried before the first piece has been yielded.
+        """
+        limiter = self.limiters.get(target.name)
+        if limiter is None:
+            async for piece in target.stream(text, model, max_tokens):
+                yield piece
+            return
+        for attempt in range(self.max_retries + 1):
+            await limiter.acquire()
+            start = time.perf_counter()
+            started = False
+            try:
+                async for piece in target.stream(text, model, max_tokens):
+                    started = True
+                    yield piece
+            except BackendError as e:
+                if e.status != 429 or started:
+                    raise
+                limiter.on_throttle(e.retry_after)
+                if attempt == self.max_retries:
+                    raise
+            else:
+                limiter.on_success(time.perf_counter() - start)
+                return
+
+    async def _routed_stream(self, prompt, model, backend, max_tokens):
+        """Stream a completion, falling back as _routed_call does until the first piece.
+
+        Streams are neither hedged nor coalesced: each caller reads its own.
+        """
+        target = self.backend(backend)
+        text = prompt_text(prompt)
+        max_tokens = max_tokens or self.max_tokens
+        tried = set()
+        while True:
+            tried.add(target.name)
+            breaker = self.breakers.get(target.name)
+            if breaker is not None and not breaker.allow():
+                error = CircuitOpenError(target.name, "circuit open")
+            else:
+                start = time.perf_counter()
+                started = False
+                try:
+                    async for piece in self._limited_stream(target, text, model, max_tokens):
+                        started = True
+                        yield piece
+                except (asyncio.CancelledError, GeneratorExit):
+                    if breaker is not None:
+                        breaker.release()
+                    raise
+                except Exception as e:
+                    if breaker is not None:
+                        breaker.record(False)
+                    if started or not isinstance(e, BackendError):
+                        raise
+                    error = e
+                else:
+                    if breaker is not None:
+                        breaker.record(True, time.perf_counter() - start)
+                    return
+
+            fallback = self.fallbacks.get(target.name)
+            if fallback is None or fallback[0] in tried:
+                raise error
+            self.fallback_calls += 1
+            target, model = self.backend(fallback[0]), fallback[1] or model
+
+    @staticmethod
+    async def _pump(stream, put):
+        """Read a stream on the client's loop, passing (piece, error) pairs to put.
+
+        The end of the stream is marked by (None, None).
+        """
+        try:
+            async for piece in stream:
+                put((piece, None))
+        except Exception as e:
+            put((None, e))
+        else:
+            put((None, None))
+
+    async def _generate(self, prompt, model, backend, max_tokens):
+        target = self.backend(backend)
+        text = prompt_text(prompt)
+        max_tokens = max_tokens or self.max_tokens
+        if self.single_flight is None:
+            return await self._routed_call(target, text, model, max_tokens)
+        return await self.single_flight.do(
+            (target.name, model, max_tokens, text), lambda: self._routed_call(target, text, model, max_tokens)
+        )
+
+    async def generate(self, prompt, model=None, backend=None, max_tokens=None):
+        """Generate a completion from any event loop.
+
+        Args:
+            prompt (str or Prompt): The prompt.
+            model (str, optional): The model to use; None for the backend default.
+            backend (str, optional): The backend to use; None for the default.
+            max_tokens (int, optional): Maximum tokens to generate.
+
+        Returns:
+            Completion: The generated text and its timing.
+
+        Raises:
+            BackendError: If the backend fails.
+        """
+        loop = self._ensure_loop()
+        coroutine = self._generate(prompt, model, backend, max_tokens)
+        if _running_loop() is loop:
+            return await coroutine
+        # Cancelling the caller cancels the request on the client's loop
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coroutine, loop))
+
+    def generate_sync(self, prompt, model=None, backend=None, max_tokens=None):
+        """Generate a completion, blocking the calling thread until it is done.
+
+        Takes the same arguments as generate. Must not be called from the
+        client's own event loop.
+        """
+        loop = self._ensure_loop()
+        if _running_loop() is loop:
+            raise RuntimeError("generate_sync cannot be called from the LLM client's event loop")
+        coroutine = self._generate(prompt, model, backend, max_tokens)
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    async def astream(self, prompt, model=None, backend=None, max_tokens=None):
+        """Stream a completion from any event loop.
+
+        Takes the same arguments as generate.
+
+        Yields:
+            str: Consecutive pieces of the generated text, as the backend
+            produces them.
+
+        Raises:
+            BackendError: If the backend fails. Before the first piece the
+            backend's fallback is tried, as in generate.
+        """
+        loop = self._ensure_loop()
+        stream = self._routed_stream(prompt, model, backend, max_tokens)
+        if _running_loop() is loop:
+            async for piece in stream:
+                yield piece
+            return
+
+        caller = asyncio.get_running_loop()
+        pieces = asyncio.Queue()
+        pump = asyncio.run_coroutine_threadsafe(
+            self._pump(stream, lambda item: caller.call_soon_threadsafe(pieces.put_nowait, item)), loop
+        )
+        try:
+            while True:
+                piece, error = await pieces.get()
+                if error is not None:
+                    raise error
+                if piece is None:
+                    return
+                yield piece
+        finally:
+            # Stops the request if the caller stopped reading early
+            pump.cancel()
+
+    def stream_sync(self, prompt, model=None, backend=None, max_tokens=None):
+        """Stream a completion, blocking the calling thread between pieces.
+
+        Takes the same arguments, and yields and raises the same, as astream.
+        Must not be called from the client's own event loop.
+        """
+        loop = self._ensure_loop()
+        if _running_loop() is loop:
+            raise RuntimeError("stream_sync cannot be called from the LLM client's event loop")
+        pieces = queue.SimpleQueue()
+        pump = asyncio.run_coroutine_threadsafe(
+            self._pump(self._routed_stream(prompt, model, backend, max_tokens), pieces.put), loop
+        )
+        try:
+            while True:
+                piece, error = pieces.get()
+                if error is not None:
+                    raise error
+                if piece is None:
+                    return
+                yield piece
+        finally:
+            pump.cancel()
+
+    def stats(self):
+        """Get the request counters and latency percentiles of every backend,
+        its rate limiter's rate, queue depth and waiting times, its circuit
+        state, and the coalescing, hedging and fallback counters.
+        """
+        backends = {}
+        for name, backend in self.backends.items():
+            backends[name] = backend.stats()
+            if name in self.limiters:
+                backends[name]["limiter"] = self.limiters[name].stats()
+            if name in self.breakers:
+                backends[name]["circuit"] = self.breakers[name].stats()
+        return {
+            "backends": backends,
+            "single_flight": self.single_flight.stats() if self.single_flight is not None else None,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "hedges_over_budget": self.hedges_over_budget,
+            "fallback_calls": self.fallback_calls
+        }
+
+    def close(self):
+        """Close every backend's connections and stop the event loop thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+
+        async def close_backends():
+            await asyncio.gather(*(backend.close() for backend in self.backends.values()))
+
+        asyncio.run_coroutine_threadsafe(close_backends(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_llm_client():
+    """Get the process-wide LLM client, creating it from llm_config.json on first use.
+
+    Pool sizes are read when the client is created; changes to llm_config.json
+    take effect in new processes.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = LLMClient.from_config()
+                atexit.register(_client.close)
+    return _client
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+ViewpointExplorer Load Test
+This script replays the ViewpointExplorer test conversations as many
+concurrent virtual users over pooled keep-alive connections and reports
+throughput and latency percentiles per conversation step.
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import random
+import asyncio
+import argparse
+from datetime import datetime, timezone
+from pathlib import Path
+
+import aiohttp
+from dotenv import load_dotenv
+
+# Make the debate_agents package importable when run as a script
+sys.path.append(str(Path(__file__).parent.absolute().parent))
+from debate_agents.conversation_scripts import CONVERSATION_SCRIPTS
+
+# Load environment variables
+load_dotenv()
+
+# Base URL for the chat API
+BASE_URL = "http://localhost:3000/api"
+
+
+def get_auth_headers():
+    """Get authentication headers for API requests"""
+    return {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {os.getenv('WO_API_KEY')}"
+    }
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies, errors):
+    """Summarize a list of latencies in seconds"""
+    values = sorted(latencies)
+    return {
+        "count": len(values),
+        "errors": errors,
+        "mean": sum(values) / len(values) if values else None,
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": values[-1] if values else None
+    }
+
+
+class LoadTest:
+    """Runs scripted conversations as concurrent virtual users"""
+
+    def __init__(self, base_url, scenarios, users, rate, think_time, connections):
+        self.base_url = base_url.rstrip("/")
+        self.scenarios = scenarios
+        self.users = users
+        self.rate = rate
+        self.think_time = think_time
+        self.connections = connections
+        self.samples = []
+        self.conversations = 0
+        self.failed_conversations = 0
+
+    async def _request(self, session, label, url, payload):
+        """Send one request and record its latency under a label"""
+        start = time.perf_counter()
+        ok = False
+        body = None
+        try:
+            async with session.post(url, json=payload) as response:
+                body = await response.json(content_type=None)
+                ok = response.status == 200
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            pass
+        self.samples.append((label, time.perf_counter() - start, ok))
+        return body if ok else None
+
+    async def run_conversation(self, session, scenario):
+        """Play one scripted conversation from start to finish"""
+        body = await self._request(
+            session, ("start", "start"), f"{self.base_url}/conversations", {"agent": "ViewpointExplorer"}
+        )
+        conversation_id = body.get("conversationId") if body else None
+        if not conversation_id:
+            self.failed_conversations += 1
+            return
+
+        for index, (kind, message) in enumerate(CONVERSATION_SCRIPTS[scenario]):
+            if self.think_time and index:
+                await asyncio.sleep(random.expovariate(1 / self.think_time))
+            reply = await self._request(
+                session, (f"{scenario}[{index}]", kind),
+                f"{self.base_url}/conversations/{conversation_id}/messages", {"text": message}
+            )
+            if reply is None:
+                self.failed_conversations += 1
+                return
+        self.conversations += 1
+
+    async def run(self, iterations):
+        """Start iterations conversations at the configured arrival rate"""
+        connector = aiohttp.TCPConnector(limit=self.connections, keepalive_timeout=60)
+        limit = asyncio.Semaphore(self.users)
+
+        async def virtual_user(scenario):
+            async with limit:
+                await self.run_conversation(session, scenario)
+
+        async with aiohttp.ClientSession(connector=connector, headers=get_auth_headers()) as session:
+            start = time.perf_counter()
+            tasks = []
+            for i in range(iterations):
+                scenario = self.scenarios[i % len(self.scenarios)]
+                tasks.append(asyncio.ensure_future(virtual_user(scenario)))
+                if self.rate:
+                    # Poisson arrivals at the configured rate
+                    await asyncio.sleep(random.expovariate(self.rate))
+            await asyncio.gather(*tasks)
+            return time.perf_counter() - start
+
+    def report(self, elapsed):
+        """Build the machine-readable results of a run"""
+        steps, kinds = {}, {}
+        for (step, kind), latency, ok in self.samples:
+            for groups, key in ((steps, step), (kinds, kind)):
+                group = groups.setdefault(key, {"latencies": [], "errors": 0})
+                if ok:
+                    group["latencies"].append(latency)
+                else:
+                    group["errors"] += 1
+
+        return {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "config": {
+                "base_url": self.base_url,
+                "scenarios": self.scenarios,
+                "users": self.users,
+                "rate": self.rate,
+                "think_time": self.think_time,
+                "connections": self.connections
+            },
+            "elapsed": elapsed,
+            "requests": len(self.samples),
+            "throughput": len(self.samples) / elapsed if elapsed else None,
+            "conversations": self.conversations,
+            "failed_conversations": self.failed_conversations,
+            "by_kind": {key: summarize(**group) for key, group in kinds.items()},
+            "by_step": {key: summarize(**group) for key, group in sorted(steps.items())}
+        }
+
+
+def print_report(results):
+    """Print a human-readable summary of the results"""
+    def ms(value):
+        return f"{value * 1000:9.1f}" if value is not None else f"{'-':>9}"
+
+    print(f"\nRequests: {results['requests']} in {results['elapsed']:.1f}s "
+          f"({results['throughput']:.1f} req/s)")
+    print(f"Conversations: {results['conversations']} completed, "
+          f"{results['failed_conversations']} failed\n")
+    print(f"{'step':<16}{'count':>7}{'errors':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for section in ("by_kind", "by_step"):
+        for key, stats in results[section].items():
+            print(f"{key:<16}{stats['count']:>7}{stats['errors']:>7}"
+                  f"{ms(stats['p50'])}{ms(stats['p95'])}{ms(stats['p99'])}")
+        print()
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Load test the ViewpointExplorer conversations API")
+    parser.add_argument('--base-url', default=BASE_URL, help='Base URL of the chat API')
+    parser.add_argument('--test', choices=list(CONVERSATION_SCRIPTS) + ['all'], default='all',
+                        help='Which conversation script to replay')
+    parser.add_argument('--iterations', type=int, default=100, help='Number of conversations to run')
+    parser.add_argument('--users', type=int, default=20, help='Maximum concurrent virtual users')
+    parser.add_argument('--rate', type=float, default=0,
+                        help='Conversation arrivals per second (0 starts them all at once)')
+    parser.add_argument('--think-time', type=float, default=0, help='Mean seconds between user messages')
+    parser.add_argument('--connections', type=int, default=50, help='Size of the keep-alive connection pool')
+    parser.add_argument('--output', help='Write JSON results to this file')
+    args = parser.parse_args()
+
+    scenarios = list(CONVERSATION_SCRIPTS) if args.test == 'all' else [args.test]
+    load_test = LoadTest(args.base_url, scenarios, args.users, args.rate, args.think_time, args.connections)
+    elapsed = asyncio.run(load_test.run(args.iterations))
+    results = load_test.report(elapsed)
+
+    print_report(results)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
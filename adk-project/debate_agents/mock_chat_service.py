@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+"""
+Mock Chat Service
+
+Local stand-in for the Watson Orchestrate chat API, for benchmarking the
+client side, concurrency limits and handoff logic without the UI container
+or network access. Implements the conversation endpoints used by
+test_viewpoint_explorer.py with configurable latency and token streaming.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import uuid
+
+from aiohttp import web
+
+HANDOFF_AGENTS = {
+    "whiteboard": "WhiteboardAgent",
+    "town hall": "ForumAgent",
+    "forum": "ForumAgent",
+    "debate": "ModeratorAgent",
+    "podcast": "PodcastAgent",
+}
+
+FILLER_WORDS = (
+    "That is an interesting perspective. Could you tell me more about what evidence "
+    "shapes your view and how people who disagree might see the same issue differently?"
+).split()
+
+
+class LatencyModel:
+    """Samples delays in seconds from a named distribution.
+
+    Specs look like "constant:0.2", "uniform:0.1,0.5", "normal:0.3,0.05",
+    "exponential:0.3" (mean) or "lognormal:0.3,0.6" (median, sigma).
+    """
+
+    def __init__(self, spec):
+        self.spec = spec
+        kind, _, params = spec.partition(":")
+        values = [float(v) for v in params.split(",")] if params else []
+        samplers = {
+            "constant": lambda: values[0],
+            "uniform": lambda: random.uniform(values[0], values[1]),
+            "normal": lambda: random.gauss(values[0], values[1]),
+            "exponential": lambda: random.expovariate(1 / values[0]),
+            "lognormal": lambda: values[0] * random.lognormvariate(0, values[1]),
+        }
+        if kind not in samplers:
+            raise ValueError(f"Unknown latency model: {spec}")
+        self._sample = samplers[kind]
+        self._sample()  # fail fast on missing parameters
+
+    def sample(self):
+        """Draw one non-negative delay."""
+        return max(0.0, self._sample())
+
+
+class MockChatService:
+    """In-memory conversations served over aiohttp."""
+
+    def __init__(self, start_latency, first_token_latency, tokens_per_second, reply_words, error_rate=0.0):
+        """
+        Args:
+            start_latency (LatencyModel): Delay before a new conversation is returned.
+            first_token_latency (LatencyModel): Delay before the first reply token.
+            tokens_per_second (float): Rate at which reply tokens are produced.
+            reply_words (int): Number of words in each ordinary reply.
+            error_rate (float): Share of message requests answered with a 503.
+        """
+        self.start_latency = start_latency
+        self.first_token_latency = first_token_latency
+        self.tokens_per_second = tokens_per_second
+        self.reply_words = reply_words
+        self.error_rate = error_rate
+        self.conversations = {}
+
+    def make_app(self):
+        """Build the aiohttp application."""
+        app = web.Application()
+        app.router.add_post("/api/conversations", self.start_conversation)
+        app.router.add_post("/api/conversations/{conversation_id}/messages", self.send_message)
+        return app
+
+    def _reply(self, conversation, text):
+        """Choose the reply text, handing off when an exploration path is chosen."""
+        lowered = text.lower()
+        agent = next((name for key, name in HANDOFF_AGENTS.items() if key in lowered), None)
+        if agent is not None and conversation["agent"] == "ViewpointExplorer":
+            conversation["agent"] = agent
+            return f"Great choice. I'm handing you over to {agent} to continue exploring this topic."
+        return " ".join(FILLER_WORDS[i % len(FILLER_WORDS)] for i in range(self.reply_words))
+
+    async def start_conversation(self, request):
+        """POST /api/conversations"""
+        payload = await request.json()
+        await asyncio.sleep(self.start_latency.sample())
+        conversation_id = str(uuid.uuid4())
+        self.conversations[conversation_id] = {"agent": payload.get("agent", "ViewpointExplorer"), "messages": 0}
+        return web.json_response({"conversationId": conversation_id})
+
+    async def send_message(self, request):
+        """POST /api/conversations/{conversation_id}/messages"""
+        conversation = self.conversations.get(request.match_info["conversation_id"])
+        if conversation is None:
+            return web.json_response({"error": "Conversation not found"}, status=404)
+
+        payload = await request.json()
+        if random.random() < self.error_rate:
+            return web.json_response({"error": "Service unavailable"}, status=503)
+
+        conversation["messages"] += 1
+        text = self._reply(conversation, payload.get("text", ""))
+        words = text.split(" ")
+        token_delay = 1 / self.tokens_per_second if self.tokens_per_second else 0
+        await asyncio.sleep(self.first_token_latency.sample())
+
+        streaming = payload.get("stream") or "text/event-stream" in request.headers.get("Accept", "")
+        if not streaming:
+            await asyncio.sleep(token_delay * (len(words) - 1))
+            return web.json_response({"text": text, "agent": conversation["agent"]})
+
+        # Server-sent events, one word per event, then a final summary event
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for i, word in enumerate(words):
+            if i:
+                await asyncio.sleep(token_delay)
+            chunk = word if i == len(words) - 1 else word + " "
+            await response.write(f"data: {json.dumps({'chunk': chunk})}\n\n".encode("utf-8"))
+        await response.write(f"data: {json.dumps({'done': True, 'agent': conversation['agent']})}\n\n".encode("utf-8"))
+        await response.write_eof()
+        return response
+
+
+def main():
+    """Main function to run the mock chat service."""
+    parser = argparse.ArgumentParser(description="Run a local stand-in for the chat API.")
+    parser.add_argument("--host", default="127.0.0.1", help="Host to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=3000, help="Port to run the service on (default: 3000)")
+    parser.add_argument("--start-latency", default="constant:0.05",
+                        help="Latency model for starting a conversation (default: constant:0.05)")
+    parser.add_argument("--first-token-latency", default="lognormal:0.4,0.5",
+                        help="Latency model for the first reply token (default: lognormal:0.4,0.5)")
+    parser.add_argument("--tokens-per-second", type=float, default=40,
+                        help="Reply token rate, 0 for instant replies (default: 40)")
+    parser.add_argument("--reply-words", type=int, default=30, help="Words per ordinary reply (default: 30)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of messages failing with 503")
+    parser.add_argument("--seed", type=int, help="Random seed for reproducible latencies")
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    service = MockChatService(
+        LatencyModel(args.start_latency),
+        LatencyModel(args.first_token_latency),
+        args.tokens_per_second,
+        args.reply_words,
+        args.error_rate
+    )
+    print(f"Mock chat service is available at: http://{args.host}:{args.port}/api")
+    web.run_app(service.make_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
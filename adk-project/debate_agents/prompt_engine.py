@@ -0,0 +1,217 @@
+"""
+Prompt Engine Module
+
+Assembles the prompt of each agent turn from the agent's system text and
+persona in its YAML definition (falling back to those in
+debate_agent_config.json), the instructions of the current debate phase, and
+the topic and history of the debate.
+
+The parts that do not change between calls (system text, persona and phase
+instructions) are compiled once per agent and phase into a static prefix, and
+always come first. Every call for the same agent and phase therefore starts
+with the same bytes, so backend prefix and KV caches can reuse them; only the
+topic, history and task after the prefix are rendered per call.
+"""
+
+from collections import namedtuple
+
+from .agent_specs import get_bundle
+from .config_service import get_config_service
+from .debate_history import estimate_tokens
+from .flow_registry import phase_instructions
+
+SECTION_SEPARATOR = "\n\n"
+
+PromptTemplate = namedtuple("PromptTemplate", ["agent", "phase", "prefix", "static_tokens"])
+
+
+class Prompt(namedtuple("Prompt", ["prefix", "dynamic", "static_tokens", "dynamic_tokens"])):
+    """An assembled prompt, split into its shared static prefix and per-call text."""
+
+    __slots__ = ()
+
+    @property
+    def text(self):
+        """The full prompt text."""
+        return self.prefix + self.dynamic
+
+    @property
+    def total_tokens(self):
+        """Estimated tokens of the whole prompt."""
+        return self.static_tokens + self.dynamic_tokens
+
+
+def render_persona(persona):
+    """Render a persona mapping as prompt text, one attribute per line.
+
+    Args:
+        persona (Mapping): Persona attributes such as "role" and "tone".
+
+    Returns:
+        str: The persona section, or an empty string for an empty persona.
+    """
+    if not persona:
+        return ""
+    lines = [f"{key.replace('_', ' ').capitalize()}: {value}" for key, value in persona.items()]
+    return "Persona:\n" + "\n".join(lines)
+
+
+def render_history(history):
+    """Render a debate history as prompt text.
+
+    Args:
+        history (DebateHistory, list, str or None): A DebateHistory, a list of
+            turns with "speaker" (or "agent") and "statement" keys, or already
+            rendered text.
+
+    Returns:
+        str: The rendered history.
+    """
+    if not history:
+        return ""
+    if isinstance(history, str):
+        return history
+    if hasattr(history, "render"):
+        return history.render()
+    return "Recent turns:\n" + "\n".join(
+        f"{turn.get('speaker') or turn.get('agent')}: {turn['statement']}" if isinstance(turn, dict) else str(turn)
+        for turn in history
+    )
+
+
+class PromptEngine:
+    """Memoizing prompt assembler shared by all agents in a process."""
+
+    def __init__(self, bundle=None, service=None):
+        """Initialize the engine. Templates are compiled on first use.
+
+        Args:
+            bundle (AgentSpecBundle, optional): Source of the agents' system text.
+                Defaults to the process-wide agent spec bundle.
+            service (ConfigService, optional): Source of the default system text
+                and persona. Defaults to the process-wide config service.
+        """
+        self._bundle = bundle
+        self.service = service or get_config_service()
+        self._templates = {}
+        # The agent config and bundle source hash the templates were compiled from
+        self._sources = None
+        self.calls = 0
+        self.template_misses = 0
+        self.static_tokens = 0
+        self.dynamic_tokens = 0
+
+    @property
+    def bundle(self):
+        """The agent spec bundle, the process-wide one unless one was given."""
+        return self._bundle if self._bundle is not None else get_bundle()
+
+    def system_text(self, agent):
+        """Get an agent's system text from its YAML definition.
+
+        Agents without a definition, or whose definition has no system text,
+        use the system text of debate_agent_config.json.
+        """
+        spec = self.bundle.get(agent)
+        system = spec.spec.get("system") if spec is not None else None
+        return (system or self.service.agent_config().system).strip()
+
+    def persona(self, agent, config=None):
+        """Get an agent's persona from its YAML definition.
+
+        Agents without a definition, or whose definition has no persona, use
+        the persona of debate_agent_config.json.
+        """
+        spec = self.bundle.get(agent)
+        persona = spec.spec.get("persona") if spec is not None else None
+        return persona or (config or self.service.agent_config()).persona
+
+    def template(self, agent, phase=None):
+        """Get the compiled template of an agent in a debate phase.
+
+        Templates are recompiled when the config service reloads
+        debate_agent_config.json, or the agent spec bundle is rebuilt from
+        changed sources.
+
+        Args:
+            agent (str): The agent's name, as in its YAML definition.
+            phase (str, optional): The name of the debate phase.
+
+        Returns:
+            PromptTemplate: The template with its static prefix.
+        """
+        config = self.service.agent_config()
+        sources = (config, self.bundle.source_hash)
+        if self._sources is None or sources[0] is not self._sources[0] or sources[1] != self._sources[1]:
+            self._templates.clear()
+            self._sources = sources
+
+        key = (agent, phase)
+        template = self._templates.get(key)
+        if template is None:
+            sections = [self.system_text(agent), render_persona(self.persona(agent, config))]
+            if phase:
+                sections.append(f"Current phase: {phase}\n{phase_instructions(phase)}")
+            prefix = SECTION_SEPARATOR.join(s for s in sections if s) + SECTION_SEPARATOR
+            template = PromptTemplate(agent, phase, prefix, estimate_tokens(prefix))
+            self._templates[key] = template
+            self.template_misses += 1
+        return template
+
+    def build(self, agent, task, topic=None, phase=None, history=None):
+        """Assemble the prompt of one agent turn.
+
+        Args:
+            agent (str): The agent's name, as in its YAML definition.
+            task (str): What the agent is asked to do this turn.
+            topic (str, optional): The debate topic.
+            phase (str, optional): The name of the current debate phase.
+            history (optional): The debate so far, in any form render_history takes.
+
+        Returns:
+            Prompt: The static prefix, shared by every call with the same agent
+            and phase, and the dynamic text, with the token count of each.
+        """
+        template = self.template(agent, phase)
+        sections = []
+        if topic:
+            sections.append(f"Topic: {topic}")
+        rendered = render_history(history)
+        if rendered:
+            sections.append(rendered)
+        sections.append(f"Task: {task}")
+        dynamic = SECTION_SEPARATOR.join(sections)
+        dynamic_tokens = estimate_tokens(dynamic)
+
+        self.calls += 1
+        self.static_tokens += template.static_tokens
+        self.dynamic_tokens += dynamic_tokens
+        return Prompt(template.prefix, dynamic, template.static_tokens, dynamic_tokens)
+
+    def stats(self):
+        """Get the totals over every prompt built so far.
+
+        Returns:
+            dict: Calls, compiled templates, and static and dynamic tokens,
+            with the share of tokens in static prefixes.
+        """
+        total = self.static_tokens + self.dynamic_tokens
+        return {
+            "calls": self.calls,
+            "templates": len(self._templates),
+            "template_misses": self.template_misses,
+            "static_tokens": self.static_tokens,
+            "dynamic_tokens": self.dynamic_tokens,
+            "static_share": self.static_tokens / total if total else None
+        }
+
+
+_engine = None
+
+
+def get_prompt_engine():
+    """Get the process-wide prompt engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        _engine = PromptEngine()
+    return _engine
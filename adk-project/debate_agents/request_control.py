@@ -0,0 +1,395 @@
+"""
+Request Control Module
+
+Flow control for model calls made through the LLM client.
+
+SingleFlight merges identical requests that are in flight at the same time
+into one, so debates that start together share the moderator's introduction
+instead of each spending rate quota on it. AdaptiveRateLimiter is a token
+bucket whose rate backs off when the backend answers 429 or slows down, and
+creeps back up while requests succeed. LatencyHistogram keeps the recent
+latencies of a backend, from which the hedging delay is taken, and
+CircuitBreaker stops sending requests to a backend that keeps failing. All of
+them count what they do, so queue depth, waiting time and latency percentiles
+can be watched.
+"""
+
+import asyncio
+import bisect
+import math
+import time
+from collections import deque
+
+
+class SingleFlight:
+    """Shares the result of one in-flight call among callers with the same key."""
+
+    def __init__(self):
+        """Initialize with nothing in flight."""
+        # key -> [task, number of callers waiting on it]
+        self._calls = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def _forget(self, key, entry, task):
+        if self._calls.get(key) is entry:
+            del self._calls[key]
+
+    async def do(self, key, factory):
+        """Run a call, or wait for the identical call already in flight.
+
+        Args:
+            key (hashable): Identifies identical calls.
+            factory (callable): Returns the coroutine to run when no call with
+                the key is in flight.
+
+        Returns:
+            The call's result. Errors are raised in every waiting caller.
+        """
+        self.calls += 1
+        entry = self._calls.get(key)
+        if entry is None:
+            entry = [asyncio.ensure_future(factory()), 0]
+            self._calls[key] = entry
+            entry[0].add_done_callback(lambda task: self._forget(key, entry, task))
+        else:
+            self.coalesced += 1
+
+        entry[1] += 1
+        try:
+            # Shielded, so one caller giving up does not cancel the others
+            return await asyncio.shield(entry[0])
+        except asyncio.CancelledError:
+            entry[1] -= 1
+            if entry[1] == 0:
+                # Forget the call before cancelling it: the done callback runs
+                # later, and a caller arriving in between would otherwise join
+                # the cancelled call and get a CancelledError of its own
+                self._forget(key, entry, entry[0])
+                entry[0].cancel()
+            raise
+
+    def in_flight(self):
+        """Number of distinct calls in flight."""
+        return len(self._calls)
+
+    def stats(self):
+        """Get the coalescing counters."""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "coalesced_share": self.coalesced / self.calls if self.calls else None,
+            "in_flight": len(self._calls)
+        }
+
+
+class AdaptiveRateLimiter:
+    """Token bucket whose rate adapts to throttling and latency signals.
+
+    The rate is cut multiplicatively when the backend answers 429 or when the
+    smoothed latency exceeds the target, at most once per cooldown, and raised
+    additively by about one request per second for every second of successful
+    requests. Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate, burst=None, min_rate=0.5, max_rate=None, latency_target=None,
+                 decrease=0.5, cooldown=1.0, clock=time.monotonic):
+        """Initialize the limiter with a full bucket.
+
+        Args:
+            rate (float): Initial requests per second.
+            burst (float, optional): Bucket size. Defaults to one second's worth
+                of the initial rate.
+            min_rate (float): The rate never drops below this.
+            max_rate (float, optional): The rate never rises above this.
+                Defaults to the initial rate.
+            latency_target (float, optional): Seconds of smoothed latency above
+                which the rate is reduced. None ignores latency.
+            decrease (float): Factor the rate is multiplied by on a 429.
+            cooldown (float): Minimum seconds between two rate reductions, so a
+                burst of 429s from one overload counts once.
+            clock (callable): Monotonic time source.
+        """
+        self.rate = float(rate)
+        self.burst = float(burst or max(1.0, rate))
+        self.min_rate = min_rate
+        self.max_rate = max_rate or float(rate)
+        self.latency_target = latency_target
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._last_decrease = float("-inf")
+        self._lock = None
+        self.latency = None
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.acquired = 0
+        self.throttled = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Wait for a token.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        start = self.clock()
+        self.queue_depth += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            async with self._lock:
+                while True:
+                    now = self.clock()
+                    self._refill(now)
+                    if now < self._blocked_until:
+                        await asyncio.sleep(self._blocked_until - now)
+                    elif self._tokens < 1.0:
+                        await asyncio.sleep((1.0 - self._tokens) / self.rate)
+                    else:
+                        self._tokens -= 1.0
+                        break
+        finally:
+            self.queue_depth -= 1
+
+        waited = self.clock() - start
+        self.acquired += 1
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+        return waited
+
+    def _reduce(self, factor, now):
+        if now - self._last_decrease < self.cooldown:
+            return False
+        self._refill(now)
+        self.rate = max(self.min_rate, self.rate * factor)
+        self._tokens = min(self._tokens, self.burst)
+        self._last_decrease = now
+        return True
+
+    def on_success(self, latency):
+        """Record a successful request and its latency in seconds."""
+        self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+        now = self.clock()
+        if self.latency_target is not None and self.latency > self.latency_target:
+            self._reduce(0.9, now)
+        elif self.rate < self.max_rate:
+            self._refill(now)
+            self.rate = min(self.max_rate, self.rate + 1.0 / self.rate)
+
+    def on_throttle(self, retry_after=None):
+        """Record a 429 answer, pausing for retry_after seconds if the backend gave one."""
+        self.throttled += 1
+        now = self.clock()
+        self._reduce(self.decrease, now)
+        self._tokens = 0.0
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    def stats(self):
+        """Get the current rate and the queueing counters."""
+        return {
+            "rate": self.rate,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "mean_wait": self.wait_total / self.acquired if self.acquired else None,
+            "max_wait": self.wait_max,
+            "latency": self.latency
+        }
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram over a sliding time window.
+
+    Samples are counted in buckets about 10% wide, so percentiles are read
+    without sorting and memory does not grow with traffic. Two windows are
+    kept, the current and the previous one, so percentiles always cover
+    between one and two windows of the most recent samples.
+    """
+
+    def __init__(self, window=60.0, min_latency=0.001, max_latency=300.0, growth=1.1, clock=time.monotonic):
+        """Initialize an empty histogram.
+
+        Args:
+            window (float): Seconds covered by each of the two windows.
+            min_latency (float): Upper bound of the first bucket, in seconds.
+            max_latency (float): Latencies above this share the last bucket.
+            growth (float): Ratio between the bounds of consecutive buckets.
+            clock (callable): Monotonic time source.
+        """
+        count = math.ceil(math.log(max_latency / min_latency, growth)) + 1
+        self.bounds = [min_latency * growth ** i for i in range(count)]
+        self.window = window
+        self.clock = clock
+        self._current = [0] * count
+        self._previous = [0] * count
+        self._current_count = 0
+        self._previous_count = 0
+        self._rotated = clock()
+        self.total = 0
+
+    def _rotate(self, now):
+        elapsed = now - self._rotated
+        if elapsed >= self.window:
+            if elapsed < 2 * self.window:
+                self._previous, self._previous_count = self._current, self._current_count
+            else:
+                self._previous, self._previous_count = [0] * len(self.bounds), 0
+            self._current, self._current_count = [0] * len(self.bounds), 0
+            self._rotated = now
+
+    def record(self, latency):
+        """Count a latency in seconds."""
+        self._rotate(self.clock())
+        index = min(bisect.bisect_left(self.bounds, latency), len(self.bounds) - 1)
+        self._current[index] += 1
+        self._current_count += 1
+        self.total += 1
+
+    def count(self):
+        """Number of samples in the window."""
+        self._rotate(self.clock())
+        return self._current_count + self._previous_count
+
+    def percentile(self, pct):
+        """Get a latency percentile of the window.
+
+        Args:
+            pct (float): The percentile, between 0 and 100.
+
+        Returns:
+            float: The upper bound of the bucket holding the percentile, or
+            None if the window is empty.
+        """
+        samples = self.count()
+        if not samples:
+            return None
+        rank = max(1, math.ceil(pct / 100 * samples))
+        seen = 0
+        for bound, current, previous in zip(self.bounds, self._current, self._previous):
+            seen += current + previous
+            if seen >= rank:
+                return bound
+        return self.bounds[-1]
+
+    def snapshot(self):
+        """Get the sample count and the main percentiles of the window."""
+        return {
+            "count": self.count(),
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99)
+        }
+
+
+class CircuitBreaker:
+    """Stops calls to a failing backend and probes it until it recovers.
+
+    The circuit opens when at least failure_rate of the last window calls
+    failed or were slower than slow_call. While open, calls are refused so
+    callers can fall back at once. After open_seconds a single probe call is
+    let through (half open); its success closes the circuit and its failure
+    opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_rate=0.5, window=20, min_calls=10, open_seconds=10.0, slow_call=None,
+                 clock=time.monotonic):
+        """Initialize a closed circuit.
+
+        Args:
+            failure_rate (float): Share of failed calls that opens the circuit.
+            window (int): Number of recent calls the share is taken over.
+            min_calls (int): Calls needed in the window before it can open.
+            open_seconds (float): Seconds the circuit stays open before a probe.
+            slow_call (float, optional): Seconds after which a successful call
+                counts as a failure. None counts only errors.
+            clock (callable): Monotonic time source.
+        """
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.slow_call = slow_call
+        self.clock = clock
+        self.state = self.CLOSED
+        self._outcomes = deque(maxlen=window)
+        self._opened_at = None
+        self._probing = False
+        self.opened = 0
+        self.rejected = 0
+
+    def allow(self):
+        """Check whether a call may be made now.
+
+        Returns:
+            bool: False while the circuit is open, or half open with its probe
+            call already in flight.
+        """
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            if self.clock() - self._opened_at < self.open_seconds:
+                self.rejected += 1
+                return False
+            self.state = self.HALF_OPEN
+            self._probing = False
+        if self._probing:
+            self.rejected += 1
+            return False
+        self._probing = True
+        return True
+
+    def _open(self):
+        self.state = self.OPEN
+        self._opened_at = self.clock()
+        self._outcomes.clear()
+        self.opened += 1
+
+    def record(self, success, latency=None):
+        """Record the outcome of an allowed call.
+
+        Args:
+            success (bool): Whether the call succeeded.
+            latency (float, optional): Seconds the call took.
+        """
+        if success and self.slow_call is not None and latency is not None and latency > self.slow_call:
+            success = False
+        if self.state == self.HALF_OPEN:
+            self._probing = False
+            if success:
+                self.state = self.CLOSED
+            else:
+                self._open()
+            return
+        if self.state == self.OPEN:
+            # A call made before the circuit opened
+            return
+
+        self._outcomes.append(success)
+        failures = self._outcomes.count(False)
+        if len(self._outcomes) >= self.min_calls and failures >= self.failure_rate * len(self._outcomes):
+            self._open()
+
+    def release(self):
+        """Forget an allowed call that was cancelled before it had an outcome."""
+        if self.state == self.HALF_OPEN:
+            self._probing = False
+
+    def stats(self):
+        """Get the circuit state and its counters."""
+        return {"state": self.state, "opened": self.opened, "rejected": self.rejected}
@@ -0,0 +1,240 @@
+"""
+Session Log Module
+
+Append-only event log for debate sessions. Each worker writes phase
+transitions and turns to its own log, fsyncs them in batches from a
+background thread and periodically compacts the log into a snapshot, so a
+restarted worker can rebuild its in-flight debates instead of regenerating
+them.
+
+Every event carries a sequence number, and the snapshot records the last one
+it covers, so events still in the log after a crash between writing the
+snapshot and truncating the log are not replayed twice.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def apply_event(sessions, event, max_turns=None):
+    """Apply a logged event to the session states.
+
+    Args:
+        sessions (dict): Session states keyed by session id. Updated in place.
+        event (dict): The event, with "session", "type" and event data.
+        max_turns (int, optional): Number of most recent turns kept per
+            session. None keeps every turn.
+    """
+    session_id = event["session"]
+    kind = event["type"]
+
+    if kind == "end":
+        sessions.pop(session_id, None)
+        return
+
+    state = sessions.setdefault(session_id, {
+        "flow": None,
+        "topic": None,
+        "moderator": None,
+        "participants": [],
+        "sides": None,
+        "current_phase": None,
+        "speaking_order": [],
+        "turns": []
+    })
+    if kind == "setup":
+        for key in ("flow", "topic", "moderator", "participants", "sides", "current_phase"):
+            state[key] = event.get(key, state[key])
+    elif kind == "phase":
+        state["current_phase"] = event["current_phase"]
+    elif kind == "speaking_order":
+        state["speaking_order"] = event["speaking_order"]
+    elif kind == "turn":
+        state["turns"].append({"speaker": event["speaker"], "statement": event["statement"]})
+        if max_turns is not None and len(state["turns"]) > max_turns:
+            del state["turns"][:-max_turns]
+
+
+def _fsync_directory(directory):
+    """Make a rename or new file in a directory durable."""
+    if os.name != "posix":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def copy_sessions(sessions):
+    """Copy session states deeply enough to serialize them without a lock.
+
+    Turn dicts are never changed once logged, so they are shared.
+    """
+    return {
+        session_id: dict(
+            state,
+            participants=list(state["participants"]),
+            speaking_order=list(state["speaking_order"]),
+            turns=list(state["turns"])
+        )
+        for session_id, state in sessions.items()
+    }
+
+
+class SessionEventLog:
+    """Per-worker write-ahead log of debate session events."""
+
+    def __init__(self, directory, worker_id="worker", flush_interval=0.05, snapshot_every=10000, max_turns=200):
+        """Open or create a worker's log.
+
+        Args:
+            directory (str): Directory holding the log and snapshot files.
+            worker_id (str): Name of this worker; each worker owns its files.
+            flush_interval (float): Seconds between batched writes and fsyncs.
+            snapshot_every (int): Number of events after which the log is
+                compacted into a snapshot.
+            max_turns (int, optional): Number of most recent turns kept per
+                session in memory and in snapshots. Restored agents fold older
+                turns into their history summary anyway.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.log_path = self.directory / f"{worker_id}.log"
+        self.snapshot_path = self.directory / f"{worker_id}.snapshot.json"
+        self.flush_interval = flush_interval
+        self.snapshot_every = snapshot_every
+        self.max_turns = max_turns
+
+        self.seq = 0
+        self.sessions = self.recover()
+        self._pending = []
+        self._events_since_snapshot = 0
+        self._lock = threading.Lock()       # guards the state and the queue
+        self._io_lock = threading.Lock()    # serializes writes to the files
+        self._file = open(self.log_path, 'a', encoding="utf-8")
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name=f"{worker_id}-log-flusher", daemon=True)
+        self._flusher.start()
+
+    def recover(self):
+        """Rebuild session states from the snapshot and the log tail.
+
+        A partially written final line, left by a crash mid-write, is cut off
+        so new events start on a clean line. A complete line that is not a
+        valid event is skipped with a warning, so one bad record does not
+        stop the worker from starting. Events the snapshot already covers
+        are skipped. Sets seq to the last sequence number seen.
+
+        Returns:
+            dict: Session states keyed by session id.
+        """
+        sessions = {}
+        covered = 0
+        if self.snapshot_path.exists():
+            with open(self.snapshot_path, 'r', encoding="utf-8") as f:
+                data = json.load(f)
+            sessions = data["sessions"]
+            covered = data.get("seq", 0)
+        self.seq = covered
+
+        if self.log_path.exists():
+            valid_length = 0
+            with open(self.log_path, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    valid_length += len(line)
+                    try:
+                        event = json.loads(line)
+                        seq = event.get("seq")
+                        # Events logged before sequence numbers are always applied
+                        if seq is None or seq > covered:
+                            apply_event(sessions, event, self.max_turns)
+                            self.seq = max(self.seq, seq or 0)
+                    except (ValueError, AttributeError, KeyError, TypeError):
+                        logger.warning("Skipping corrupt event at byte %d of %s", valid_length - len(line),
+                                       self.log_path)
+            if valid_length < self.log_path.stat().st_size:
+                os.truncate(self.log_path, valid_length)
+        return sessions
+
+    def append(self, session_id, event_type, **data):
+        """Record an event.
+
+        Only queues the event and updates the in-memory state; the write and
+        fsync happen in the next batch, and compaction in the background once
+        snapshot_every events have accumulated.
+
+        Args:
+            session_id (str): The debate session the event belongs to.
+            event_type (str): One of "setup", "phase", "speaking_order",
+                "turn" or "end".
+            **data: Event data.
+        """
+        event = {"session": session_id, "type": event_type, "time": time.time(), **data}
+        with self._lock:
+            # Numbered under the lock, so the log is in sequence order
+            self.seq += 1
+            event["seq"] = self.seq
+            apply_event(self.sessions, event, self.max_turns)
+            self._pending.append(json.dumps(event) + "\n")
+            self._events_since_snapshot += 1
+
+    def flush(self):
+        """Write queued events and fsync the log."""
+        with self._io_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if batch:
+                self._file.write("".join(batch))
+                self._file.flush()
+                os.fsync(self._file.fileno())
+
+    def _flush_loop(self):
+        while not self._closed.wait(self.flush_interval):
+            if self._events_since_snapshot >= self.snapshot_every:
+                self.snapshot()
+            else:
+                self.flush()
+
+    def snapshot(self):
+        """Compact the log into a snapshot of the current session states.
+
+        The states are only copied under the lock, so appends are not held up
+        while the snapshot is serialized and written.
+        """
+        with self._io_lock:
+            # Queued events are covered by the snapshot, so they are dropped
+            # rather than written to the log that is about to be truncated.
+            with self._lock:
+                sessions = copy_sessions(self.sessions)
+                seq = self.seq
+                self._pending = []
+                self._events_since_snapshot = 0
+            data = json.dumps({"time": time.time(), "seq": seq, "sessions": sessions})
+
+            tmp_path = self.snapshot_path.with_suffix(".tmp")
+            with open(tmp_path, 'w', encoding="utf-8") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+            _fsync_directory(self.directory)
+
+            # A crash here leaves covered events in the log; recover skips them
+            self._file.close()
+            self._file = open(self.log_path, 'w', encoding="utf-8")
+
+    def close(self):
+        """Flush outstanding events and stop the background flusher."""
+        self._closed.set()
+        self._flusher.join()
+        self.flush()
+        self._file.close()
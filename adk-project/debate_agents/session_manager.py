@@ -0,0 +1,243 @@
+"""
+Session Manager Module
+
+Tracks many concurrent debates as compact session records that point at the
+shared flow definitions from the flow registry.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+
+from .flow_registry import get_registry
+
+logger = logging.getLogger(__name__)
+
+
+class DebateSession:
+    """Per-debate state: the position in a shared flow definition."""
+
+    __slots__ = ("session_id", "definition", "phase_index", "topic", "moderator", "participants", "last_active")
+
+    def __init__(self, session_id, definition, topic, moderator, participants, now):
+        self.session_id = session_id
+        self.definition = definition
+        self.phase_index = 0
+        self.topic = topic
+        self.moderator = moderator
+        self.participants = tuple(participants)
+        self.last_active = now
+
+    @property
+    def phase(self):
+        """The current phase of the session."""
+        return self.definition.phases[self.phase_index]
+
+    @property
+    def is_complete(self):
+        """Whether the session has reached its final phase."""
+        return self.phase_index >= len(self.definition.phases) - 1
+
+    def current_phase_info(self):
+        """Get information about the current phase, as DebateFlow does."""
+        return {
+            "phase": self.phase["name"],
+            "instructions": self.phase["instructions"],
+            "progress": f"{self.phase_index + 1}/{len(self.definition.phases)}"
+        }
+
+
+class SessionManager:
+    """Registry of live debate sessions with bulk transitions and idle eviction."""
+
+    def __init__(self, registry=None, event_log=None, clock=time.monotonic):
+        """Initialize an empty session manager.
+
+        Args:
+            registry (FlowRegistry, optional): Source of flow definitions.
+                Defaults to the process-wide registry.
+            event_log (SessionEventLog, optional): Log that session setup,
+                phase transitions and removals are recorded in.
+            clock (callable): Monotonic time source used for idle tracking.
+        """
+        self.registry = registry or get_registry()
+        self.event_log = event_log
+        self.clock = clock
+        # Ordered by last activity, so idle sessions are always at the front
+        self._sessions = OrderedDict()
+        self._by_phase = {}
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __contains__(self, session_id):
+        return session_id in self._sessions
+
+    def _index(self, session):
+        self._by_phase.setdefault(session.phase["name"], set()).add(session.session_id)
+
+    def _unindex(self, session):
+        bucket = self._by_phase[session.phase["name"]]
+        bucket.discard(session.session_id)
+        if not bucket:
+            del self._by_phase[session.phase["name"]]
+
+    def create(self, session_id, flow_name, topic, moderator, participants):
+        """Start tracking a new debate session.
+
+        Args:
+            session_id (str): Unique id of the debate.
+            flow_name (str): The debate format.
+            topic (str): The topic of the debate.
+            moderator (str): The moderator of the debate.
+            participants (list): The participants in the debate.
+
+        Returns:
+            DebateSession: The new session.
+        """
+        definition = self.registry.get(flow_name)
+        if definition is None or not definition.phases:
+            raise ValueError(f"Unknown debate format: {flow_name}")
+        if session_id in self._sessions:
+            raise ValueError(f"Session already exists: {session_id}")
+
+        session = DebateSession(session_id, definition, topic, moderator, participants, self.clock())
+        self._sessions[session_id] = session
+        self._index(session)
+
+        if self.event_log is not None:
+            self.event_log.append(
+                session_id, "setup", flow=definition.name, topic=topic, moderator=moderator,
+                participants=list(session.participants), current_phase=0
+            )
+        return session
+
+    def restore(self, states):
+        """Recreate sessions from states recovered from a SessionEventLog.
+
+        A state whose format is no longer known, or whose phase is outside
+        its format's phases (after the format's phases were changed), is
+        skipped with a warning.
+
+        Args:
+            states (dict): Session states keyed by session id.
+
+        Returns:
+            int: Number of sessions restored.
+        """
+        restored = 0
+        for session_id, state in states.items():
+            if session_id in self._sessions:
+                continue
+            definition = self.registry.get(state["flow"] or "")
+            if definition is None or not definition.phases:
+                logger.warning("Not restoring session %s: unknown debate format %r", session_id, state["flow"])
+                continue
+            phase_index = state["current_phase"] or 0
+            if not isinstance(phase_index, int) or not 0 <= phase_index < len(definition.phases):
+                logger.warning(
+                    "Not restoring session %s: phase %r is outside the %d phases of %s",
+                    session_id, phase_index, len(definition.phases), definition.name
+                )
+                continue
+            session = DebateSession(
+                session_id, definition, state["topic"], state["moderator"], state["participants"], self.clock()
+            )
+            session.phase_index = phase_index
+            self._sessions[session_id] = session
+            self._index(session)
+            restored += 1
+        return restored
+
+    def get(self, session_id):
+        """Get a session and mark it as active, or None if it is not tracked."""
+        session = self._sessions.get(session_id)
+        if session is not None:
+            session.last_active = self.clock()
+            self._sessions.move_to_end(session_id)
+        return session
+
+    def _advance(self, session, now):
+        self._unindex(session)
+        session.phase_index += 1
+        session.last_active = now
+        self._sessions.move_to_end(session.session_id)
+        self._index(session)
+        if self.event_log is not None:
+            self.event_log.append(session.session_id, "phase", current_phase=session.phase_index)
+
+    def advance(self, session_id):
+        """Move a session to its next phase.
+
+        Returns:
+            dict: Information about the next phase, as DebateFlow.next_phase does.
+        """
+        session = self._sessions.get(session_id)
+        if session is None:
+            return {"status": "error", "message": f"Unknown session: {session_id}"}
+        if session.is_complete:
+            return {"status": "complete", "message": "Debate is complete"}
+
+        self._advance(session, self.clock())
+        return {
+            "status": "success",
+            "phase": session.phase["name"],
+            "instructions": session.phase["instructions"]
+        }
+
+    def sessions_in_phase(self, phase_name):
+        """Get the ids of the sessions currently in a phase."""
+        return list(self._by_phase.get(phase_name, ()))
+
+    def advance_all(self, phase_name):
+        """Move every session waiting on a phase to its next phase.
+
+        Sessions for which the phase is the final one stay where they are.
+
+        Args:
+            phase_name (str): The phase to advance sessions out of.
+
+        Returns:
+            int: Number of sessions advanced.
+        """
+        now = self.clock()
+        advanced = 0
+        for session_id in list(self._by_phase.get(phase_name, ())):
+            session = self._sessions[session_id]
+            if not session.is_complete:
+                self._advance(session, now)
+                advanced += 1
+        return advanced
+
+    def remove(self, session_id):
+        """Stop tracking a session.
+
+        Returns:
+            bool: True if the session was tracked.
+        """
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return False
+        self._unindex(session)
+        if self.event_log is not None:
+            self.event_log.append(session_id, "end")
+        return True
+
+    def evict_idle(self, max_idle):
+        """Remove sessions that have been inactive for too long.
+
+        Args:
+            max_idle (float): Seconds of inactivity after which a session is evicted.
+
+        Returns:
+            list: The ids of the evicted sessions.
+        """
+        cutoff = self.clock() - max_idle
+        evicted = []
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if session.last_active > cutoff:
+                break
+            self.remove(session.session_id)
+            evicted.append(session.session_id)
+        return evicted
@@ -0,0 +1,52 @@
+"""
+Streaming Module
+
+Helpers for delivering agent output as a stream of text chunks instead of
+a single string, so clients can render text as soon as it is produced.
+"""
+
+import asyncio
+import re
+
+# A chunk is a word together with the whitespace that follows it, so joining
+# the chunks always reproduces the original text exactly.
+_CHUNK_PATTERN = re.compile(r"\s*\S+\s*")
+
+
+def iter_chunks(text, words_per_chunk=1):
+    """Split text into chunks the way a token stream would deliver it.
+
+    Args:
+        text (str): The text to split.
+        words_per_chunk (int): Number of words in each chunk.
+
+    Yields:
+        str: Consecutive chunks of the text.
+    """
+    words = _CHUNK_PATTERN.findall(text or "")
+    for i in range(0, len(words), words_per_chunk):
+        yield "".join(words[i:i + words_per_chunk])
+
+
+async def aiter_chunks(source):
+    """Adapt a string, sync iterable or async iterable to an async iterator.
+
+    Control is handed back to the event loop between chunks of synchronous
+    sources so concurrent streams interleave.
+
+    Args:
+        source: A string, an iterable of chunks or an async iterable of chunks.
+
+    Yields:
+        str: Consecutive chunks of the source.
+    """
+    if hasattr(source, "__aiter__"):
+        async for chunk in source:
+            yield chunk
+        return
+
+    if isinstance(source, str):
+        source = iter_chunks(source)
+    for chunk in source:
+        yield chunk
+        await asyncio.sleep(0)
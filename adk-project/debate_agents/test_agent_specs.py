@@ -0,0 +1,81 @@
+# Agent Specs Tests
+
+"""
+Tests of the agent spec bundle: agents are looked up by name among this
+project's definitions, names defined differently are refused, a bundle that
+cannot be written is used from memory, and the process-wide bundle is
+reloaded when its sources change.
+
+Run with: python -m pytest debate_agents/test_agent_specs.py
+"""
+
+import functools
+import logging
+
+import pytest
+
+from debate_agents import agent_specs
+from debate_agents.agent_specs import AgentSpecError, compile_bundle, load_bundle
+
+MODERATOR = "name: ModeratorAgent\ndescription: Moderates the debate\nsystem: Keep order.\n"
+
+
+def write_sources(root, sources):
+    for source, text in sources.items():
+        path = root / source
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    write_sources(tmp_path, {
+        "adk-project/agents/moderator_agent.yaml": MODERATOR,
+        "adk-project/debate_agents/moderator_agent.yaml": MODERATOR,
+        "orchestrate/agents/debate_agent/debate_agent.yaml": MODERATOR.replace("Keep order.", "Be brief."),
+    })
+    return tmp_path
+
+
+def test_copies_of_a_definition_are_one_agent(repo):
+    bundle = agent_specs.AgentSpecBundle(compile_bundle(repo))
+    assert len(bundle) == 3
+    assert bundle.get("ModeratorAgent").spec["system"] == "Keep order."
+    assert bundle.names() == ["ModeratorAgent"]
+    assert bundle.get("Unknown") is None
+
+
+def test_names_defined_differently_are_refused(repo):
+    write_sources(repo, {"adk-project/agents/moderator_v2.yaml": MODERATOR.replace("Keep order.", "Be strict.")})
+    bundle = agent_specs.AgentSpecBundle(compile_bundle(repo))
+    with pytest.raises(AgentSpecError, match="moderator_v2.yaml"):
+        bundle.get("ModeratorAgent")
+    # Each definition can still be reached through its file
+    assert bundle.by_source("adk-project/agents/moderator_v2.yaml").spec["system"] == "Be strict."
+
+
+def test_unwritable_bundle_is_used_from_memory(repo, monkeypatch, caplog):
+    def read_only(data, path):
+        raise PermissionError(13, "Read-only file system", str(path))
+
+    monkeypatch.setattr(agent_specs, "write_bundle", read_only)
+    with caplog.at_level(logging.WARNING, logger="debate_agents.agent_specs"):
+        bundle = load_bundle(repo / "bundle.json", root=repo)
+    assert bundle.get("ModeratorAgent") is not None
+    assert "from memory" in caplog.text
+
+
+def test_process_wide_bundle_is_reloaded_by_check(repo, monkeypatch):
+    path = repo / "bundle.json"
+    stale_sources = agent_specs.stale_sources
+    monkeypatch.setattr(agent_specs, "stale_sources", lambda data, root=repo: stale_sources(data, root))
+    monkeypatch.setattr(agent_specs, "load_bundle", functools.partial(load_bundle, path, repo))
+    monkeypatch.setattr(agent_specs, "_bundle", None)
+
+    bundle = agent_specs.get_bundle(check_interval=None)
+    assert agent_specs.get_bundle() is bundle
+    assert not agent_specs.check_bundle()
+
+    write_sources(repo, {"adk-project/agents/moderator_agent.yaml": MODERATOR + "llm: large\n"})
+    assert agent_specs.check_bundle()
+    assert agent_specs.get_bundle().source_hash != bundle.source_hash
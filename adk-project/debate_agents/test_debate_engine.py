@@ -0,0 +1,56 @@
+# Debate Engine Tests
+
+"""
+Tests that the engine gives each phase to the right speakers: every
+participant in shared phases, only one side in the phases of two-sided
+formats, and the moderator in the phases it leads.
+
+Run with: python -m pytest debate_agents/test_debate_engine.py
+"""
+
+import asyncio
+
+from debate_agents.debate_agent_core import ModeratorAgent, PerspectiveAgent
+from debate_agents.debate_engine import DebateEngine
+from debate_agents.debate_flow_patterns import get_debate_flow
+
+PERSPECTIVES = ["progressive", "conservative", "libertarian"]
+
+
+def run_debate(flow_name, sides=None):
+    moderator = ModeratorAgent("ModeratorAgent", "Moderates the debate")
+    agents = [
+        PerspectiveAgent(f"{perspective.capitalize()}PerspectiveAgent", perspective.capitalize(), perspective)
+        for perspective in PERSPECTIVES
+    ]
+    names = [agent.name for agent in agents]
+    flow = get_debate_flow(flow_name)
+    flow.setup("Digital Inclusion", moderator.name, names, sides)
+    moderator.setup_debate("Digital Inclusion", flow_name, names)
+    result = asyncio.run(DebateEngine().run_debate(flow, agents, moderator))
+
+    speakers = {}
+    for turn in result["transcript"]:
+        assert turn["status"] == "success"
+        speakers.setdefault(turn["phase"], set()).add(turn["agent"])
+    return speakers
+
+
+def test_only_one_side_speaks_in_side_phases(fake_llm):
+    speakers = run_debate("Oxford Style")
+    proposition = {"ProgressivePerspectiveAgent", "LibertarianPerspectiveAgent"}
+    opposition = {"ConservativePerspectiveAgent"}
+    for stage in ("opening", "arguments", "closing"):
+        assert speakers[f"proposition_{stage}"] == proposition
+        assert speakers[f"opposition_{stage}"] == opposition
+    assert speakers["audience_questions"] == {"ModeratorAgent"}
+
+
+def test_flow_can_be_given_its_sides(fake_llm):
+    sides = {"proposition": ["ConservativePerspectiveAgent"], "opposition": ["ProgressivePerspectiveAgent"]}
+    speakers = run_debate("point_counterpoint", sides)
+    assert speakers["point_phase"] == {"ConservativePerspectiveAgent"}
+    assert speakers["counterpoint_phase"] == {"ProgressivePerspectiveAgent"}
+    assert speakers["position_statements"] == {
+        "ProgressivePerspectiveAgent", "ConservativePerspectiveAgent", "LibertarianPerspectiveAgent"
+    }
@@ -0,0 +1,65 @@
+# Debate History Tests
+
+"""
+Tests of the token-budgeted debate history: recent turns are kept verbatim,
+older turns are folded into the summary by their first sentence, and the
+rendered history stays within the budget however long the debate or its
+turns run.
+
+Run with: python -m pytest debate_agents/test_debate_history.py
+"""
+
+from debate_agents.debate_history import DebateHistory, estimate_tokens, truncate_text
+
+
+def test_truncate_text_cuts_at_a_word_boundary():
+    assert truncate_text("Markets close the gap", 100) == "Markets close the gap"
+    assert truncate_text("Markets close the gap", 16) == "Markets close..."
+    assert len(truncate_text("x" * 50, 10)) == 10
+
+
+def test_older_turns_are_folded_into_the_summary():
+    history = DebateHistory(verbatim_turns=2)
+    for i in range(4):
+        history.record_turn(f"Agent{i}", f"Point {i} first. Supporting detail {i}.")
+
+    assert len(history) == 2
+    assert history.turn_count == 4
+    assert history.summary_lines == ["Agent0: Point 0 first.", "Agent1: Point 1 first."]
+    rendered = history.render()
+    assert rendered.startswith("Summary of earlier discussion:\nAgent0: Point 0 first.")
+    assert "Recent turns:\nAgent2: Point 2 first. Supporting detail 2.\nAgent3:" in rendered
+
+
+def test_long_debates_stay_within_the_budget():
+    history = DebateHistory(token_budget=200, verbatim_turns=6)
+    for i in range(200):
+        history.record_turn("ConservativePerspectiveAgent", f"Argument {i}. " + "Markets adapt faster. " * 5)
+        assert history.token_count() <= 200
+        assert estimate_tokens(history.render()) <= history.token_count()
+    assert history.turn_count == 200
+    assert history.summary_lines[-1].startswith("ConservativePerspectiveAgent: Argument")
+
+
+def test_a_turn_longer_than_the_budget_is_cut():
+    history = DebateHistory(token_budget=100)
+    history.append("word " * 500)
+
+    assert len(history) == 1
+    assert history.turns[0]["speaker"] == "unknown"
+    assert history.turns[0]["statement"].endswith("...")
+    assert estimate_tokens(history.render()) <= 100
+
+
+def test_custom_summarizer_is_called_once_per_folded_turn():
+    folded = []
+
+    def summarizer(lines, turn):
+        folded.append(turn["speaker"])
+        return lines + [turn["speaker"]]
+
+    history = DebateHistory(verbatim_turns=1, summarizer=summarizer)
+    for speaker in ("A", "B", "C"):
+        history.record_turn(speaker, "Statement.")
+    assert folded == ["A", "B"]
+    assert history.summary == "A\nB"
@@ -0,0 +1,65 @@
+# Flow Registry Tests
+
+"""
+Tests of the flow registry: configured formats are compiled next to the
+built-in ones, share phase tables where they can, and are found by any
+spelling of their name; get_debate_flow builds the right flow class for each.
+
+Run with: python -m pytest debate_agents/test_flow_registry.py
+"""
+
+from debate_agents.config_service import FormatEntry
+from debate_agents.debate_flow_patterns import DebateFlow, StructuredDebateFlow, get_debate_flow
+from debate_agents.flow_registry import (
+    STRUCTURED_PHASES, FlowRegistry, compile_flows, normalize_flow_name, phase_instructions
+)
+
+
+def test_names_are_normalized():
+    assert normalize_flow_name("Oxford Style") == "oxford_style"
+    assert normalize_flow_name("point-counterpoint") == "point_counterpoint"
+    assert normalize_flow_name("  Town   Hall ") == "town_hall"
+
+
+def test_configured_formats_are_compiled_next_to_the_builtin_ones():
+    registry = FlowRegistry(compile_flows([
+        FormatEntry("Structured", "", ("opening_statements", "cross_examination", "rebuttal", "closing_statements")),
+        FormatEntry("Lightning Round", "Quick takes.", ("opening_statement", "lightning_takes")),
+        FormatEntry("Roundtable", "Configured description.", ()),
+        FormatEntry("Unphased", "Nothing to run.", ()),
+    ]))
+
+    # Phases matching the built-in table reuse it
+    assert registry.get("structured").phases is STRUCTURED_PHASES
+    assert registry.get("roundtable").description == "Configured description."
+
+    lightning = registry.get("Lightning Round")
+    assert lightning.name == "lightning_round"
+    assert [phase["name"] for phase in lightning.phases] == ["opening_statement", "lightning_takes"]
+    assert lightning.phases[0]["instructions"] == phase_instructions("opening_statement")
+    assert lightning.phases[1]["instructions"] == "Lightning takes."
+
+    assert "unphased" not in registry
+    assert registry.get("Unknown") is None
+    assert len(registry) == 4
+
+
+def test_later_formats_replace_earlier_ones():
+    registry = FlowRegistry(compile_flows([
+        FormatEntry("Town Hall", "First.", ("moderator_introduction",)),
+        FormatEntry("town_hall", "Second.", ("moderator_introduction", "moderator_summary")),
+    ]))
+    assert registry.get("Town Hall").description == "Second."
+    assert len(registry.get("Town Hall").phases) == 2
+
+
+def test_get_debate_flow_keeps_builtin_flow_classes():
+    structured = get_debate_flow("structured")
+    assert type(structured) is StructuredDebateFlow
+    oxford = get_debate_flow("Oxford Style")
+    assert type(oxford) is DebateFlow
+    assert oxford.phases[0]["name"] == "proposition_opening"
+    assert get_debate_flow("No Such Format") is None
+
+    # Every flow of a format shares its phase table
+    assert get_debate_flow("Oxford Style").phases is oxford.phases
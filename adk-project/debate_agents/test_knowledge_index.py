@@ -0,0 +1,64 @@
+# Knowledge Index Tests
+
+"""
+Tests of the BM25 knowledge index: terms are normalized, documents are ranked
+by relevance, misspelled query terms match similar indexed terms, and
+replaced or removed documents leave no trace in the results.
+
+Run with: python -m pytest debate_agents/test_knowledge_index.py
+"""
+
+import pytest
+
+from debate_agents.knowledge_index import KnowledgeIndex, tokenize
+
+DOCUMENTS = {
+    "carbon": "Carbon pricing mechanisms create economic incentives",
+    "regulation": "Government regulations enforce emissions standards",
+    "broadband": "Public funding extends broadband to rural communities",
+}
+
+
+@pytest.fixture
+def index():
+    index = KnowledgeIndex()
+    for doc_id, text in DOCUMENTS.items():
+        index.add_document(doc_id, text)
+    return index
+
+
+def test_tokenize_drops_stop_words_and_folds_plurals():
+    assert tokenize("The Regulations of the Communities") == ["regulation", "community"]
+    assert tokenize("the and of") == []
+
+
+def test_search_ranks_the_matching_document_first(index):
+    results = index.search("carbon pricing")
+    assert results[0][0] == "carbon"
+    assert all(doc_id != "broadband" for doc_id, _ in results)
+    assert index.search("regulation")[0][0] == "regulation"
+
+
+def test_misspelled_terms_match_similar_terms(index):
+    results = index.search("brodband")
+    assert [doc_id for doc_id, _ in results] == ["broadband"]
+    # A fuzzy match scores below an exact one
+    assert results[0][1] < index.search("broadband")[0][1]
+
+
+def test_replaced_and_removed_documents_leave_no_trace(index):
+    index.add_document("carbon", "Nuclear power provides baseload energy")
+    assert index.search("carbon") == []
+    assert index.search("nuclear")[0][0] == "carbon"
+    assert len(index) == 3
+
+    assert index.remove_document("carbon")
+    assert not index.remove_document("carbon")
+    assert "carbon" not in index
+    assert index.search("nuclear") == []
+    assert index.search("nucleer") == []
+
+
+def test_empty_index_and_stop_word_queries_match_nothing(index):
+    assert KnowledgeIndex().search("carbon") == []
+    assert index.search("the and of") == []
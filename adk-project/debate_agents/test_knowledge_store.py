@@ -0,0 +1,121 @@
+# Knowledge Store Tests
+
+"""
+Tests that a knowledge store file round-trips the topics it was built from,
+is replaced atomically, and serves DebateKnowledgeBase's lookups and searches
+alongside topics added in memory.
+
+Run with: python -m pytest debate_agents/test_knowledge_store.py
+"""
+
+import os
+
+import pytest
+
+from debate_agents.knowledge_store import MappedKnowledgeBase, build_store
+
+TOPICS = [
+    {
+        "topic": "Digital Inclusion",
+        "description": "Debate on how to ensure everyone can access and use digital technologies",
+        "perspectives": [
+            {"position": "Public Infrastructure Investment",
+             "key_points": ["Public funding should extend broadband to rural communities"]},
+            {"position": "Private Sector Expansion",
+             "key_points": ["Competition among providers lowers prices for internet service"]}
+        ]
+    },
+    {
+        "topic": "Survival Situation",
+        "description": "Debate on how limited resources should be allocated in a crisis",
+        "perspectives": [
+            {"position": "Equal Distribution", "key_points": ["Every person has an equal claim to resources"]},
+            {"position": "Needs-Based Allocation", "key_points": ["The most vulnerable should receive resources first"]}
+        ]
+    },
+    {"topic": "Café Culture", "description": "Non-ASCII names are stored as UTF-8", "perspectives": []}
+]
+
+EXTRA_TOPIC = {
+    "topic": "Remote Work",
+    "description": "Debate on whether offices still matter",
+    "perspectives": [{"position": "Office First", "key_points": ["Teams learn faster side by side"]}]
+}
+
+
+@pytest.fixture
+def knowledge_base(store_path):
+    """Open a DebateKnowledgeBase serving the test store, closing it afterwards."""
+    # debate_knowledge imports the Orchestrate SDK
+    pytest.importorskip("ibm_watsonx_orchestrate")
+    from debate_agents.debate_knowledge import DebateKnowledgeBase
+
+    bases = []
+
+    def open_base(topics=None):
+        bases.append(DebateKnowledgeBase(topics, store=store_path))
+        return bases[-1]
+
+    yield open_base
+    for base in bases:
+        base.close()
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    path = str(tmp_path / "topics.dkb")
+    build_store(TOPICS, path)
+    return path
+
+
+def test_store_round_trips_its_topics(store_path):
+    with MappedKnowledgeBase(store_path) as store:
+        assert len(store) == len(TOPICS)
+        assert store.get_available_topics() == [topic["topic"] for topic in TOPICS]
+        for topic in TOPICS:
+            assert store.get_topic_information(topic["topic"].upper()) == topic
+        assert store.get_perspective("digital inclusion", "private sector expansion") == \
+            TOPICS[0]["perspectives"][1]
+        assert store.get_topic_information("CAFÉ CULTURE") == TOPICS[2]
+        assert store.get_topic_information("Space Exploration") is None
+
+
+def test_rebuilding_replaces_the_store_without_leftovers(store_path, tmp_path):
+    with MappedKnowledgeBase(store_path) as old:
+        build_store([EXTRA_TOPIC], store_path)
+        # A worker that mapped the old file keeps reading it
+        assert len(old) == len(TOPICS)
+    with MappedKnowledgeBase(store_path) as new:
+        assert new.get_available_topics() == ["Remote Work"]
+    assert os.listdir(tmp_path) == ["topics.dkb"]
+
+
+def test_failed_build_leaves_the_old_store(store_path, tmp_path):
+    with pytest.raises(ValueError):
+        build_store([EXTRA_TOPIC, EXTRA_TOPIC], store_path)
+    with MappedKnowledgeBase(store_path) as store:
+        assert len(store) == len(TOPICS)
+    assert os.listdir(tmp_path) == ["topics.dkb"]
+
+
+def test_knowledge_base_serves_lookups_from_the_store(knowledge_base):
+    kb = knowledge_base()
+    assert kb.get_available_topics() == [topic["topic"] for topic in TOPICS]
+    assert kb.get_topic_information("digital inclusion") == TOPICS[0]
+    assert kb.get_perspective("Survival Situation", "equal distribution") == TOPICS[1]["perspectives"][0]
+    assert kb.search("broadband rural")[0]["topic"] == "Digital Inclusion"
+
+
+def test_added_and_removed_topics_take_precedence_over_the_store(knowledge_base):
+    kb = knowledge_base([EXTRA_TOPIC])
+    replacement = dict(TOPICS[0], description="Replaced in memory", perspectives=[])
+    kb.add_topic(replacement)
+    assert kb.get_topic_information("Digital Inclusion") is replacement
+    assert kb.get_perspective("Digital Inclusion", "Private Sector Expansion") is None
+
+    assert kb.remove_topic("Survival Situation")
+    assert not kb.remove_topic("Survival Situation")
+    assert kb.get_topic_information("Survival Situation") is None
+    assert kb.search("vulnerable resources") == []
+
+    assert kb.get_available_topics() == ["Café Culture", "Remote Work", "Digital Inclusion"]
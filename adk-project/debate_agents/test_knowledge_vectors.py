@@ -0,0 +1,52 @@
+# Knowledge Vectors Tests
+
+"""
+Tests that the vector index finds paraphrases, returns exactly the nearest
+vectors of a full matrix product, and matches nothing for queries without
+indexed terms.
+
+Run with: python -m pytest debate_agents/test_knowledge_vectors.py
+"""
+
+import numpy as np
+
+from debate_agents.knowledge_vectors import VectorIndex
+
+POINTS = [
+    "Public funding should extend broadband to rural and low-income communities",
+    "Carbon pricing mechanisms can create economic incentives",
+    "Early regulatory frameworks can prevent harmful applications",
+    "The most vulnerable should receive resources first",
+]
+
+
+def test_paraphrases_find_the_same_key_point():
+    index = VectorIndex()
+    index.add(list(range(len(POINTS))), POINTS)
+    assert index.search("broadband access gaps", k=1)[0][0] == 0
+    assert index.search("a price on emissions", k=1)[0][0] == 1
+
+
+def test_queries_without_indexed_terms_match_nothing():
+    index = VectorIndex()
+    index.add(list(range(len(POINTS))), POINTS)
+    assert index.search("the and of it") == []
+    assert index.search_batch(["", "carbon"], k=1) == [[], [(1, index.search("carbon", k=1)[0][1])]]
+
+
+def test_results_match_a_full_matrix_product():
+    rng = np.random.default_rng(7)
+    words = [f"term{i}" for i in range(300)]
+    texts = [" ".join(rng.choice(words, 8)) for _ in range(500)]
+    index = VectorIndex()
+    # Added in two parts, so the storage grows once
+    index.add(list(range(250)), texts[:250])
+    index.add(list(range(250, 500)), texts[250:])
+
+    # Queries setting different dimensions are scored one by one; queries
+    # setting the same ones share one product
+    for queries in ([" ".join(rng.choice(words, n)) for n in (2, 3, 40)], ["term1 term2"] * 3):
+        scores = index.embedder.embed_batch(queries) @ index.embedder.embed_batch(texts).T
+        for query, row, matches in zip(queries, scores, index.search_batch(queries, k=5)):
+            assert np.allclose([score for _, score in matches], sorted(row, reverse=True)[:5], atol=1e-6)
+            assert matches == index.search(query, k=5)
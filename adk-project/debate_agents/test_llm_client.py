@@ -0,0 +1,240 @@
+# LLM Client Tests
+
+"""
+Tests of how the LLM client routes requests: hedging a slow call within the
+hedge budget, walking the fallback chain, failing fast while a circuit is
+open, backing off when a backend answers 429, and streaming. Backends are scripted FakeBackends and
+circuit breakers use a manual clock, so the outcome of every call is known
+in advance.
+
+Run with: python -m pytest debate_agents/test_llm_client.py
+"""
+
+import asyncio
+
+import pytest
+
+from debate_agents.llm_client import HEDGE_BURST, BackendError, CircuitOpenError, FakeBackend, LLMClient
+from debate_agents.request_control import AdaptiveRateLimiter, CircuitBreaker
+
+# Latency of a call that only ends when it is cancelled
+HANGS = float("inf")
+
+
+class ScriptedBackend(FakeBackend):
+    """FakeBackend whose calls follow a script of latencies and errors.
+
+    Each call takes the next entry: a latency in seconds, HANGS, or a
+    BackendError status to fail with. Once the script runs out, calls
+    answer at once.
+    """
+
+    def __init__(self, name, script=()):
+        super().__init__(name)
+        self.script = list(script)
+        self.cancelled = 0
+
+    async def _generate(self, prompt, model, max_tokens):
+        step = self.script.pop(0) if self.script else 0.0
+        if isinstance(step, int):
+            raise BackendError(self.name, f"HTTP {step}", step, retry_after=0.0 if step == 429 else None)
+        try:
+            if step == HANGS:
+                await asyncio.Event().wait()
+            await asyncio.sleep(step)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return f"{self.name} answers {model or 'default'}"
+
+    async def _stream(self, prompt, model, max_tokens):
+        # Streams follow the same script, answering in one piece
+        yield await self._generate(prompt, model, max_tokens)
+
+
+def generate(client, prompt="Task: Rebut the argument.", **kwargs):
+    try:
+        return client.generate_sync(prompt, **kwargs)
+    finally:
+        client.close()
+
+
+def hedging_client(backend):
+    # Enough fast samples that requests are hedged after hedge_min_delay
+    for _ in range(20):
+        backend.latencies.record(0.001)
+    return LLMClient({backend.name: backend}, backend.name, hedge_min_delay=0.05)
+
+
+def test_hedge_wins_when_the_first_call_hangs():
+    backend = ScriptedBackend("primary", [HANGS, 0.0])
+    client = hedging_client(backend)
+    completion = generate(client)
+    assert completion.text == "primary answers default"
+    assert (client.hedged, client.hedge_wins) == (1, 1)
+    assert backend.requests == 2
+    assert backend.cancelled == 1
+
+
+def test_hedge_loses_when_the_first_call_answers_first():
+    backend = ScriptedBackend("primary", [0.1, HANGS])
+    client = hedging_client(backend)
+    generate(client)
+    assert (client.hedged, client.hedge_wins) == (1, 0)
+    assert backend.cancelled == 1
+
+
+def test_fast_calls_are_not_hedged():
+    backend = ScriptedBackend("primary", [0.0])
+    client = hedging_client(backend)
+    generate(client)
+    assert (client.hedged, client.hedge_wins) == (0, 0)
+    assert backend.requests == 1
+
+
+def test_failures_walk_the_fallback_chain():
+    backends = {
+        "primary": ScriptedBackend("primary", [503]),
+        "secondary": ScriptedBackend("secondary", [500]),
+        "tertiary": ScriptedBackend("tertiary")
+    }
+    fallbacks = {"primary": ("secondary", None), "secondary": ("tertiary", "small")}
+    client = LLMClient(backends, "primary", fallbacks=fallbacks)
+    completion = generate(client, model="large")
+    assert completion.backend == "tertiary"
+    assert completion.text == "tertiary answers small"
+    assert client.fallback_calls == 2
+    assert [backend.errors for backend in backends.values()] == [1, 1, 0]
+
+
+def test_fallback_cycle_raises_the_last_error():
+    backends = {"primary": ScriptedBackend("primary", [503]), "secondary": ScriptedBackend("secondary", [500])}
+    fallbacks = {"primary": ("secondary", None), "secondary": ("primary", None)}
+    client = LLMClient(backends, "primary", fallbacks=fallbacks)
+    with pytest.raises(BackendError) as error:
+        generate(client)
+    assert error.value.status == 500
+    assert backends["primary"].requests == 1
+
+
+def breaking_client(clock, fallbacks=None):
+    backends = {"primary": ScriptedBackend("primary", [503, 503]), "secondary": ScriptedBackend("secondary")}
+    breaker = CircuitBreaker(failure_rate=0.5, window=2, min_calls=2, open_seconds=10.0, clock=clock)
+    return LLMClient(backends, "primary", breakers={"primary": breaker}, fallbacks=fallbacks)
+
+
+def test_open_circuit_fails_fast_then_recovers_through_a_probe(clock):
+    client = breaking_client(clock)
+    primary = client.backends["primary"]
+    breaker = client.breakers["primary"]
+    try:
+        for _ in range(2):
+            with pytest.raises(BackendError):
+                client.generate_sync("Task: A.")
+        assert breaker.state == CircuitBreaker.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            client.generate_sync("Task: B.")
+        assert primary.requests == 2
+
+        clock.advance(10.0)
+        assert client.generate_sync("Task: C.").backend == "primary"
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert primary.requests == 3
+    finally:
+        client.close()
+
+
+def test_open_circuit_sends_calls_to_the_fallback(clock):
+    client = breaking_client(clock, fallbacks={"primary": ("secondary", None)})
+    try:
+        backends = [client.generate_sync(f"Task: {i}.").backend for i in range(4)]
+        assert backends == ["secondary"] * 4
+        assert client.backends["primary"].requests == 2
+        assert client.breakers["primary"].stats()["rejected"] == 2
+    finally:
+        client.close()
+
+
+def test_429_is_retried_after_the_limiter_backs_off():
+    backend = ScriptedBackend("primary", [429, 429])
+    limiter = AdaptiveRateLimiter(rate=100, cooldown=0.0)
+    client = LLMClient({"primary": backend}, "primary", limiters={"primary": limiter}, max_retries=2)
+    completion = generate(client)
+    assert completion.text == "primary answers default"
+    assert backend.requests == 3
+    assert limiter.throttled == 2
+    # Halved twice, then raised a little by the success
+    assert limiter.rate == pytest.approx(25 + 1 / 25)
+
+
+def test_429_is_raised_once_retries_run_out():
+    backend = ScriptedBackend("primary", [429, 429])
+    limiter = AdaptiveRateLimiter(rate=100, cooldown=0.0)
+    client = LLMClient({"primary": backend}, "primary", limiters={"primary": limiter}, max_retries=1)
+    with pytest.raises(BackendError) as error:
+        generate(client)
+    assert error.value.status == 429
+    assert backend.requests == 2
+    assert limiter.rate == 25
+
+
+def test_stream_yields_the_reply_piece_by_piece():
+    backend = FakeBackend("primary")
+    client = LLMClient({"primary": backend}, "primary")
+
+    async def read():
+        return [piece async for piece in client.astream("Task: Rebut the argument.")]
+
+    try:
+        pieces = asyncio.run(read())
+        assert len(pieces) > 1
+        assert "".join(pieces) == client.generate_sync("Task: Rebut the argument.").text
+        assert list(client.stream_sync("Task: Rebut the argument.")) == pieces
+    finally:
+        client.close()
+
+
+def test_stream_falls_back_before_its_first_piece():
+    backends = {"primary": ScriptedBackend("primary", [503]), "secondary": ScriptedBackend("secondary")}
+    client = LLMClient(backends, "primary", fallbacks={"primary": ("secondary", None)})
+    try:
+        assert "".join(client.stream_sync("Task: A.")) == "secondary answers default"
+        assert client.fallback_calls == 1
+    finally:
+        client.close()
+
+
+def test_cancelled_first_call_records_its_elapsed_time():
+    backend = ScriptedBackend("primary", [HANGS, 0.0])
+    client = hedging_client(backend)
+    generate(client)
+    # The hedge's latency and a lower bound on the cancelled call's
+    assert backend.latencies.count() == 22
+    assert backend.latencies.percentile(100) >= 0.05
+
+
+def test_hedge_rate_stays_within_budget_under_steady_slow_traffic():
+    backend = ScriptedBackend("primary", [0.02] * 400)
+    client = hedging_client(backend)
+    client.hedge_min_delay = 0.005
+
+    async def wave():
+        await asyncio.gather(*(client.generate(f"Task: {i}.") for i in range(40)))
+
+    try:
+        for _ in range(5):
+            asyncio.run(wave())
+        # Every call was slow enough to hedge, but only the burst and a tenth
+        # of the calls were
+        assert client.hedged + client.hedges_over_budget == 200
+        assert client.hedged <= HEDGE_BURST + client.hedge_budget * 200
+    finally:
+        client.close()
+
+
+def test_zero_quota_refuses_every_request():
+    backend = FakeBackend("primary", quota=0)
+    with pytest.raises(BackendError) as error:
+        asyncio.run(backend.generate("Task: A."))
+    assert (error.value.status, error.value.retry_after) == (429, 1.0)
@@ -0,0 +1,65 @@
+# Prompt Engine Tests
+
+"""
+Tests of the prompt engine: an agent's persona comes from its YAML
+definition, agents without one use the persona of debate_agent_config.json,
+and every call for the same agent and phase shares its static prefix.
+
+Run with: python -m pytest debate_agents/test_prompt_engine.py
+"""
+
+import pytest
+
+from debate_agents.agent_specs import AgentSpecBundle, AgentSpecError, compile_bundle, validate_spec
+from debate_agents.config_service import ConfigService
+from debate_agents.prompt_engine import PromptEngine
+
+CONSERVATIVE = """name: ConservativePerspectiveAgent
+description: Argues the conservative perspective
+system: Argue for caution.
+persona:
+  role: Conservative Advocate
+  tone: Measured
+"""
+
+PROGRESSIVE = """name: ProgressivePerspectiveAgent
+description: Argues the progressive perspective
+system: Argue for reform.
+"""
+
+
+@pytest.fixture
+def engine(tmp_path):
+    for name, text in (("conservative.yaml", CONSERVATIVE), ("progressive.yaml", PROGRESSIVE)):
+        path = tmp_path / "adk-project" / "agents" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return PromptEngine(AgentSpecBundle(compile_bundle(tmp_path)), ConfigService())
+
+
+def test_persona_comes_from_the_agent_definition(engine):
+    prefix = engine.template("ConservativePerspectiveAgent", "opening").prefix
+    assert "Role: Conservative Advocate\nTone: Measured" in prefix
+    assert "Debate Facilitator" not in prefix
+
+
+def test_agents_without_a_persona_use_the_global_one(engine):
+    prefix = engine.template("ProgressivePerspectiveAgent").prefix
+    assert prefix.startswith("Argue for reform.")
+    assert "Role: Debate Facilitator" in prefix
+    assert engine.template("UnknownAgent").prefix.count("Persona:") == 1
+
+
+def test_calls_share_the_static_prefix(engine):
+    first = engine.build("ConservativePerspectiveAgent", "Open the debate.", "Digital Inclusion", "opening")
+    second = engine.build("ConservativePerspectiveAgent", "Rebut.", "Climate Change", "opening", [
+        {"speaker": "ProgressivePerspectiveAgent", "statement": "Public networks close the gap."}
+    ])
+    assert first.prefix == second.prefix
+    assert first.dynamic != second.dynamic
+    assert engine.stats()["template_misses"] == 1
+
+
+def test_persona_must_be_a_mapping():
+    with pytest.raises(AgentSpecError, match="persona"):
+        validate_spec({"name": "A", "description": "B", "persona": "Friendly"}, "a.yaml")
@@ -0,0 +1,167 @@
+# Request Control Tests
+
+"""
+Tests of the rate limiter, circuit breaker and single flight on their own.
+The limiter and breaker are driven by the manual clock of conftest.py so
+every state change happens at a known time.
+
+Run with: python -m pytest debate_agents/test_request_control.py
+"""
+
+import asyncio
+
+import pytest
+
+from debate_agents.request_control import AdaptiveRateLimiter, CircuitBreaker, SingleFlight
+
+
+def test_limiter_halves_its_rate_on_a_429(clock):
+    limiter = AdaptiveRateLimiter(rate=8, clock=clock)
+    limiter.on_throttle()
+    assert limiter.rate == 4
+    assert limiter.stats()["throttled"] == 1
+
+
+def test_limiter_counts_a_burst_of_429s_once_per_cooldown(clock):
+    limiter = AdaptiveRateLimiter(rate=8, cooldown=1.0, clock=clock)
+    for _ in range(5):
+        limiter.on_throttle()
+    assert limiter.rate == 4
+    clock.advance(1.0)
+    limiter.on_throttle()
+    assert limiter.rate == 2
+    assert limiter.throttled == 6
+
+
+def test_limiter_never_drops_below_its_minimum_rate(clock):
+    limiter = AdaptiveRateLimiter(rate=4, min_rate=1.5, cooldown=0.0, clock=clock)
+    for _ in range(4):
+        limiter.on_throttle()
+    assert limiter.rate == 1.5
+
+
+def test_limiter_recovers_additively_up_to_its_maximum(clock):
+    limiter = AdaptiveRateLimiter(rate=8, clock=clock)
+    limiter.on_throttle()
+    limiter.on_success(0.1)
+    assert limiter.rate == pytest.approx(4.25)
+    for _ in range(100):
+        limiter.on_success(0.1)
+    assert limiter.rate == 8
+
+
+def test_limiter_backs_off_when_latency_exceeds_its_target(clock):
+    limiter = AdaptiveRateLimiter(rate=10, latency_target=0.5, clock=clock)
+    limiter.on_success(2.0)
+    assert limiter.rate == 9
+
+
+def test_limiter_serves_the_burst_without_waiting(clock):
+    limiter = AdaptiveRateLimiter(rate=3, clock=clock)
+
+    async def acquire_all():
+        return [await limiter.acquire() for _ in range(3)]
+
+    assert asyncio.run(acquire_all()) == [0.0, 0.0, 0.0]
+    assert limiter.stats()["acquired"] == 3
+
+
+def failing_breaker(clock):
+    breaker = CircuitBreaker(failure_rate=0.5, window=4, min_calls=4, open_seconds=10.0, clock=clock)
+    for success in [True, False, True, False]:
+        assert breaker.allow()
+        breaker.record(success)
+    return breaker
+
+
+def test_breaker_opens_once_the_failure_rate_is_reached(clock):
+    breaker = CircuitBreaker(failure_rate=0.5, window=4, min_calls=4, clock=clock)
+    for success in [False, True, True]:
+        breaker.record(success)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert failing_breaker(clock).state == CircuitBreaker.OPEN
+
+
+def test_breaker_goes_from_open_to_half_open_to_closed(clock):
+    breaker = failing_breaker(clock)
+    assert not breaker.allow()
+    clock.advance(9.9)
+    assert not breaker.allow()
+    assert breaker.rejected == 2
+
+    clock.advance(0.1)
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # Only the probe goes through while half open
+    assert not breaker.allow()
+
+    breaker.record(True)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+    assert breaker.stats() == {"state": "closed", "opened": 1, "rejected": 3}
+
+
+def test_failed_probe_opens_the_circuit_again(clock):
+    breaker = failing_breaker(clock)
+    clock.advance(10.0)
+    assert breaker.allow()
+    breaker.record(False)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.opened == 2
+    clock.advance(5.0)
+    assert not breaker.allow()
+
+
+def test_cancelled_probe_lets_another_probe_through(clock):
+    breaker = failing_breaker(clock)
+    clock.advance(10.0)
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.allow()
+
+
+def test_slow_successes_count_as_failures(clock):
+    breaker = CircuitBreaker(failure_rate=0.5, window=2, min_calls=2, slow_call=1.0, clock=clock)
+    breaker.record(True, latency=0.2)
+    breaker.record(True, latency=3.0)
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_single_flight_shares_one_call():
+    flight = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return "answer"
+
+    async def run():
+        return await asyncio.gather(*(flight.do("key", work) for _ in range(3)))
+
+    assert asyncio.run(run()) == ["answer"] * 3
+    assert (len(calls), flight.coalesced, flight.in_flight()) == (1, 2, 0)
+
+
+def test_caller_arriving_as_the_last_waiter_cancels_starts_a_new_call():
+    flight = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return len(calls)
+
+    async def run():
+        first = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        # Runs right after the cancelled caller gives up, before the call it
+        # cancelled has finished
+        second = asyncio.ensure_future(flight.do("key", work))
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(run()) == 2
+    assert flight.in_flight() == 0
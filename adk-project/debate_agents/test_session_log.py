@@ -0,0 +1,148 @@
+# Session Log Tests
+
+"""
+Tests that a worker rebuilds its debates from the session event log after a
+restart: logged turns survive, covered events are not replayed, corrupt and
+torn records are skipped, and finished debates are dropped.
+
+Run with: python -m pytest debate_agents/test_session_log.py
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from debate_agents.debate_agent_core import ModeratorAgent, PerspectiveAgent
+from debate_agents.debate_engine import DebateEngine
+from debate_agents.debate_flow_patterns import get_debate_flow
+from debate_agents.session_log import SessionEventLog
+
+PARTICIPANTS = ["ProgressivePerspectiveAgent", "ConservativePerspectiveAgent"]
+
+
+@pytest.fixture
+def open_log(tmp_path):
+    """Open the test worker's log, closing every log opened by the test."""
+    logs = []
+
+    def open_log():
+        log = SessionEventLog(tmp_path, worker_id="test", flush_interval=60)
+        logs.append(log)
+        return log
+
+    yield open_log
+    for log in logs:
+        if not log._closed.is_set():
+            log.close()
+
+
+def log_debate(log, session_id="debate-1", turns=2):
+    log.append(session_id, "setup", flow="roundtable", topic="Digital Inclusion", moderator="ModeratorAgent",
+               participants=PARTICIPANTS, current_phase=0)
+    for i in range(turns):
+        log.append(session_id, "turn", speaker=PARTICIPANTS[i % 2], statement=f"Statement {i}.")
+
+
+def test_logged_turns_survive_a_restart(open_log):
+    log = open_log()
+    log_debate(log)
+    log.append("debate-1", "phase", current_phase=1)
+    log.close()
+
+    state = open_log().sessions["debate-1"]
+    assert state["current_phase"] == 1
+    assert [turn["statement"] for turn in state["turns"]] == ["Statement 0.", "Statement 1."]
+
+
+def test_events_covered_by_the_snapshot_are_not_replayed(open_log):
+    log = open_log()
+    log_debate(log)
+    log.flush()
+    uncompacted = log.log_path.read_bytes()
+    log.snapshot()
+    log.close()
+    # A crash between writing the snapshot and truncating the log
+    log.log_path.write_bytes(uncompacted)
+
+    log = open_log()
+    assert len(log.sessions["debate-1"]["turns"]) == 2
+    assert log.seq == 3
+
+
+def test_corrupt_line_is_skipped(open_log):
+    log = open_log()
+    log_debate(log, turns=1)
+    log.close()
+    with open(log.log_path, "a", encoding="utf-8") as f:
+        f.write("{not json\n")
+        f.write(json.dumps({"session": "debate-1", "type": "turn", "speaker": "ModeratorAgent",
+                            "statement": "After the bad record.", "seq": 3}) + "\n")
+
+    turns = open_log().sessions["debate-1"]["turns"]
+    assert [turn["statement"] for turn in turns] == ["Statement 0.", "After the bad record."]
+
+
+def test_torn_tail_is_cut_off(open_log):
+    log = open_log()
+    log_debate(log, turns=1)
+    log.close()
+    intact = log.log_path.stat().st_size
+    with open(log.log_path, "a", encoding="utf-8") as f:
+        f.write('{"session": "debate-1", "type": "tu')
+
+    log = open_log()
+    assert len(log.sessions["debate-1"]["turns"]) == 1
+    assert log.log_path.stat().st_size == intact
+
+
+def setup_debate(log, session_id):
+    moderator = ModeratorAgent("ModeratorAgent", "Moderates the debate")
+    agents = [
+        PerspectiveAgent("ProgressivePerspectiveAgent", "Progressive", "progressive"),
+        PerspectiveAgent("ConservativePerspectiveAgent", "Conservative", "conservative")
+    ]
+    flow = get_debate_flow("roundtable")
+    flow.attach_event_log(log, session_id)
+    flow.setup("Digital Inclusion", moderator.name, [agent.name for agent in agents])
+    moderator.setup_debate("Digital Inclusion", "roundtable", [agent.name for agent in agents])
+    return flow, agents, moderator
+
+
+def test_engine_turns_are_logged(open_log, fake_llm):
+    log = open_log()
+    flow, agents, moderator = setup_debate(log, "debate-1")
+    engine = DebateEngine()
+
+    async def run_two_phases():
+        await engine.run_phase(flow, agents, moderator)
+        flow.next_phase()
+        return [event async for event in engine.stream_phase(flow, agents, moderator)]
+
+    asyncio.run(run_two_phases())
+    log.close()
+
+    state = open_log().sessions["debate-1"]
+    assert state["current_phase"] == 1
+    assert state["sides"] == {"proposition": PARTICIPANTS[:1], "opposition": PARTICIPANTS[1:]}
+    # The moderator's introduction, then both opening statements in either order
+    speakers = [turn["speaker"] for turn in state["turns"]]
+    assert speakers[0] == "ModeratorAgent"
+    assert sorted(speakers[1:]) == sorted(PARTICIPANTS)
+
+
+def test_finished_debates_are_dropped(open_log, fake_llm):
+    log = open_log()
+    finished, agents, moderator = setup_debate(log, "finished")
+    unfinished, _, _ = setup_debate(log, "unfinished")
+    asyncio.run(DebateEngine().run_debate(finished, agents, moderator))
+    assert finished.finished
+    assert set(log.sessions) == {"unfinished"}
+
+    # Finishing again records nothing
+    seq = log.seq
+    finished.finish()
+    assert log.seq == seq
+    log.snapshot()
+    log.close()
+    assert set(open_log().sessions) == {"unfinished"}
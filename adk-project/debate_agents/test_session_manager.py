@@ -0,0 +1,98 @@
+# Session Manager Tests
+
+"""
+Tests of the session manager: sessions move through their format's phases
+one by one or in bulk, idle sessions are evicted, and sessions are restored
+from recovered event log states, skipping states that no longer fit their
+format.
+
+Run with: python -m pytest debate_agents/test_session_manager.py
+"""
+
+import logging
+
+import pytest
+
+from debate_agents.session_log import SessionEventLog
+from debate_agents.session_manager import SessionManager
+
+PARTICIPANTS = ["ProgressivePerspectiveAgent", "ConservativePerspectiveAgent"]
+
+
+def create(manager, session_id, flow_name="structured"):
+    return manager.create(session_id, flow_name, "Digital Inclusion", "ModeratorAgent", PARTICIPANTS)
+
+
+def test_sessions_advance_alone_and_in_bulk(clock):
+    manager = SessionManager(clock=clock)
+    for session_id in ("a", "b", "c"):
+        create(manager, session_id)
+    assert manager.advance("a")["phase"] == "cross_examination"
+    assert manager.advance_all("opening_statements") == 2
+    assert sorted(manager.sessions_in_phase("cross_examination")) == ["a", "b", "c"]
+
+    for _ in range(2):
+        manager.advance("a")
+    assert manager.advance("a")["status"] == "complete"
+    assert manager.advance("unknown")["status"] == "error"
+
+
+def test_unknown_formats_and_duplicate_sessions_are_refused(clock):
+    manager = SessionManager(clock=clock)
+    create(manager, "a")
+    with pytest.raises(ValueError):
+        create(manager, "a")
+    with pytest.raises(ValueError):
+        create(manager, "b", "no_such_format")
+
+
+def test_idle_sessions_are_evicted(clock):
+    manager = SessionManager(clock=clock)
+    create(manager, "idle")
+    create(manager, "active")
+    clock.advance(30)
+    manager.get("active")
+    clock.advance(30)
+    assert manager.evict_idle(45) == ["idle"]
+    assert "idle" not in manager and "active" in manager
+
+
+def test_sessions_are_restored_from_the_event_log(tmp_path, clock):
+    log = SessionEventLog(tmp_path, worker_id="test", flush_interval=60)
+    manager = SessionManager(event_log=log, clock=clock)
+    create(manager, "a")
+    create(manager, "b", "roundtable")
+    manager.advance("a")
+    manager.advance("a")
+    manager.remove("b")
+    log.close()
+
+    log = SessionEventLog(tmp_path, worker_id="test", flush_interval=60)
+    try:
+        restored = SessionManager(clock=clock)
+        assert restored.restore(log.sessions) == 1
+        assert restored.get("a").phase["name"] == "rebuttal"
+        assert restored.sessions_in_phase("rebuttal") == ["a"]
+        # Sessions already tracked are left alone
+        assert restored.restore(log.sessions) == 0
+    finally:
+        log.close()
+
+
+@pytest.mark.parametrize("state_change", [
+    {"current_phase": 4},
+    {"current_phase": -1},
+    {"current_phase": "rebuttal"},
+    {"flow": "no_such_format"},
+])
+def test_states_that_no_longer_fit_their_format_are_skipped(clock, caplog, state_change):
+    state = {
+        "flow": "structured", "topic": "Digital Inclusion", "moderator": "ModeratorAgent",
+        "participants": PARTICIPANTS, "current_phase": 1
+    }
+    manager = SessionManager(clock=clock)
+    with caplog.at_level(logging.WARNING, logger="debate_agents.session_manager"):
+        assert manager.restore({"bad": dict(state, **state_change), "good": state}) == 1
+    assert "bad" not in manager
+    assert manager.get("good").phase["name"] == "cross_examination"
+    assert "Not restoring session bad" in caplog.text
@@ -5,12 +5,27 @@ This script tests the ViewpointExplorer agent with sample questions.
 """
 
 import os
+import sys
 import json
 import argparse
 import requests
 import time
+from pathlib import Path
 from dotenv import load_dotenv
 
+# Make the debate_agents package importable when run as a script
+sys.path.append(str(Path(__file__).parent.absolute().parent))
+from debate_agents.conversation_scripts import (
+    BASIC_MESSAGES,
+    DEBATE_CHOICE,
+    DEBATE_INITIAL_MESSAGES,
+    DEEPER_CHOICE,
+    DEEPER_INITIAL_MESSAGES,
+    DEEPER_RESPONSES,
+    WHITEBOARD_CHOICE,
+    WHITEBOARD_INITIAL_MESSAGES,
+)
+
 # Load environment variables
 load_dotenv()
 
@@ -65,12 +80,7 @@ def test_basic_conversation():
     print("\n--- Testing Basic Conversation Flow ---\n")
     
     # Test questions for a basic conversation flow
-    test_messages = [
-        "Hello, I'd like to explore my views on climate change.",
-        "I think we need to take immediate action to reduce carbon emissions.",
-        "Scientific reports show rising global temperatures and extreme weather events.",
-        "Those who oppose climate action often cite economic concerns, but I believe the long-term costs of inaction are greater."
-    ]
+    test_messages = BASIC_MESSAGES
     
     # Send messages and print responses
     for message in test_messages:
@@ -96,12 +106,7 @@ def test_deeper_questions_path():
     print("\n--- Testing Deeper Questions Path ---\n")
     
     # Initial conversation to get to the choice point
-    initial_messages = [
-        "I want to discuss education reform.",
-        "I believe we need to focus more on critical thinking skills and less on standardized testing.",
-        "My evidence is that students in countries with less testing often show better problem-solving abilities.",
-        "Those who oppose this view often worry about accountability and measuring progress."
-    ]
+    initial_messages = DEEPER_INITIAL_MESSAGES
     
     for message in initial_messages:
         print(f"\nUser: {message}")
@@ -114,8 +119,8 @@ def test_deeper_questions_path():
             print("Failed to get response")
     
     # Choose the deeper questions path
-    print("\nUser: I'd like to develop my perspective further with more detailed questions.")
-    response = send_message(conversation_id, "I'd like to develop my perspective further with more detailed questions.")
+    print(f"\nUser: {DEEPER_CHOICE}")
+    response = send_message(conversation_id, DEEPER_CHOICE)
     if response:
         agent_response = response.get("text", "No response")
         print(f"ViewpointExplorer: {agent_response}")
@@ -124,11 +129,7 @@ def test_deeper_questions_path():
         print("Failed to get response")
     
     # Answer deeper questions
-    deeper_responses = [
-        "I value creativity, critical thinking, and individual development over standardization.",
-        "As we learn more about different learning styles and personalized education, I think my view will evolve toward even more customized approaches.",
-        "I would reduce the frequency of standardized tests and give teachers more autonomy."
-    ]
+    deeper_responses = DEEPER_RESPONSES
     
     for message in deeper_responses:
         print(f"\nUser: {message}")
@@ -152,12 +153,7 @@ def test_debate_handoff():
     print("\n--- Testing Debate Handoff ---\n")
     
     # Initial conversation to get to the choice point
-    initial_messages = [
-        "I want to discuss universal basic income.",
-        "I think it could help reduce poverty and provide economic security.",
-        "Pilot programs have shown positive outcomes in terms of health and education.",
-        "Critics worry about funding and potential reduction in work incentives."
-    ]
+    initial_messages = DEBATE_INITIAL_MESSAGES
     
     for message in initial_messages:
         print(f"\nUser: {message}")
@@ -170,8 +166,8 @@ def test_debate_handoff():
             print("Failed to get response")
     
     # Choose the debate path
-    print("\nUser: I'd like to see different perspectives debate this topic.")
-    response = send_message(conversation_id, "I'd like to see different perspectives debate this topic.")
+    print(f"\nUser: {DEBATE_CHOICE}")
+    response = send_message(conversation_id, DEBATE_CHOICE)
     if response:
         agent_response = response.get("text", "No response")
         print(f"ViewpointExplorer: {agent_response}")
@@ -196,12 +192,7 @@ def test_whiteboard_handoff():
     print("\n--- Testing Whiteboard Handoff ---\n")
     
     # Initial conversation to get to the choice point
-    initial_messages = [
-        "I want to discuss artificial intelligence ethics.",
-        "I believe we need strong regulations to ensure AI is developed responsibly.",
-        "We've already seen issues with bias in algorithms and privacy concerns.",
-        "Some argue that too much regulation could stifle innovation."
-    ]
+    initial_messages = WHITEBOARD_INITIAL_MESSAGES
     
     for message in initial_messages:
         print(f"\nUser: {message}")
@@ -214,8 +205,8 @@ def test_whiteboard_handoff():
             print("Failed to get response")
     
     # Choose the whiteboard path
-    print("\nUser: I'd like to engage in a whiteboard session to map out my viewpoint.")
-    response = send_message(conversation_id, "I'd like to engage in a whiteboard session to map out my viewpoint.")
+    print(f"\nUser: {WHITEBOARD_CHOICE}")
+    response = send_message(conversation_id, WHITEBOARD_CHOICE)
     if response:
         agent_response = response.get("text", "No response")
         print(f"ViewpointExplorer: {agent_response}")
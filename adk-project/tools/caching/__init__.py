@@ -0,0 +1,3 @@
+from .cache import TOOL_CACHE, ToolCache, cached_tool
+
+__all__ = ["TOOL_CACHE", "ToolCache", "cached_tool"]
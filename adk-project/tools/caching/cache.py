@@ -0,0 +1,193 @@
+"""
+Shared result cache for tool functions.
+
+Results are kept in a size-bounded LRU with a per-entry TTL. Keys are built
+from normalized arguments, so "Climate Change" and " climate  change " share
+an entry, and concurrent identical calls are coalesced so only one of them
+runs the tool. Tools run on the normalized arguments, so a result is the
+same whichever spelling of a query arrives first, and every caller gets its
+own copy of it.
+"""
+
+import copy
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+
+
+def normalize_value(value):
+    """Normalize an argument value for use in a cache key."""
+    if isinstance(value, str):
+        return " ".join(value.lower().split())
+    if isinstance(value, dict):
+        return tuple(sorted((k, normalize_value(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(normalize_value(v) for v in value)
+    return value
+
+
+class _Call:
+    """A computation in flight that other callers can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class ToolCache:
+    """Thread-safe LRU cache with TTL expiry and single-flight loading."""
+
+    def __init__(self, max_size=1024, ttl=300.0, clock=time.monotonic):
+        """
+        Args:
+            max_size: Maximum number of cached results
+            ttl: Default seconds a result stays fresh
+            clock: Monotonic time source, replaceable in tests
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self._entries = OrderedDict()   # key -> (expires_at, result)
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.coalesced = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_compute(self, key, compute, ttl=None):
+        """
+        Return the cached result for a key, computing it on a miss.
+
+        If another thread is already computing the same key, wait for its
+        result instead of computing it again; if its computation fails, even
+        with a BaseException such as KeyboardInterrupt, the waiters raise the
+        same exception.
+
+        Args:
+            key: Hashable cache key
+            compute: Zero-argument callable producing the result
+            ttl: Seconds the result stays fresh, defaults to the cache TTL
+
+        Returns:
+            The cached or freshly computed result, shared by every caller
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > self.clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+                self.expirations += 1
+
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced += 1
+                owner = False
+            else:
+                call = self._calls[key] = _Call()
+                self.misses += 1
+                owner = True
+
+        if not owner:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = compute()
+        except BaseException as e:
+            call.error = e
+            raise
+        else:
+            self._store(key, call.result, self.ttl if ttl is None else ttl)
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def _store(self, key, result, ttl):
+        with self._lock:
+            self._entries[key] = (self.clock() + ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key=None):
+        """Drop one key, or every entry when no key is given."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self):
+        """
+        Report cache counters for sizing.
+
+        Returns:
+            dict: Hits, misses, evictions, expirations, coalesced calls,
+            current size and hit ratio
+        """
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "coalesced": self.coalesced,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hit_ratio": (self.hits + self.coalesced) / lookups if lookups else 0.0
+            }
+
+
+# Shared by every tool in the process so agents in different debates on the
+# same topic reuse each other's results.
+TOOL_CACHE = ToolCache()
+
+
+def cached_tool(cache=None, ttl=None):
+    """
+    Cache a tool function's results, keyed by its normalized arguments.
+
+    Apply it below @tool so the tool still sees the original signature.
+    The tool is called with its string arguments normalized, and each caller
+    gets a deep copy of the result, which it may change freely.
+
+    Args:
+        cache: ToolCache to use, defaults to the shared TOOL_CACHE
+        ttl: Seconds results stay fresh, defaults to the cache TTL
+    """
+    def decorator(func):
+        target = TOOL_CACHE if cache is None else cache
+        signature = inspect.signature(func)
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            for param, value in bound.arguments.items():
+                if isinstance(value, str):
+                    bound.arguments[param] = normalize_value(value)
+            key = (name, normalize_value(tuple(bound.arguments.items())))
+            result = target.get_or_compute(key, lambda: func(*bound.args, **bound.kwargs), ttl)
+            return copy.deepcopy(result)
+
+        return wrapper
+
+    return decorator
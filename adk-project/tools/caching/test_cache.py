@@ -0,0 +1,119 @@
+# Tool Cache Tests
+
+"""
+Tests of the shared tool cache: keys ignore case and spacing, every caller
+gets its own copy of a result, entries expire and are evicted, and callers
+coalesced onto one computation share its result or its failure.
+
+Run with: python -m pytest caching/test_cache.py
+"""
+
+import threading
+
+import pytest
+
+from caching.cache import ToolCache, cached_tool
+
+
+class ManualClock:
+    """Clock that only moves when a test advances it."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def search_tool(cache):
+    calls = []
+
+    @cached_tool(cache)
+    def search(query, limit=2):
+        calls.append(query)
+        return {"query": query, "results": [f"{query} {i}" for i in range(limit)]}
+
+    return search, calls
+
+
+def test_spellings_of_a_query_share_one_result():
+    search, calls = search_tool(ToolCache())
+    first = search(" Climate  Change ")
+    second = search("climate change", limit=2)
+    assert calls == ["climate change"]
+    assert first == second == {"query": "climate change", "results": ["climate change 0", "climate change 1"]}
+    assert search("climate change", 3)["results"][-1] == "climate change 2"
+
+
+def test_callers_get_their_own_copy():
+    search, _ = search_tool(ToolCache())
+    search("ai")["results"].append("mine")
+    assert search("ai")["results"] == ["ai 0", "ai 1"]
+
+
+def test_entries_expire_after_their_ttl():
+    clock = ManualClock()
+    cache = ToolCache(ttl=10.0, clock=clock)
+    search, calls = search_tool(cache)
+    search("ai")
+    clock.advance(9.9)
+    search("ai")
+    clock.advance(0.1)
+    search("ai")
+    assert calls == ["ai", "ai"]
+    assert cache.stats()["expirations"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ToolCache(max_size=2)
+    search, calls = search_tool(cache)
+    for query in ["a", "b", "a", "c", "a", "b"]:
+        search(query)
+    assert calls == ["a", "b", "c", "b"]
+    assert cache.stats()["evictions"] == 2
+
+
+class Interrupted(BaseException):
+    pass
+
+
+@pytest.mark.parametrize("error", [ValueError("search failed"), Interrupted()])
+def test_waiters_raise_the_owners_error(error):
+    cache = ToolCache()
+    started = threading.Event()
+    release = threading.Event()
+
+    def compute():
+        started.set()
+        release.wait()
+        raise error
+
+    def owner():
+        with pytest.raises(type(error)):
+            cache.get_or_compute("key", compute)
+
+    thread = threading.Thread(target=owner)
+    thread.start()
+    started.wait()
+    raised = []
+
+    def waiter():
+        try:
+            cache.get_or_compute("key", lambda: "never computed")
+        except BaseException as e:
+            raised.append(e)
+
+    waiters = [threading.Thread(target=waiter) for _ in range(3)]
+    for waiter_thread in waiters:
+        waiter_thread.start()
+    while cache.coalesced < 3:
+        threading.Event().wait(0.001)
+    release.set()
+    for waiter_thread in [thread] + waiters:
+        waiter_thread.join()
+    assert raised == [error] * 3
+    # A failed computation is not cached
+    assert cache.get_or_compute("key", lambda: "recomputed") == "recomputed"
@@ -1,6 +1,15 @@
+import sys
+from pathlib import Path
+
 from orchestrate.annotations import tool
 
+# The tools directory is not a package; put it on the path so the shared
+# cache imports the same way however this file is loaded
+sys.path.append(str(Path(__file__).parent.absolute()))
+from caching import cached_tool
+
 @tool
+@cached_tool()
 def debate_research(topic: str) -> dict:
     """
     A simple research tool that provides information on debate topics.
@@ -1,6 +1,15 @@
+import sys
+from pathlib import Path
+
 from orchestrate.annotations import tool
 
+# The tools directory is not a package; put it on the path so the shared
+# cache imports the same way however this file is loaded
+sys.path.append(str(Path(__file__).parent.parent.absolute()))
+from caching import cached_tool
+
 @tool
+@cached_tool()
 def search(query: str) -> dict:
     """
     A simple search tool that returns information about a given query.
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# ViewpointExplorer Session Store Benchmark
+
+"""
+Measures the session store under many users: the time to update every
+conversation once with a bounded in-memory cap, and the latency of restoring
+a spilled session when its user returns.
+
+Run with: python bench_session_store.py --users 100000
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from session_store import ViewpointSessionStore
+
+
+def run(users, max_sessions, restores):
+    """Run the benchmark and return its measurements."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "sessions.db")
+        with ViewpointSessionStore(path, max_sessions=max_sessions) as store:
+            start = time.perf_counter()
+            for i in range(users):
+                store.update(f"user-{i}", {
+                    "topic": "Digital Inclusion",
+                    "initial_response": f"Public networks close the gap for user {i}.",
+                    "stance": "progressive"
+                })
+            update_seconds = time.perf_counter() - start
+            in_memory = len(store)
+
+            # Only users that were spilled, so every get is a restore
+            spilled = random.Random(0).sample(range(users - max_sessions), min(restores, users - max_sessions))
+            latencies = []
+            for i in spilled:
+                start = time.perf_counter()
+                store.get(f"user-{i}")
+                latencies.append(time.perf_counter() - start)
+            latencies.sort()
+
+            return {
+                "users": users,
+                "max_sessions": max_sessions,
+                "in_memory": in_memory,
+                "updates_per_second": users / update_seconds,
+                "restores": store.stats["restores"],
+                "restore_median_ms": statistics.median(latencies) * 1000,
+                "restore_p99_ms": latencies[int(len(latencies) * 0.99)] * 1000
+            }
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark the ViewpointExplorer session store")
+    parser.add_argument("--users", type=int, default=100000, help="Number of conversations")
+    parser.add_argument("--max-sessions", type=int, default=5000, help="Sessions held in memory")
+    parser.add_argument("--restores", type=int, default=2000, help="Spilled sessions to restore")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.users, args.max_sessions, args.restores)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"Users:                    {results['users']} ({results['in_memory']} in memory)")
+    print(f"Updates/sec:              {results['updates_per_second']:,.0f}")
+    print(f"Restores:                 {results['restores']}")
+    print(f"Restore latency:          {results['restore_median_ms']:.3f} ms median, "
+          f"{results['restore_p99_ms']:.3f} ms p99")
+
+
+if __name__ == "__main__":
+    main()
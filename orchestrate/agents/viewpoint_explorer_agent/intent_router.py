@@ -0,0 +1,267 @@
+# ViewpointExplorer Intent Router
+
+"""
+This file contains the intent router used by the ViewpointExplorer agent to
+decide which specialized agent a user's exploration choice hands off to.
+
+Every phrase the router recognizes (option names, synonyms and numbered
+options) is compiled once into an Aho-Corasick automaton over words, so a
+user message is routed in a single pass over its words. Misspelt words are
+corrected against the phrase vocabulary with a precomputed deletion index.
+"""
+
+from typing import Dict, Any, List, Optional, Iterable, Tuple, NamedTuple
+from collections import deque
+from functools import lru_cache
+import re
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+# Words plus the punctuation that ends a clause, for scoping negation
+ROUTE_PATTERN = re.compile(r"[a-z0-9]+|[,.;:!?]")
+
+# Weights of the different kinds of phrase; a match's weight caps the confidence
+OPTION_WEIGHT = 1.0
+NUMBER_WEIGHT = 0.95
+BARE_NUMBER_WEIGHT = 0.9
+SYNONYM_WEIGHT = 0.85
+FUZZY_PENALTY = 0.8
+
+# Words shorter than this are never fuzzy-matched, to avoid "form" -> "forum"
+# style corrections of short common words
+FUZZY_MIN_LENGTH = 5
+
+# A match is dropped when one of these words comes at most NEGATION_WINDOW
+# words before it in the same clause, as in "I don't want a debate". The
+# tokenizer splits "don't" into "don" and "t". "Rather" and "instead" mark a
+# preference, so only what follows "than" or "instead of" is rejected, as in
+# "I'd rather watch a debate than listen to a podcast".
+NEGATION_WORDS = frozenset(["no", "not", "never", "t", "dont", "nor", "without", "than"])
+NEGATION_WINDOW = 6
+CLAUSE_BREAKS = frozenset([",", ".", ";", ":", "!", "?", "but"])
+
+NUMBER_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+ORDINAL_WORDS = ["first", "second", "third", "fourth", "fifth", "sixth", "seventh", "eighth", "ninth"]
+NUMBER_PREFIXES = ["option", "number", "choice", "option number"]
+
+DEFAULT_SYNONYMS = {
+    "whiteboard_agent": [
+        "whiteboard", "white board", "map out", "map it out", "mind map", "visualize",
+        "visualise", "sketch", "diagram", "develop my perspective", "develop my viewpoint",
+        "develop my view", "articulate my viewpoint"
+    ],
+    "forum_agent": [
+        "town hall", "townhall", "forum", "panel", "roundtable", "round table",
+        "group discussion", "multiple viewpoints", "hear from everyone"
+    ],
+    "debate_agent": [
+        "debate", "argue", "argue it out", "let them argue", "see both sides",
+        "structured debate", "perspectives debate", "round robin", "point counterpoint"
+    ],
+    "podcast_agent": [
+        "podcast", "listen", "audio", "audio discussion"
+    ]
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase words."""
+    return WORD_PATTERN.findall(text.lower())
+
+
+def _deletions(word: str) -> List[str]:
+    return [word[:i] + word[i + 1:] for i in range(len(word))]
+
+
+class Route(NamedTuple):
+    """The outcome of routing one message."""
+    agent: Optional[str]
+    confidence: float
+    matched: Tuple[str, ...]
+
+
+NO_ROUTE = Route(None, 0.0, ())
+
+
+class IntentRouter:
+    """
+    Routes free-form exploration choices to agents with a precompiled
+    word-level Aho-Corasick automaton.
+    """
+
+    def __init__(self, options: Iterable[Tuple[str, str]], synonyms: Optional[Dict[str, List[str]]] = None):
+        """
+        Compile the router.
+
+        Args:
+            options: (option phrase, agent) pairs in the order they are presented
+                to the user, so "option 2" routes to the second agent
+            synonyms: Additional phrases for each agent
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[Tuple[str, float, int, bool, str]]] = [[]]
+
+        for number, (phrase, agent) in enumerate(options, start=1):
+            self._add(phrase, agent, OPTION_WEIGHT)
+            if number <= len(NUMBER_WORDS):
+                for prefix in NUMBER_PREFIXES:
+                    self._add(f"{prefix} {number}", agent, NUMBER_WEIGHT)
+                    self._add(f"{prefix} {NUMBER_WORDS[number - 1]}", agent, NUMBER_WEIGHT)
+                self._add(f"{ORDINAL_WORDS[number - 1]} option", agent, NUMBER_WEIGHT)
+                self._add(f"{ORDINAL_WORDS[number - 1]} one", agent, NUMBER_WEIGHT)
+                for bare in (str(number), NUMBER_WORDS[number - 1], ORDINAL_WORDS[number - 1]):
+                    self._add(bare, agent, BARE_NUMBER_WEIGHT, standalone=True)
+
+        for agent, phrases in (synonyms or {}).items():
+            for phrase in phrases:
+                self._add(phrase, agent, SYNONYM_WEIGHT)
+
+        self._build_failure_links()
+
+        # Deletion index for correcting words within one edit of the vocabulary
+        self._vocabulary = set(word for node in self._goto for word in node)
+        self._deletion_index: Dict[str, set] = {}
+        for word in self._vocabulary:
+            if len(word) >= FUZZY_MIN_LENGTH:
+                for key in [word] + _deletions(word):
+                    self._deletion_index.setdefault(key, set()).add(word)
+        self._correct = lru_cache(maxsize=4096)(self._correct_word)
+
+    @classmethod
+    def from_config(cls, options: Iterable[Tuple[str, str]], config: Optional[Dict[str, Any]] = None) -> "IntentRouter":
+        """
+        Build a router from the default synonyms plus any configured ones.
+
+        Args:
+            options: (option phrase, agent) pairs in presentation order
+            config: Routing configuration; its "synonyms" entry maps agents to
+                additional phrases
+
+        Returns:
+            The compiled router
+        """
+        synonyms = {agent: list(phrases) for agent, phrases in DEFAULT_SYNONYMS.items()}
+        for agent, phrases in (config or {}).get("synonyms", {}).items():
+            synonyms.setdefault(agent, []).extend(phrases)
+        return cls(options, synonyms)
+
+    def _add(self, phrase: str, agent: str, weight: float, standalone: bool = False) -> None:
+        words = tokenize(phrase)
+        if not words:
+            return
+        node = 0
+        for word in words:
+            if word not in self._goto[node]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+                self._goto[node][word] = len(self._goto) - 1
+            node = self._goto[node][word]
+        phrase = " ".join(words)
+        # The first registration of a phrase for an agent wins, so a synonym
+        # repeating an option name does not count twice
+        if not any(out[0] == agent and out[4] == phrase for out in self._outputs[node]):
+            self._outputs[node].append((agent, weight, len(words), standalone, phrase))
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for word, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and word not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(word, 0)
+                self._fail[child] = target if target != child else 0
+                # Every phrase ending at the fallback node also ends here
+                self._outputs[child] = self._outputs[child] + self._outputs[self._fail[child]]
+
+    def _correct_word(self, word: str) -> Optional[str]:
+        """Find the vocabulary word within one edit of a word, if there is exactly one."""
+        if len(word) < FUZZY_MIN_LENGTH:
+            return None
+        candidates = set(self._deletion_index.get(word, ()))
+        for key in _deletions(word):
+            candidates.update(self._deletion_index.get(key, ()))
+        return candidates.pop() if len(candidates) == 1 else None
+
+    def route(self, text: str) -> Route:
+        """
+        Route one message.
+
+        Args:
+            text: The user's reply to the exploration options
+
+        Returns:
+            The target agent, a confidence between 0 and 1 and the matched phrases;
+            the agent is None if nothing matched
+        """
+        tokens = ROUTE_PATTERN.findall(text.lower())
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+
+        scores: Dict[str, float] = {}
+        best_weight: Dict[str, float] = {}
+        matched = []
+        # fuzzy_counts[i] is the number of corrected words among the first i words
+        fuzzy_counts = [0]
+        node = 0
+        # Index of the last negator in the current clause
+        negated_at = None
+        previous = None
+        i = -1
+
+        for position, word in enumerate(tokens):
+            if word in CLAUSE_BREAKS:
+                negated_at = None
+                if word != "but":
+                    continue
+            i += 1
+            if word in NEGATION_WORDS or (word == "of" and previous == "instead"):
+                negated_at = i
+            previous = word
+            corrected = False
+            if word not in self._vocabulary:
+                replacement = self._correct(word)
+                if replacement is not None:
+                    word, corrected = replacement, True
+            fuzzy_counts.append(fuzzy_counts[-1] + corrected)
+
+            while node and word not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(word, 0)
+
+            for agent, weight, length, standalone, phrase in outputs[node]:
+                fuzzy = fuzzy_counts[i + 1] - fuzzy_counts[i + 1 - length]
+                # Bare numbers like "2" or "second" only count as the whole
+                # reply, so "no one" picks nothing; "option 2" is a phrase
+                if standalone and (fuzzy or i or not CLAUSE_BREAKS.issuperset(tokens[position + 1:])):
+                    continue
+                if negated_at is not None and 0 < i + 1 - length - negated_at <= NEGATION_WINDOW:
+                    continue
+                weight *= FUZZY_PENALTY ** fuzzy
+                scores[agent] = scores.get(agent, 0.0) + weight
+                best_weight[agent] = max(best_weight.get(agent, 0.0), weight)
+                matched.append(phrase)
+
+        if not scores:
+            return NO_ROUTE
+
+        # Confidence is the strongest match for the winner, shared out when
+        # other agents were matched too
+        agent = max(scores, key=scores.get)
+        confidence = best_weight[agent] * scores[agent] / sum(scores.values())
+        return Route(agent, round(confidence, 4), tuple(matched))
+
+    def route_batch(self, texts: Iterable[str]) -> List[Route]:
+        """
+        Route many messages.
+
+        Args:
+            texts: The messages to route
+
+        Returns:
+            One route per message, in order
+        """
+        route = self.route
+        return [route(text) for text in texts]
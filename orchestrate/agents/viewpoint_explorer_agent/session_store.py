@@ -0,0 +1,232 @@
+# ViewpointExplorer Session Store
+
+"""
+This file contains the session store that lets one ViewpointExplorer agent
+serve many users. Each conversation's viewpoint state is held in memory while
+it is active. Sessions are spilled to SQLite when the store is full or a
+conversation goes idle, and restored from it when the user returns. Without a
+database, idle sessions stay in memory and only sessions beyond capacity are
+evicted, with a warning, since their state is lost.
+"""
+
+from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS viewpoint_sessions (
+    conversation_id TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    updated REAL NOT NULL
+)
+"""
+
+
+class ViewpointSessionStore:
+    """
+    Viewpoint state keyed by conversation ID, with a bounded in-memory LRU in
+    front of an optional SQLite database.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_sessions: int = 10000,
+                 idle_ttl: float = 1800.0, clock=time.monotonic):
+        """
+        Initialize the session store.
+
+        Args:
+            path: SQLite database file that evicted sessions are spilled to; without
+                one, sessions beyond max_sessions are discarded
+            max_sessions: Maximum number of sessions held in memory
+            idle_ttl: Seconds of inactivity after which a session is spilled; only
+                applies with a database
+            clock: Monotonic time source used for idle tracking
+        """
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        # conversation_id -> [state, last_active, dirty], least recently used first
+        self._sessions: "OrderedDict[str, list]" = OrderedDict()
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(SCHEMA)
+        self.stats = {"hits": 0, "restores": 0, "misses": 0, "spills": 0, "discards": 0}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, conversation_id: str) -> bool:
+        return conversation_id in self._sessions
+
+    def _restore(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            "SELECT state FROM viewpoint_sessions WHERE conversation_id = ?", (conversation_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _spill(self, entries: List[tuple]) -> None:
+        """Write (conversation_id, entry) pairs whose state changed to SQLite."""
+        rows = [
+            (conversation_id, json.dumps(entry[0]), time.time())
+            for conversation_id, entry in entries if entry[2]
+        ]
+        if rows and self._db is not None:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO viewpoint_sessions (conversation_id, state, updated) VALUES (?, ?, ?)",
+                rows
+            )
+            self.stats["spills"] += len(rows)
+        for _, entry in entries:
+            entry[2] = False
+
+    def _evict(self, now: float) -> None:
+        """Move idle sessions, and the least recently used beyond capacity, out of memory."""
+        evicted = []
+        # Idle sessions are only evicted when they can be spilled
+        cutoff = now - self.idle_ttl if self._db is not None else float("-inf")
+        while self._sessions:
+            conversation_id, entry = next(iter(self._sessions.items()))
+            if len(self._sessions) <= self.max_sessions and entry[1] > cutoff:
+                break
+            del self._sessions[conversation_id]
+            evicted.append((conversation_id, entry))
+        if not evicted:
+            return
+        if self._db is None:
+            if not self.stats["discards"]:
+                logger.warning(
+                    "Discarding viewpoint sessions beyond max_sessions=%d: no database to spill them to; "
+                    "further discards are counted in stats['discards']", self.max_sessions
+                )
+            self.stats["discards"] += len(evicted)
+        self._spill(evicted)
+
+    def _entry(self, conversation_id: str, now: float, create: bool = True) -> Optional[list]:
+        entry = self._sessions.get(conversation_id)
+        if entry is not None:
+            self.stats["hits"] += 1
+            self._sessions.move_to_end(conversation_id)
+        else:
+            state = self._restore(conversation_id)
+            self.stats["restores" if state is not None else "misses"] += 1
+            if state is None and not create:
+                return None
+            entry = [state if state is not None else {}, now, False]
+            self._sessions[conversation_id] = entry
+        entry[1] = now
+        return entry
+
+    def get(self, conversation_id: str) -> Dict[str, Any]:
+        """
+        Get a conversation's viewpoint state, restoring it if it was spilled.
+
+        Args:
+            conversation_id: The conversation to look up
+
+        Returns:
+            A copy of the state; an empty dict for a new conversation, which is
+            not held in memory until it is updated
+        """
+        with self._lock:
+            now = self.clock()
+            entry = self._entry(conversation_id, now, create=False)
+            if entry is None:
+                return {}
+            state = dict(entry[0])
+            self._evict(now)
+            return state
+
+    def update(self, conversation_id: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Merge fields into a conversation's viewpoint state.
+
+        Args:
+            conversation_id: The conversation to update
+            fields: JSON-serializable values to set
+
+        Returns:
+            A copy of the updated state
+        """
+        with self._lock:
+            now = self.clock()
+            entry = self._entry(conversation_id, now)
+            entry[0].update(fields)
+            entry[2] = True
+            state = dict(entry[0])
+            self._evict(now)
+            return state
+
+    def remove(self, conversation_id: str) -> bool:
+        """
+        Forget a conversation, in memory and in the database.
+
+        Returns:
+            True if the conversation was known
+        """
+        with self._lock:
+            found = self._sessions.pop(conversation_id, None) is not None
+            if self._db is not None:
+                cursor = self._db.execute(
+                    "DELETE FROM viewpoint_sessions WHERE conversation_id = ?", (conversation_id,)
+                )
+                found = found or cursor.rowcount > 0
+            return found
+
+    def evict_idle(self) -> int:
+        """
+        Spill sessions that have been inactive for longer than the idle TTL.
+        Without a database, idle sessions are kept.
+
+        Returns:
+            The number of sessions left in memory
+        """
+        with self._lock:
+            self._evict(self.clock())
+            return len(self._sessions)
+
+    def all_states(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the state of every known conversation, in memory or spilled.
+
+        Returns:
+            States keyed by conversation ID
+        """
+        with self._lock:
+            states = {}
+            if self._db is not None:
+                for conversation_id, state in self._db.execute(
+                    "SELECT conversation_id, state FROM viewpoint_sessions"
+                ):
+                    states[conversation_id] = json.loads(state)
+            for conversation_id, entry in self._sessions.items():
+                states[conversation_id] = dict(entry[0])
+            return states
+
+    def flush(self) -> None:
+        """Write every changed in-memory session to the database."""
+        with self._lock:
+            self._spill(list(self._sessions.items()))
+
+    def close(self) -> None:
+        """Flush the store and close the database."""
+        self.flush()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __enter__(self) -> "ViewpointSessionStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,344 @@
+# ViewpointExplorer Stance Classifier
+
+"""
+This file contains a local stance classifier that gives the ViewpointExplorer
+agent a first-pass read of which side of a topic a user leans toward, without
+calling a model. Text is turned into hashed word and word-pair features and
+scored with a multinomial naive Bayes model in NumPy. Only replies the model is
+unsure about need LLM analysis.
+
+Naive Bayes treats every word and word pair as independent evidence, so its raw
+probabilities are far too confident; they are tempered before use, and features
+never seen in training are ignored so off-topic replies fall back to the prior.
+A model is only trusted to skip LLM analysis once every stance has at least
+MIN_DOCS_PER_LABEL training examples, which the built-in seed examples do not.
+
+Models are trained from logged conversations, one JSON object per line with
+"topic", "text" and "stance" keys:
+
+    python stance_classifier.py train conversations.jsonl stance_models.npz
+"""
+
+from typing import Dict, Any, List, Iterable, Tuple, NamedTuple
+from functools import lru_cache
+import argparse
+import json
+import re
+import zlib
+
+import numpy as np
+
+WORD_PATTERN = re.compile(r"[a-z0-9']+")
+NEGATIONS = {"not", "no", "never", "nobody", "nothing", "don't", "doesn't", "isn't", "shouldn't",
+             "can't", "won't", "wouldn't", "aren't", "cannot"}
+# Number of words after a negation that are marked as negated
+NEGATION_SCOPE = 2
+# Function words carry no stance and only add noise to short replies
+STOP_WORDS = {"a", "an", "the", "is", "are", "was", "were", "be", "been", "it", "it's", "its", "this",
+              "that", "to", "of", "in", "on", "at", "for", "and", "or", "so", "as", "by", "with", "from",
+              "i", "i'm", "me", "my", "you", "your", "we", "our", "us", "they", "their", "them", "what",
+              "do", "does", "did", "if", "then", "than", "there", "just", "really", "about"}
+
+# Divisor of the summed feature log-likelihoods
+DEFAULT_TEMPERATURE = 3.0
+# Training examples every stance needs before predictions skip LLM analysis
+MIN_DOCS_PER_LABEL = 30
+
+# Small labelled set so the built-in topics work before any logs are collected
+SEED_EXAMPLES = {
+    "digital inclusion": [
+        ("The government should guarantee internet access for everyone as a basic right.", "public_provision"),
+        ("Public funding is needed to close the digital divide in rural areas.", "public_provision"),
+        ("Schools and libraries must provide devices and digital skills training for free.", "public_provision"),
+        ("Leaving broadband to the market means poorer communities are left behind.", "public_provision"),
+        ("Access to technology is essential for equal opportunity, so the state has to act.", "public_provision"),
+        ("Regulation should require providers to serve underserved areas.", "public_provision"),
+        ("Private companies and competition will bring down prices and expand access faster.", "market_led"),
+        ("It is not the government's job to pay for people's internet.", "market_led"),
+        ("Individuals are responsible for learning digital skills themselves.", "market_led"),
+        ("Subsidies waste taxpayer money; innovation from business closes the gap.", "market_led"),
+        ("Market incentives and cheaper devices will solve the problem without mandates.", "market_led"),
+        ("Too much regulation slows investment in new networks.", "market_led"),
+    ],
+    "survival situation": [
+        ("Resources should be shared equally so everyone has the same chance to survive.", "egalitarian"),
+        ("The most vulnerable, like children and the sick, should get resources first.", "egalitarian"),
+        ("Fairness matters most; nobody deserves more just because they are stronger.", "egalitarian"),
+        ("We should decide together and make sure every voice counts in the allocation.", "egalitarian"),
+        ("Everyone should get an equal ration regardless of their skills.", "egalitarian"),
+        ("Resources should go to those with the skills to keep the group alive.", "utilitarian"),
+        ("We have to maximize the number of people who survive, even if it is not equal.", "utilitarian"),
+        ("The people who contribute the most work should receive larger rations.", "utilitarian"),
+        ("Efficiency matters more than equality when supplies are scarce.", "utilitarian"),
+        ("Prioritize the doctor and the strongest workers so the group can last longer.", "utilitarian"),
+        ("Equal shares would waste food on people who cannot help us survive.", "utilitarian"),
+    ],
+}
+
+
+@lru_cache(maxsize=65536)
+def _bucket(feature: str, dim: int) -> int:
+    """Hash a feature to a bucket, stable across processes."""
+    return zlib.crc32(feature.encode("utf-8")) % dim
+
+
+def extract_features(text: str) -> List[str]:
+    """
+    Turn text into word and word-pair features, marking negated words.
+
+    Stop words are dropped before negation is scoped, so in "not the
+    government's job" the negation reaches "government's" and "job".
+
+    Args:
+        text: The text to featurize
+
+    Returns:
+        The features, with repeats
+    """
+    words = []
+    negated = 0
+    for word in WORD_PATTERN.findall(text.lower()):
+        if word in STOP_WORDS:
+            continue
+        if word in NEGATIONS:
+            # Carried by the not_ features of the words it negates
+            negated = NEGATION_SCOPE
+        elif negated:
+            negated -= 1
+            words.append("not_" + word)
+        else:
+            words.append(word)
+    return words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+
+
+class Stance(NamedTuple):
+    """The predicted stance of one text."""
+    stance: str
+    confidence: float
+
+
+class StanceClassifier:
+    """Multinomial naive Bayes over hashed features."""
+
+    def __init__(self, labels: Iterable[str] = (), dim: int = 2 ** 15, alpha: float = 0.5,
+                 temperature: float = DEFAULT_TEMPERATURE):
+        """
+        Initialize an untrained classifier.
+
+        Args:
+            labels: The stances to predict; more are added as they appear in training data
+            dim: Number of feature buckets
+            alpha: Additive smoothing of the feature counts
+            temperature: Divisor of the summed feature log-likelihoods; above 1
+                it tempers the overconfidence of naive Bayes
+        """
+        self.labels: List[str] = list(labels)
+        self.dim = dim
+        self.alpha = alpha
+        self.temperature = temperature
+        self._counts = np.zeros((len(self.labels), dim), dtype=np.float64)
+        self._doc_counts = np.zeros(len(self.labels), dtype=np.float64)
+        self._log_probs = None
+        self._log_priors = None
+        self._seen = None
+
+    def _encode(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Map texts to (row, bucket) pairs of every feature occurrence."""
+        rows, buckets = [], []
+        for row, text in enumerate(texts):
+            features = extract_features(text)
+            rows.extend([row] * len(features))
+            buckets.extend(_bucket(feature, self.dim) for feature in features)
+        return np.asarray(rows, dtype=np.intp), np.asarray(buckets, dtype=np.intp)
+
+    def partial_fit(self, texts: List[str], labels: List[str]) -> "StanceClassifier":
+        """
+        Add labelled examples to the model.
+
+        Args:
+            texts: The example texts
+            labels: The stance of each text
+
+        Returns:
+            The classifier, for chaining
+        """
+        for label in labels:
+            if label not in self.labels:
+                self.labels.append(label)
+                self._counts = np.vstack([self._counts, np.zeros((1, self.dim))])
+                self._doc_counts = np.append(self._doc_counts, 0.0)
+
+        index = {label: i for i, label in enumerate(self.labels)}
+        label_ids = np.asarray([index[label] for label in labels], dtype=np.intp)
+        rows, buckets = self._encode(texts)
+        np.add.at(self._counts, (label_ids[rows], buckets), 1.0)
+        np.add.at(self._doc_counts, label_ids, 1.0)
+        self._log_probs = None
+        return self
+
+    def label_doc_counts(self) -> Dict[str, int]:
+        """The number of training examples of each stance."""
+        return {label: int(count) for label, count in zip(self.labels, self._doc_counts)}
+
+    def is_trained(self, min_docs_per_label: int = MIN_DOCS_PER_LABEL) -> bool:
+        """
+        Check whether every stance has enough training examples to be trusted.
+
+        Args:
+            min_docs_per_label: Training examples needed for each stance
+
+        Returns:
+            True if the model has at least two stances and each has enough examples
+        """
+        return len(self.labels) > 1 and bool(self._doc_counts.min() >= min_docs_per_label)
+
+    def _compile(self) -> None:
+        smoothed = self._counts + self.alpha
+        self._log_probs = (np.log(smoothed) - np.log(smoothed.sum(axis=1, keepdims=True))).astype(np.float32)
+        self._log_priors = np.log(self._doc_counts / self._doc_counts.sum())
+        self._seen = self._counts.sum(axis=0) > 0
+
+    def predict_proba_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        Compute the probability of every stance for many texts in one vectorized pass.
+
+        Args:
+            texts: The texts to classify
+
+        Returns:
+            A matrix with one row per text and one column per label in self.labels
+        """
+        if not self.labels or not self._doc_counts.sum():
+            raise ValueError("The stance classifier has not been trained")
+        if self._log_probs is None:
+            self._compile()
+
+        rows, buckets = self._encode(texts)
+        # Features never seen in training carry no evidence, only smoothing
+        known = self._seen[buckets]
+        rows, buckets = rows[known], buckets[known]
+        count = len(texts)
+        # Per-class sums of the log-probabilities of each text's features
+        contributions = self._log_probs[:, buckets]
+        scores = np.stack([
+            np.bincount(rows, weights=contributions[label], minlength=count)
+            for label in range(len(self.labels))
+        ], axis=1) / self.temperature + self._log_priors
+
+        scores -= scores.max(axis=1, keepdims=True)
+        probabilities = np.exp(scores)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        return probabilities
+
+    def predict_batch(self, texts: List[str]) -> List[Stance]:
+        """
+        Predict the stance of many texts in one vectorized pass.
+
+        Args:
+            texts: The texts to classify
+
+        Returns:
+            One stance per text, with the probability of that stance as its confidence
+        """
+        probabilities = self.predict_proba_batch(texts)
+        best = probabilities.argmax(axis=1)
+        return [
+            Stance(self.labels[label], float(probabilities[row, label]))
+            for row, label in enumerate(best)
+        ]
+
+    def predict(self, text: str) -> Stance:
+        """Predict the stance of one text."""
+        return self.predict_batch([text])[0]
+
+    def to_arrays(self, prefix: str) -> Dict[str, np.ndarray]:
+        """The arrays that describe the model, for saving with save_models."""
+        return {
+            f"{prefix}labels": np.asarray(self.labels),
+            f"{prefix}counts": self._counts,
+            f"{prefix}doc_counts": self._doc_counts,
+            f"{prefix}params": np.asarray([self.dim, self.alpha, self.temperature])
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays: Any, prefix: str) -> "StanceClassifier":
+        """Rebuild a model saved with to_arrays."""
+        # Models saved before tempering have no temperature
+        dim, alpha, *rest = arrays[f"{prefix}params"]
+        temperature = float(rest[0]) if rest else DEFAULT_TEMPERATURE
+        classifier = cls([str(label) for label in arrays[f"{prefix}labels"]], int(dim), float(alpha), temperature)
+        classifier._counts = np.array(arrays[f"{prefix}counts"], dtype=np.float64)
+        classifier._doc_counts = np.array(arrays[f"{prefix}doc_counts"], dtype=np.float64)
+        return classifier
+
+
+def train_models(records: Iterable[Dict[str, Any]], models: Dict[str, StanceClassifier] = None) -> Dict[str, StanceClassifier]:
+    """
+    Train one classifier per topic.
+
+    Args:
+        records: Dicts with "topic", "text" and "stance" keys
+        models: Existing models to continue training
+
+    Returns:
+        The classifiers keyed by lowercase topic
+    """
+    models = dict(models or {})
+    grouped: Dict[str, Tuple[List[str], List[str]]] = {}
+    for record in records:
+        texts, labels = grouped.setdefault(record["topic"].lower(), ([], []))
+        texts.append(record["text"])
+        labels.append(record["stance"])
+    for topic, (texts, labels) in grouped.items():
+        models.setdefault(topic, StanceClassifier()).partial_fit(texts, labels)
+    return models
+
+
+def seed_models() -> Dict[str, StanceClassifier]:
+    """Train the classifiers for the built-in topics from SEED_EXAMPLES."""
+    return train_models(
+        {"topic": topic, "text": text, "stance": stance}
+        for topic, examples in SEED_EXAMPLES.items() for text, stance in examples
+    )
+
+
+def save_models(models: Dict[str, StanceClassifier], path: str) -> None:
+    """Save per-topic classifiers to one .npz file."""
+    arrays = {"topics": np.asarray(list(models))}
+    for i, model in enumerate(models.values()):
+        arrays.update(model.to_arrays(f"{i}_"))
+    np.savez_compressed(path, **arrays)
+
+
+def load_models(path: str) -> Dict[str, StanceClassifier]:
+    """Load per-topic classifiers saved with save_models."""
+    with np.load(path) as arrays:
+        return {
+            str(topic): StanceClassifier.from_arrays(arrays, f"{i}_")
+            for i, topic in enumerate(arrays["topics"])
+        }
+
+
+def main():
+    """Train stance models from logged conversations."""
+    parser = argparse.ArgumentParser(description="Train the ViewpointExplorer stance classifier.")
+    subparsers = parser.add_subparsers(dest="command")
+    train_parser = subparsers.add_parser("train", help="Train models from a JSON lines log")
+    train_parser.add_argument("log", help="Log with topic, text and stance on each line")
+    train_parser.add_argument("output", help="Where to write the .npz models")
+    train_parser.add_argument("--no-seed", action="store_true", help="Do not include the built-in examples")
+    args = parser.parse_args()
+
+    if args.command != "train":
+        parser.print_help()
+        return
+
+    with open(args.log, "r") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    models = train_models(records, None if args.no_seed else seed_models())
+    save_models(models, args.output)
+    print(f"Trained {len(models)} topic models from {len(records)} examples into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
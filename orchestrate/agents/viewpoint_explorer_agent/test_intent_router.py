@@ -0,0 +1,94 @@
+# ViewpointExplorer Intent Router Tests
+
+"""
+Tests that exploration choices are routed to the right agent whether they
+name an option, use a synonym, a number or an ordinal, or misspell a word,
+and that rejected options are not routed to.
+
+Run with: python -m pytest test_intent_router.py
+"""
+
+import pytest
+
+from intent_router import IntentRouter
+
+OPTIONS = [
+    ("whiteboard session", "whiteboard_agent"),
+    ("town hall forum", "forum_agent"),
+    ("debate", "debate_agent"),
+    ("podcast", "podcast_agent"),
+]
+
+
+@pytest.fixture(scope="module")
+def router():
+    return IntentRouter.from_config(OPTIONS)
+
+
+@pytest.mark.parametrize("text, agent", [
+    ("debate", "debate_agent"),
+    ("Let's do the town hall forum.", "forum_agent"),
+    ("let them argue it out", "debate_agent"),
+    ("I'd like to map out my thoughts", "whiteboard_agent"),
+])
+def test_names_and_synonyms(router, text, agent):
+    assert router.route(text).agent == agent
+
+
+@pytest.mark.parametrize("text, agent", [
+    ("I'd rather see a debate", "debate_agent"),
+    ("I would rather watch them debate it", "debate_agent"),
+    ("A podcast instead", "podcast_agent"),
+    ("I'd rather watch a debate than listen to a podcast", "debate_agent"),
+    ("a podcast instead of a debate", "podcast_agent"),
+])
+def test_preferences_are_not_negations(router, text, agent):
+    assert router.route(text).agent == agent
+
+
+@pytest.mark.parametrize("text, agent", [
+    ("option 2", "forum_agent"),
+    ("Option number three please", "debate_agent"),
+    ("the first one", "whiteboard_agent"),
+    ("fourth option", "podcast_agent"),
+    ("2", "forum_agent"),
+    ("Second!", "forum_agent"),
+])
+def test_numbers_and_ordinals(router, text, agent):
+    assert router.route(text).agent == agent
+
+
+@pytest.mark.parametrize("text", ["no one", "I have two questions first", "give me a second"])
+def test_bare_numbers_only_count_as_the_whole_reply(router, text):
+    assert router.route(text).agent is None
+
+
+@pytest.mark.parametrize("text, agent", [
+    ("dbate please", "debate_agent"),
+    ("whitebord session", "whiteboard_agent"),
+    ("a podcst", "podcast_agent"),
+])
+def test_misspellings_are_corrected_with_lower_confidence(router, text, agent):
+    route = router.route(text)
+    assert route.agent == agent
+    assert route.confidence < 1.0
+
+
+def test_short_words_are_not_corrected(router):
+    assert router.route("fill in the form").agent is None
+
+
+@pytest.mark.parametrize("text, agent", [
+    ("I don't want a debate", None),
+    ("not the podcast", None),
+    ("I dont want a podcast, give me a debate", "debate_agent"),
+    ("no whiteboard but a forum would be nice", "forum_agent"),
+    ("never a debate, let's do a podcast", "podcast_agent"),
+])
+def test_negated_options_are_dropped(router, text, agent):
+    assert router.route(text).agent == agent
+
+
+def test_route_batch_matches_route(router):
+    texts = ["option 2", "I'd rather see a debate", "no one", "a podcst"]
+    assert router.route_batch(texts) == [router.route(text) for text in texts]
@@ -0,0 +1,101 @@
+# ViewpointExplorer Session Store Tests
+
+"""
+Tests that sessions evicted for capacity or idleness are spilled to SQLite and
+restored when the user returns, that reading an unknown conversation does not
+evict live ones, and that without a database idle sessions are kept and
+sessions beyond capacity are discarded with a warning.
+
+Run with: python -m pytest test_session_store.py
+"""
+
+import logging
+
+import pytest
+
+from session_store import ViewpointSessionStore
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def database(tmp_path):
+    return str(tmp_path / "sessions.db")
+
+
+def test_sessions_beyond_capacity_are_spilled_and_restored(database, clock):
+    with ViewpointSessionStore(database, max_sessions=2, clock=clock) as store:
+        for i in range(3):
+            store.update(f"user-{i}", {"topic": f"Topic {i}"})
+        assert len(store) == 2
+        assert "user-0" not in store
+        assert store.stats["spills"] == 1
+
+        assert store.get("user-0") == {"topic": "Topic 0"}
+        assert store.stats["restores"] == 1
+        assert "user-0" in store and len(store) == 2
+
+
+def test_idle_sessions_are_spilled(database, clock):
+    with ViewpointSessionStore(database, idle_ttl=60.0, clock=clock) as store:
+        store.update("idle", {"topic": "Digital Inclusion"})
+        clock.now += 30.0
+        store.update("active", {"topic": "Climate Change"})
+        clock.now += 45.0
+        assert store.evict_idle() == 1
+        assert "idle" not in store
+        assert store.all_states() == {
+            "idle": {"topic": "Digital Inclusion"},
+            "active": {"topic": "Climate Change"},
+        }
+
+
+def test_state_survives_reopening_the_database(database, clock):
+    with ViewpointSessionStore(database, clock=clock) as store:
+        store.update("user-1", {"initial_response": "Markets work."})
+    with ViewpointSessionStore(database, clock=clock) as store:
+        assert store.get("user-1") == {"initial_response": "Markets work."}
+        assert store.remove("user-1")
+        assert store.get("user-1") == {}
+
+
+def test_reading_an_unknown_conversation_does_not_evict(database, clock):
+    with ViewpointSessionStore(database, max_sessions=2, clock=clock) as store:
+        store.update("user-1", {"topic": "A"})
+        store.update("user-2", {"topic": "B"})
+        for i in range(10):
+            assert store.get(f"stranger-{i}") == {}
+        assert len(store) == 2
+        assert "user-1" in store and "user-2" in store
+        assert store.stats["misses"] == 12
+        assert store.stats["spills"] == 0
+
+
+def test_without_a_database_idle_sessions_are_kept(clock):
+    store = ViewpointSessionStore(idle_ttl=60.0, clock=clock)
+    store.update("user-1", {"topic": "Digital Inclusion"})
+    clock.now += 3600.0
+    assert store.evict_idle() == 1
+    assert store.get("user-1") == {"topic": "Digital Inclusion"}
+
+
+def test_without_a_database_discards_beyond_capacity_are_reported(clock, caplog):
+    store = ViewpointSessionStore(max_sessions=2, clock=clock)
+    with caplog.at_level(logging.WARNING, logger="session_store"):
+        for i in range(5):
+            store.update(f"user-{i}", {"topic": f"Topic {i}"})
+    assert len(store) == 2
+    assert store.stats["discards"] == 3
+    assert len([r for r in caplog.records if "no database" in r.getMessage()]) == 1
+    assert store.get("user-0") == {}
@@ -0,0 +1,124 @@
+# ViewpointExplorer Stance Classifier Tests
+
+"""
+Tests that the local stance classifier only skips LLM analysis when it has
+been trained on enough data, and that negated, off-topic and empty replies are
+not given confident stances.
+
+Run with: python -m pytest test_stance_classifier.py
+"""
+
+import numpy as np
+
+from stance_classifier import (
+    MIN_DOCS_PER_LABEL,
+    SEED_EXAMPLES,
+    StanceClassifier,
+    extract_features,
+    load_models,
+    save_models,
+    seed_models,
+)
+from viewpoint_explorer_agent import ViewpointExplorerAgent
+
+TOPIC = "digital inclusion"
+# Replies and their negations, with the stance of each
+NEGATED = [
+    ("It is the government's job to pay for internet", "public_provision"),
+    ("It is not the government's job to pay for internet", "market_led"),
+    ("The government should pay for it", "public_provision"),
+    ("The government should not pay for it", "market_led"),
+]
+OFF_TOPIC = ["I like pizza", "what time is it", "not sure really"]
+
+# Stands in for logged conversations, which include negated statements
+LOGGED_EXAMPLES = SEED_EXAMPLES[TOPIC] + [
+    ("The government should not pay for people's internet access.", "market_led"),
+    ("The government should pay for internet access in poor areas.", "public_provision"),
+    ("It is not fair to leave access to the market alone.", "public_provision"),
+    ("Providers should not be forced to serve remote areas.", "market_led"),
+]
+
+
+def trained_model(copies=MIN_DOCS_PER_LABEL):
+    """A model trained on enough examples of each stance to be trusted."""
+    texts, labels = zip(*LOGGED_EXAMPLES)
+    return StanceClassifier().partial_fit(list(texts) * copies, list(labels) * copies)
+
+
+def agent_with(models):
+    agent = ViewpointExplorerAgent({})
+    agent.stance_models = models
+    return agent
+
+
+def test_seed_models_are_not_trusted():
+    model = seed_models()[TOPIC]
+    assert not model.is_trained()
+    assert trained_model().is_trained()
+    assert not trained_model(copies=1).is_trained(min_docs_per_label=9)
+
+
+def test_seed_models_never_skip_llm_analysis():
+    agent = agent_with(seed_models())
+    for text in [text for text, _ in NEGATED] + OFF_TOPIC + ["", SEED_EXAMPLES[TOPIC][0][0]]:
+        assessment = agent.assess_viewpoint(text, TOPIC)
+        assert assessment["needs_llm_analysis"], text
+        assert "stance" not in assessment
+
+
+def test_empty_and_unknown_words_fall_back_to_the_prior():
+    model = trained_model()
+    for text in ["", "   ", "I like pizza", "what time is it"]:
+        probabilities = model.predict_proba_batch([text])[0]
+        np.testing.assert_allclose(probabilities, [0.5, 0.5])
+
+
+def test_off_topic_and_empty_replies_need_llm_analysis():
+    agent = agent_with({TOPIC: trained_model()})
+    for text in OFF_TOPIC + ["", "?"]:
+        assessment = agent.assess_viewpoint(text, TOPIC)
+        assert assessment["needs_llm_analysis"], text
+        assert "stance" not in assessment
+
+
+def test_negation_flips_the_stance():
+    model = trained_model()
+    for text, stance in NEGATED:
+        assert model.predict(text).stance == stance, text
+
+
+def test_trained_model_takes_the_fast_path_on_clear_replies():
+    agent = agent_with({TOPIC: trained_model()})
+    assessment = agent.assess_viewpoint("The government should guarantee internet access for everyone", TOPIC)
+    assert not assessment["needs_llm_analysis"]
+    assert assessment["stance"] == "public_provision"
+
+
+def test_confidence_is_tempered():
+    texts, labels = map(list, zip(*SEED_EXAMPLES[TOPIC]))
+    tempered = StanceClassifier().partial_fit(texts, labels)
+    raw = StanceClassifier(temperature=1.0).partial_fit(texts, labels)
+    for text, _ in NEGATED:
+        assert 0.5 < tempered.predict(text).confidence < raw.predict(text).confidence
+
+
+def test_negation_marks_the_following_words():
+    assert "not_pay" in extract_features("The government should not pay for it")
+    assert "not_pay" not in extract_features("The government should pay for it")
+    # Stop words do not use up the negation's scope
+    assert extract_features("It is not the government's job") == [
+        "not_government's", "not_job", "not_government's not_job"
+    ]
+
+
+def test_saved_models_keep_their_temperature(tmp_path):
+    path = str(tmp_path / "models.npz")
+    model = trained_model(copies=1)
+    model.temperature = 2.0
+    save_models({TOPIC: model}, path)
+    loaded = load_models(path)[TOPIC]
+    assert loaded.temperature == 2.0
+    assert loaded.label_doc_counts() == model.label_doc_counts()
+    texts = [text for text, _ in NEGATED]
+    np.testing.assert_allclose(loaded.predict_proba_batch(texts), model.predict_proba_batch(texts), rtol=1e-6)
@@ -0,0 +1,96 @@
+# ViewpointExplorer Drift Analytics Tests
+
+"""
+Tests that viewpoint drift is measured per session, and that reports
+aggregate it by topic and by exploration option, with stance transitions for
+topics that have a classifier and incomplete sessions left out.
+
+Run with: python -m pytest test_viewpoint_analytics.py
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from stance_classifier import SEED_EXAMPLES
+from viewpoint_analytics import DriftAnalyzer, drift_scores, embed_batch
+
+TOPIC = "digital inclusion"
+
+
+def example(stance):
+    return next(text for text, label in SEED_EXAMPLES[TOPIC] if label == stance)
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    return DriftAnalyzer()
+
+
+def test_embeddings_are_normalized():
+    vectors = embed_batch(["Public funding closes the gap", ""])
+    assert vectors.shape == (2, 512)
+    assert np.isclose(np.linalg.norm(vectors[0]), 1.0)
+    assert not vectors[1].any()
+
+
+def test_drift_is_zero_for_unchanged_views_and_nan_for_empty_ones():
+    drift = drift_scores(
+        ["Markets close the gap", "Markets close the gap", "Markets close the gap"],
+        ["Markets close the gap", "Public broadband for every rural household", ""]
+    )
+    assert drift[0] == pytest.approx(0.0, abs=1e-6)
+    assert drift[1] > 0.5
+    assert math.isnan(drift[2])
+
+
+def test_report_aggregates_by_topic_and_option(analyzer):
+    public, market = example("public_provision"), example("market_led")
+    sessions = [
+        {"topic": "Digital Inclusion", "initial_response": public, "evolved_viewpoint": public,
+         "exploration_option": "debate"},
+        {"topic": "Digital Inclusion", "initial_response": public, "evolved_viewpoint": market,
+         "exploration_option": "debate"},
+        {"topic": "Cooking", "initial_response": "Salt early", "evolved_viewpoint": "Salt late",
+         "exploration_option": "podcast"},
+        # Incomplete sessions are left out
+        {"topic": "Digital Inclusion", "initial_response": public},
+        {"topic": "Digital Inclusion", "evolved_viewpoint": market, "exploration_option": "podcast"},
+    ]
+    report = analyzer.report(sessions)
+
+    assert report["overall"]["sessions"] == 3
+    assert set(report["by_topic"]) == {"digital inclusion", "cooking"}
+    assert report["by_option"]["debate"]["sessions"] == 2
+    assert report["by_option"]["podcast"]["sessions"] == 1
+
+    inclusion = report["by_topic"][TOPIC]
+    assert inclusion["stance_changed"] == pytest.approx(0.5)
+    assert 0.0 < inclusion["mean_drift"] < 1.0
+    labels = inclusion["transitions"]["labels"]
+    matrix = np.asarray(inclusion["transitions"]["matrix"])
+    assert matrix.sum() == 2
+    assert matrix[labels.index("public_provision"), labels.index("public_provision")] == 1
+    assert matrix[labels.index("public_provision"), labels.index("market_led")] == 1
+
+    # Topics without a classifier get drift but no stance figures
+    cooking = report["by_topic"]["cooking"]
+    assert cooking["mean_drift"] > 0.0
+    assert cooking["stance_changed"] is None
+    assert "transitions" not in cooking
+
+
+def test_sessions_without_an_option_are_grouped_as_none(analyzer):
+    report = analyzer.report([
+        {"topic": TOPIC, "initial_response": "Markets work", "evolved_viewpoint": "Markets mostly work"}
+    ])
+    assert list(report["by_option"]) == ["none"]
+    assert report["overall"]["p50_drift"] == report["overall"]["p90_drift"]
+
+
+def test_empty_report(analyzer):
+    report = analyzer.report([])
+    assert report["overall"]["sessions"] == 0
+    assert report["overall"]["mean_drift"] is None
+    assert report["by_topic"] == {} and report["by_option"] == {}
@@ -0,0 +1,210 @@
+# ViewpointExplorer Drift Analytics
+
+"""
+This file contains the analytics that measure how users' viewpoints move
+between their initial response and their follow-up after exploring a topic.
+
+Original and evolved viewpoints are embedded locally with hashed features and
+compared in batched matrix operations, and the stance classifier's probabilities
+show which way each user moved. Reports aggregate the results by topic and by
+exploration option, so a whole cohort is analyzed in one pass:
+
+    python viewpoint_analytics.py sessions.db --output drift_report.json
+"""
+
+from typing import Dict, Any, List, Optional, Iterable
+import argparse
+import json
+import zlib
+
+import numpy as np
+
+from session_store import ViewpointSessionStore
+from stance_classifier import StanceClassifier, extract_features, load_models, seed_models
+
+EMBEDDING_DIM = 512
+
+
+def embed_batch(texts: List[str], dim: int = EMBEDDING_DIM) -> np.ndarray:
+    """
+    Embed texts as L2-normalized hashed feature vectors.
+
+    Args:
+        texts: The texts to embed
+        dim: Number of dimensions in each vector
+
+    Returns:
+        A float32 matrix with one row per text; empty texts get a zero row
+    """
+    rows, columns, signs = [], [], []
+    for row, text in enumerate(texts):
+        for feature in extract_features(text or ""):
+            value = zlib.crc32(feature.encode("utf-8"))
+            rows.append(row)
+            columns.append(value % dim)
+            signs.append(1.0 if value & 0x80000000 else -1.0)
+
+    vectors = np.zeros((len(texts), dim), dtype=np.float32)
+    np.add.at(vectors, (rows, columns), signs)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.divide(vectors, norms, out=vectors, where=norms > 0)
+    return vectors
+
+
+def drift_scores(originals: List[str], evolved: List[str], dim: int = EMBEDDING_DIM) -> np.ndarray:
+    """
+    Measure how far each evolved viewpoint is from the original one.
+
+    Args:
+        originals: The users' initial responses
+        evolved: The users' responses after exploration, in the same order
+
+    Returns:
+        Cosine distances between 0 (unchanged) and 1 (nothing in common); NaN
+        where either text is empty
+    """
+    before = embed_batch(originals, dim)
+    after = embed_batch(evolved, dim)
+    similarity = np.einsum("ij,ij->i", before, after)
+    empty = ~(before.any(axis=1) & after.any(axis=1))
+    drift = np.clip(1.0 - similarity, 0.0, 1.0)
+    drift[empty] = np.nan
+    return drift
+
+
+def _summarize(drift: np.ndarray, changed: np.ndarray, shift: np.ndarray, classified: np.ndarray) -> Dict[str, Any]:
+    valid = drift[~np.isnan(drift)]
+    return {
+        "sessions": int(len(drift)),
+        "mean_drift": float(valid.mean()) if len(valid) else None,
+        "p50_drift": float(np.percentile(valid, 50)) if len(valid) else None,
+        "p90_drift": float(np.percentile(valid, 90)) if len(valid) else None,
+        "stance_changed": float(changed[classified].mean()) if classified.any() else None,
+        "mean_stance_shift": float(shift[classified].mean()) if classified.any() else None
+    }
+
+
+class DriftAnalyzer:
+    """Batched drift and stance-shift analysis over many sessions."""
+
+    def __init__(self, stance_models: Optional[Dict[str, StanceClassifier]] = None, dim: int = EMBEDDING_DIM):
+        """
+        Initialize the analyzer.
+
+        Args:
+            stance_models: Stance classifiers keyed by lowercase topic; defaults to
+                the seed models for the built-in topics
+            dim: Number of embedding dimensions
+        """
+        self.stance_models = stance_models if stance_models is not None else seed_models()
+        self.dim = dim
+
+    def analyze_sessions(self, sessions: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """
+        Compute per-session drift and stance movement.
+
+        Args:
+            sessions: Session states with "topic", "initial_response" and
+                "evolved_viewpoint" keys
+
+        Returns:
+            Arrays with one entry per session: "drift", "stance_before" and
+            "stance_after" (labels, None without a model for the topic) and
+            "stance_shift", the total variation distance between the stance
+            probabilities before and after (NaN without a model)
+        """
+        count = len(sessions)
+        originals = [s.get("initial_response") or "" for s in sessions]
+        evolved = [s.get("evolved_viewpoint") or "" for s in sessions]
+        topics = np.asarray([(s.get("topic") or "").lower() for s in sessions], dtype=object)
+
+        results = {
+            "drift": drift_scores(originals, evolved, self.dim),
+            "stance_before": np.full(count, None, dtype=object),
+            "stance_after": np.full(count, None, dtype=object),
+            "stance_shift": np.full(count, np.nan)
+        }
+
+        # One batched classifier pass per topic
+        for topic in set(topics):
+            model = self.stance_models.get(topic)
+            if model is None:
+                continue
+            index = np.flatnonzero(topics == topic)
+            before = model.predict_proba_batch([originals[i] for i in index])
+            after = model.predict_proba_batch([evolved[i] for i in index])
+            labels = np.asarray(model.labels, dtype=object)
+            results["stance_before"][index] = labels[before.argmax(axis=1)]
+            results["stance_after"][index] = labels[after.argmax(axis=1)]
+            results["stance_shift"][index] = 0.5 * np.abs(after - before).sum(axis=1)
+        return results
+
+    def report(self, sessions: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Aggregate drift and stance movement by topic and by exploration option.
+
+        Sessions without both an initial and an evolved viewpoint are skipped.
+
+        Args:
+            sessions: Session states as kept by ViewpointSessionStore
+
+        Returns:
+            Overall, per-topic and per-option summaries; per-topic summaries also
+            include the matrix of stance transitions (rows before, columns after)
+        """
+        sessions = [s for s in sessions if s.get("initial_response") and s.get("evolved_viewpoint")]
+        results = self.analyze_sessions(sessions)
+        drift, shift = results["drift"], results["stance_shift"]
+        classified = ~np.isnan(shift)
+        changed = classified & (results["stance_before"] != results["stance_after"])
+
+        topics = np.asarray([(s.get("topic") or "").lower() for s in sessions], dtype=object)
+        options = np.asarray([s.get("exploration_option") or "none" for s in sessions], dtype=object)
+
+        report = {
+            "overall": _summarize(drift, changed, shift, classified),
+            "by_topic": {},
+            "by_option": {}
+        }
+        for topic in sorted(set(topics)):
+            mask = topics == topic
+            summary = _summarize(drift[mask], changed[mask], shift[mask], classified[mask])
+            model = self.stance_models.get(topic)
+            if model is not None:
+                position = {label: i for i, label in enumerate(model.labels)}
+                matrix = np.zeros((len(model.labels), len(model.labels)), dtype=np.int64)
+                np.add.at(matrix, (
+                    [position[label] for label in results["stance_before"][mask]],
+                    [position[label] for label in results["stance_after"][mask]]
+                ), 1)
+                summary["transitions"] = {"labels": list(model.labels), "matrix": matrix.tolist()}
+            report["by_topic"][topic] = summary
+        for option in sorted(set(options)):
+            mask = options == option
+            report["by_option"][option] = _summarize(drift[mask], changed[mask], shift[mask], classified[mask])
+        return report
+
+
+def main():
+    """Write a drift report for the sessions in a ViewpointSessionStore database."""
+    parser = argparse.ArgumentParser(description="Report viewpoint drift across sessions.")
+    parser.add_argument("database", help="SQLite database of a ViewpointSessionStore")
+    parser.add_argument("--models", help="Stance models saved by stance_classifier.py")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    analyzer = DriftAnalyzer(load_models(args.models) if args.models else None)
+    with ViewpointSessionStore(args.database) as store:
+        report = analyzer.report(store.all_states().values())
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+        print(f"Report on {report['overall']['sessions']} sessions written to {args.output}")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
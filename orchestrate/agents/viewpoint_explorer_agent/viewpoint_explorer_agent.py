@@ -11,6 +11,16 @@ from typing import Dict, Any, List, Optional
 import os
 import logging
 
+import numpy as np
+
+from intent_router import IntentRouter, Route
+from session_store import ViewpointSessionStore
+from stance_classifier import MIN_DOCS_PER_LABEL, Stance, load_models, seed_models
+from viewpoint_analytics import DriftAnalyzer
+
+# Conversation used when callers do not pass a conversation ID
+DEFAULT_CONVERSATION = "default"
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -35,10 +45,36 @@ class ViewpointExplorerAgent:
             "debate", 
             "podcast"
         ]
+        self.agent_mapping = {
+            "whiteboard session": "whiteboard_agent",
+            "town hall forum": "forum_agent",
+            "debate": "debate_agent",
+            "podcast": "podcast_agent"
+        }
+        self.option_by_agent = {agent: option for option, agent in self.agent_mapping.items()}
+        routing = config.get("routing", {})
+        self.router = IntentRouter.from_config(self.agent_mapping.items(), routing)
+        self.min_route_confidence = routing.get("min_confidence", 0.6)
+        store_config = config.get("session_store", {})
+        self.sessions = ViewpointSessionStore(
+            path=store_config.get("path"),
+            max_sessions=store_config.get("max_sessions", 10000),
+            idle_ttl=store_config.get("idle_ttl", 1800.0)
+        )
+        stance_config = config.get("stance_classifier", {})
+        model_path = stance_config.get("model_path")
+        self.stance_models = load_models(model_path) if model_path else seed_models()
+        self.stance_threshold = stance_config.get("confidence_threshold", 0.75)
+        self.stance_min_docs = stance_config.get("min_docs_per_label", MIN_DOCS_PER_LABEL)
+        self.drift_analyzer = DriftAnalyzer(self.stance_models)
         self.config = config
-        self.user_viewpoint = {}
         logger.info("ViewpointExplorer agent initialized")
     
+    @property
+    def user_viewpoint(self) -> Dict[str, Any]:
+        """The viewpoint state of the default conversation."""
+        return self.sessions.get(DEFAULT_CONVERSATION)
+    
     def introduce_topic(self, topic: str) -> str:
         """
         Generate an introduction for the specified topic.
@@ -65,24 +101,74 @@ class ViewpointExplorerAgent:
         
         return introductions.get(topic.lower(), "Let's explore this topic together. What are your initial thoughts?")
     
-    def assess_viewpoint(self, user_input: str, topic: str) -> Dict[str, Any]:
+    def assess_viewpoint(self, user_input: str, topic: str,
+                         conversation_id: str = DEFAULT_CONVERSATION) -> Dict[str, Any]:
         """
         Analyze user input to assess their viewpoint on a topic.
         
         Args:
             user_input: The user's response
             topic: The topic being discussed
+            conversation_id: The conversation the response belongs to
             
         Returns:
             An assessment of the user's viewpoint
         """
-        # This would typically involve LLM analysis
-        # For now, we'll use a placeholder implementation
-        return {
+        assessment = {
             "topic": topic,
             "initial_response": user_input,
             "followup_questions": self._generate_followup_questions(topic)
         }
+        
+        stance = self.classify_stances([user_input], topic)[0] if self.stance_fast_path(topic) else None
+        if stance is not None and stance.confidence >= self.stance_threshold:
+            assessment["stance"] = stance.stance
+            assessment["stance_confidence"] = stance.confidence
+            assessment["needs_llm_analysis"] = False
+        else:
+            # This would typically involve LLM analysis
+            # For now, we'll flag the assessment for it
+            assessment["needs_llm_analysis"] = True
+        
+        self.sessions.update(conversation_id, {
+            "topic": topic,
+            "initial_response": user_input,
+            "stance": assessment.get("stance")
+        })
+        return assessment
+    
+    def stance_fast_path(self, topic: str) -> bool:
+        """
+        Check whether the local stance model of a topic may stand in for LLM analysis.
+        
+        Only models trained on at least min_docs_per_label examples of every
+        stance qualify, so the built-in seed models never skip LLM analysis.
+        
+        Args:
+            topic: The topic being discussed
+            
+        Returns:
+            True if confident predictions of the topic's model can be used as is
+        """
+        model = self.stance_models.get(topic.lower())
+        return model is not None and model.is_trained(self.stance_min_docs)
+    
+    def classify_stances(self, user_inputs: List[str], topic: str) -> List[Optional[Stance]]:
+        """
+        Classify the stance of many user responses on a topic at once.
+        
+        Args:
+            user_inputs: The users' responses
+            topic: The topic being discussed
+            
+        Returns:
+            One stance with its confidence per response; None for each response
+            if there is no stance model for the topic
+        """
+        model = self.stance_models.get(topic.lower())
+        if model is None:
+            return [None] * len(user_inputs)
+        return model.predict_batch(user_inputs)
     
     def _generate_followup_questions(self, topic: str) -> List[str]:
         """
@@ -124,48 +210,73 @@ class ViewpointExplorerAgent:
             "4. Podcast: Listen to an audio discussion of the topic"
         )
     
-    def handoff_to_agent(self, choice: str) -> Dict[str, Any]:
+    def handoff_to_agent(self, choice: str, conversation_id: str = DEFAULT_CONVERSATION) -> Dict[str, Any]:
         """
         Prepare a handoff to another specialized agent.
         
         Args:
             choice: The user's chosen exploration option
+            conversation_id: The conversation being handed off
             
         Returns:
             Information needed for the handoff
         """
-        agent_mapping = {
-            "whiteboard session": "whiteboard_agent",
-            "town hall forum": "forum_agent",
-            "debate": "debate_agent",
-            "podcast": "podcast_agent"
-        }
-        
-        choice_lower = choice.lower()
-        agent = next((agent_mapping[opt] for opt in agent_mapping if opt in choice_lower), None)
+        route = self.router.route(choice)
         
-        if not agent:
-            return {"error": "Invalid option selected"}
+        if not route.agent or route.confidence < self.min_route_confidence:
+            return {"error": "Invalid option selected", "confidence": route.confidence}
         
         return {
-            "target_agent": agent,
-            "context": self.user_viewpoint
+            "target_agent": route.agent,
+            "confidence": route.confidence,
+            "context": self.sessions.update(
+                conversation_id, {"exploration_option": self.option_by_agent.get(route.agent, route.agent)}
+            )
         }
     
-    def follow_up_assessment(self, user_feedback: str) -> Dict[str, Any]:
+    def route_choices(self, choices: List[str]) -> List[Route]:
+        """
+        Route many exploration choices at once, e.g. when replaying logs.
+        
+        Args:
+            choices: The users' chosen exploration options
+            
+        Returns:
+            One route per choice, with the target agent and confidence
+        """
+        return self.router.route_batch(choices)
+    
+    def follow_up_assessment(self, user_feedback: str,
+                             conversation_id: str = DEFAULT_CONVERSATION) -> Dict[str, Any]:
         """
         Assess how the user's viewpoint has evolved after exploration.
         
         Args:
             user_feedback: User's response after exploration
+            conversation_id: The conversation the feedback belongs to
             
         Returns:
             An assessment of viewpoint evolution
         """
+        state = self.sessions.update(conversation_id, {"evolved_viewpoint": user_feedback})
+        drift = self.drift_analyzer.analyze_sessions([state])
+        
         # This would typically involve LLM analysis
-        # For now, we'll use a placeholder implementation
+        # For now, we'll report the local drift measures
         return {
-            "original_viewpoint": self.user_viewpoint.get("initial_response", ""),
+            "original_viewpoint": state.get("initial_response", ""),
             "evolved_viewpoint": user_feedback,
+            "drift": None if np.isnan(drift["drift"][0]) else float(drift["drift"][0]),
+            "stance_before": drift["stance_before"][0],
+            "stance_after": drift["stance_after"][0],
             "analysis": "Placeholder for evolution analysis"
         }
+    
+    def drift_report(self) -> Dict[str, Any]:
+        """
+        Report viewpoint drift across every conversation in the session store.
+        
+        Returns:
+            Drift and stance movement aggregated by topic and by exploration option
+        """
+        return self.drift_analyzer.report(self.sessions.all_states().values())